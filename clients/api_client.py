@@ -1,9 +1,12 @@
 from typing import Any
 
 import allure
-from httpx import URL, Client, QueryParams, Response
+from httpx import URL, AsyncClient, Client, QueryParams
 from httpx._types import RequestData, RequestFiles
 
+from clients.api_response import APIResponse
+from tools.allure.steps import async_step
+
 
 class APIClient:
     def __init__(self, client: Client):
@@ -15,15 +18,15 @@ class APIClient:
         self.client = client
 
     @allure.step("Make GET request to {url}")
-    def get(self, url: URL | str, params: QueryParams | None = None) -> Response:
+    def get(self, url: URL | str, params: QueryParams | None = None) -> APIResponse:
         """
         Performs a GET request.
 
         :param url: Endpoint URL.
         :param params: GET request parameters (e.g., ?key=value).
-        :return: Response object with response data.
+        :return: APIResponse object with response data.
         """
-        return self.client.get(url, params=params)
+        return APIResponse(self.client.get(url, params=params))
 
     @allure.step("Make POST request to {url}")
     def post(
@@ -32,7 +35,7 @@ class APIClient:
         json: Any | None = None,
         data: RequestData | None = None,
         files: RequestFiles | None = None,
-    ) -> Response:
+    ) -> APIResponse:
         """
         Performs a POST request.
 
@@ -40,27 +43,91 @@ class APIClient:
         :param json: Data in JSON format.
         :param data: Formatted form data (e.g., application/x-www-form-urlencoded).
         :param files: Files to upload to the server.
-        :return: Response object with response data.
+        :return: APIResponse object with response data.
         """
-        return self.client.post(url, json=json, data=data, files=files)
+        return APIResponse(self.client.post(url, json=json, data=data, files=files))
 
     @allure.step("Make PATCH request to {url}")
-    def patch(self, url: URL | str, json: Any | None = None) -> Response:
+    def patch(self, url: URL | str, json: Any | None = None) -> APIResponse:
         """
         Performs a PATCH request (partial data update).
 
         :param url: Endpoint URL.
         :param json: Data to update in JSON format.
-        :return: Response object with response data.
+        :return: APIResponse object with response data.
         """
-        return self.client.patch(url, json=json)
+        return APIResponse(self.client.patch(url, json=json))
 
     @allure.step("Make DELETE request to {url}")
-    def delete(self, url: URL | str) -> Response:
+    def delete(self, url: URL | str) -> APIResponse:
+        """
+        Performs a DELETE request (data deletion).
+
+        :param url: Endpoint URL.
+        :return: APIResponse object with response data.
+        """
+        return APIResponse(self.client.delete(url))
+
+
+class AsyncAPIClient:
+    def __init__(self, client: AsyncClient):
+        """
+        Base API client that accepts an httpx.AsyncClient object.
+
+        Mirrors APIClient, but every method is a coroutine, so independent requests
+        can be sent concurrently (e.g., with asyncio.gather).
+
+        :param client: an instance of httpx.AsyncClient for making HTTP requests
+        """
+        self.client = client
+
+    @async_step("Make GET request to {url}")
+    async def get(self, url: URL | str, params: QueryParams | None = None) -> APIResponse:
+        """
+        Performs a GET request.
+
+        :param url: Endpoint URL.
+        :param params: GET request parameters (e.g., ?key=value).
+        :return: APIResponse object with response data.
+        """
+        return APIResponse(await self.client.get(url, params=params))
+
+    @async_step("Make POST request to {url}")
+    async def post(
+        self,
+        url: URL | str,
+        json: Any | None = None,
+        data: RequestData | None = None,
+        files: RequestFiles | None = None,
+    ) -> APIResponse:
+        """
+        Performs a POST request.
+
+        :param url: Endpoint URL.
+        :param json: Data in JSON format.
+        :param data: Formatted form data (e.g., application/x-www-form-urlencoded).
+        :param files: Files to upload to the server.
+        :return: APIResponse object with response data.
+        """
+        return APIResponse(await self.client.post(url, json=json, data=data, files=files))
+
+    @async_step("Make PATCH request to {url}")
+    async def patch(self, url: URL | str, json: Any | None = None) -> APIResponse:
+        """
+        Performs a PATCH request (partial data update).
+
+        :param url: Endpoint URL.
+        :param json: Data to update in JSON format.
+        :return: APIResponse object with response data.
+        """
+        return APIResponse(await self.client.patch(url, json=json))
+
+    @async_step("Make DELETE request to {url}")
+    async def delete(self, url: URL | str) -> APIResponse:
         """
         Performs a DELETE request (data deletion).
 
         :param url: Endpoint URL.
-        :return: Response object with response data.
+        :return: APIResponse object with response data.
         """
-        return self.client.delete(url)
+        return APIResponse(await self.client.delete(url))
@@ -1,3 +1,154 @@
+import inspect
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from functools import wraps
+from typing import ParamSpec
+
+from httpx import URL, Request, Response
 from swagger_coverage_tool import SwaggerCoverageTracker
 
+from tools.http.body import get_request_body, has_request_body
+
+P = ParamSpec("P")
+
 tracker = SwaggerCoverageTracker(service="api-course")
+
+current_endpoint: ContextVar[str | None] = ContextVar("current_endpoint", default=None)
+current_client_method: ContextVar[str | None] = ContextVar("current_client_method", default=None)
+
+_coverage_tracking = True
+
+
+def set_coverage_tracking(enabled: bool) -> None:
+    """
+    Turns saving the coverage of the client methods on or off for the current process,
+    e.g. off for the load runner.
+
+    :param enabled: Save the coverage of every response.
+    """
+    global _coverage_tracking
+    _coverage_tracking = enabled
+
+
+def get_current_endpoint() -> str | None:
+    """
+    :return: Endpoint template of the client method being called (e.g., "/api/v1/courses/{course_id}")
+    or None outside of client methods.
+    """
+    return current_endpoint.get()
+
+
+def get_current_client_method() -> str | None:
+    """
+    :return: Qualified name of the client method being called (e.g., "CoursesClient.get_course_api")
+    or None outside of client methods.
+    """
+    return current_client_method.get()
+
+
+class _CoverageRequest:
+    def __init__(self, request: Request):
+        self.method: str = request.method
+        self.url: URL = request.url
+        self._request = request
+
+    def read(self) -> bytes:
+        if (body := get_request_body(self._request)) is not None:
+            return body
+
+        return b"<streamed>" if has_request_body(self._request) else b""
+
+
+class _CoverageResponse:
+    def __init__(self, response: Response):
+        self.request = _CoverageRequest(response.request)
+        self.status_code: int = response.status_code
+        self.content: bytes = response.content
+
+
+def save_coverage(endpoint: str, response: Response) -> None:
+    """
+    Saves the coverage of the endpoint by the response.
+
+    The tracker checks whether the request had a body with request.read(), which would load
+    a streamed body (e.g., a file upload) into memory or fail once its file is closed,
+    so it gets a view of the response that reports streamed bodies without reading them.
+
+    :param endpoint: Endpoint template (e.g., "/api/v1/courses/{course_id}").
+    :param response: Response returned by the client method.
+    """
+    if not _coverage_tracking:
+        return
+
+    if coverage := tracker.build_endpoint_coverage_for_httpx(endpoint, _CoverageResponse(response)):
+        tracker.storage.save(coverage)
+
+
+def track_coverage_httpx(
+    endpoint: str,
+) -> Callable[[Callable[P, Response]], Callable[P, Response]]:
+    """
+    Counterpart of tracker.track_coverage_httpx that also exposes the endpoint template
+    and does not read streamed request bodies (see save_coverage).
+
+    While the client method runs, the template is available via get_current_endpoint()
+    and the method name via get_current_client_method(), so event hooks can group requests
+    by route and by client method instead of by concrete URL.
+
+    :param endpoint: Endpoint template (e.g., "/api/v1/courses/{course_id}").
+    :return: Decorator for a client method.
+    """
+
+    def wrapper(func: Callable[P, Response]) -> Callable[P, Response]:
+        @wraps(func)
+        def inner(*args: P.args, **kwargs: P.kwargs) -> Response:
+            endpoint_token = current_endpoint.set(endpoint)
+            method_token = current_client_method.set(func.__qualname__)
+            try:
+                response = func(*args, **kwargs)
+            finally:
+                current_client_method.reset(method_token)
+                current_endpoint.reset(endpoint_token)
+
+            save_coverage(endpoint, response)
+            return response
+
+        # allure.step formats titles from the signature, which getfullargspec doesn't unwrap
+        inner.__signature__ = inspect.signature(func)
+        return inner
+
+    return wrapper
+
+
+def track_coverage_httpx_async(
+    endpoint: str,
+) -> Callable[[Callable[P, Awaitable[Response]]], Callable[P, Awaitable[Response]]]:
+    """
+    Async counterpart of track_coverage_httpx.
+
+    The tracker decorator expects the wrapped function to return a response, so it cannot be
+    applied to coroutine functions directly. This decorator awaits the response first and then
+    saves the coverage with the same tracker (see save_coverage).
+
+    :param endpoint: Endpoint template (e.g., "/api/v1/courses/{course_id}").
+    :return: Decorator for an async client method.
+    """
+
+    def wrapper(func: Callable[P, Awaitable[Response]]) -> Callable[P, Awaitable[Response]]:
+        @wraps(func)
+        async def inner(*args: P.args, **kwargs: P.kwargs) -> Response:
+            endpoint_token = current_endpoint.set(endpoint)
+            method_token = current_client_method.set(func.__qualname__)
+            try:
+                response = await func(*args, **kwargs)
+            finally:
+                current_client_method.reset(method_token)
+                current_endpoint.reset(endpoint_token)
+
+            save_coverage(endpoint, response)
+            return response
+
+        inner.__signature__ = inspect.signature(func)
+        return inner
+
+    return wrapper
@@ -0,0 +1,88 @@
+import json
+from typing import Any, TypeVar
+
+from httpx import Response
+from pydantic import BaseModel
+
+from tools.assertions.schema import validate_json_schema
+
+try:
+    import orjson
+except ImportError:  # optional backend
+    orjson = None
+
+T = TypeVar("T", bound=BaseModel)
+
+_NOT_PARSED = object()
+
+
+def loads(content: bytes) -> Any:
+    """
+    :param content: JSON document.
+    :return: Parsed document, with orjson if it is installed.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+
+    return json.loads(content)
+
+
+class APIResponse:
+    """
+    Response returned by the *_api methods of the API clients.
+
+    Wraps httpx.Response and exposes all its attributes (status_code, request, content, text,
+    extensions, ...), so it can be passed wherever a response is expected, e.g. to the coverage
+    tracker. The body is parsed at most once: json(), parse() and validate_json_schema() share the
+    parsed document, and the typed model of every schema is built once.
+    """
+
+    def __init__(self, response: Response):
+        """
+        :param response: HTTPX response object.
+        """
+        self.response = response
+
+        self._json: Any = _NOT_PARSED
+        self._models: dict[type[BaseModel], BaseModel] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.response, name)
+
+    def __repr__(self) -> str:
+        return repr(self.response)
+
+    def json(self, **kwargs: Any) -> Any:
+        """
+        :param kwargs: Arguments of json.loads. If given, the body is parsed again with them.
+        :return: Parsed JSON body, cached after the first call.
+        """
+        if kwargs:
+            return self.response.json(**kwargs)
+
+        if self._json is _NOT_PARSED:
+            self._json = loads(self.response.content)
+
+        return self._json
+
+    def parse(self, model: type[T]) -> T:
+        """
+        Validates the parsed body against a pydantic model.
+
+        :param model: Model of the response, e.g. CreateCourseResponseSchema.
+        :return: Model object, cached per model.
+        :raises pydantic.ValidationError: If the body doesn't match the model.
+        """
+        if (value := self._models.get(model)) is None:
+            value = self._models[model] = model.model_validate(self.json())
+
+        return value
+
+    def validate_json_schema(self, schema: dict | type[BaseModel]) -> None:
+        """
+        Validates the parsed body against a JSON schema, see tools.assertions.schema.
+
+        :param schema: The expected JSON schema or the pydantic model describing it.
+        :raises jsonschema.exceptions.ValidationError: If the body doesn't conform to the schema.
+        """
+        validate_json_schema(self.json(), schema)
@@ -1,14 +1,15 @@
 import allure
-from httpx import Response
 
-from clients.api_client import APIClient
-from clients.api_coverage import tracker
+from clients.api_client import APIClient, AsyncAPIClient
+from clients.api_coverage import track_coverage_httpx, track_coverage_httpx_async
+from clients.api_response import APIResponse
 from clients.authentication.authentication_schema import (
     LoginRequestSchema,
     LoginResponseSchema,
     RefreshRequestSchema,
 )
-from clients.public_http_builder import get_public_http_client
+from clients.public_http_builder import get_async_public_http_client, get_public_http_client
+from tools.allure.steps import async_step
 from tools.routes import APIRoutes
 
 
@@ -18,26 +19,26 @@ class AuthenticationClient(APIClient):
     """
 
     @allure.step("Authenticate user")
-    @tracker.track_coverage_httpx(f"{APIRoutes.AUTHENTICATION}/login")
-    def login_api(self, request: LoginRequestSchema) -> Response:
+    @track_coverage_httpx(f"{APIRoutes.AUTHENTICATION}/login")
+    def login_api(self, request: LoginRequestSchema) -> APIResponse:
         """
         This method performs user authentication.
 
         :param request: A LoginRequestSchema object containing email and password.
-        :return: The server response as an httpx.Response object.
+        :return: The server response as an APIResponse object.
         """
         return self.post(
             f"{APIRoutes.AUTHENTICATION}/login", json=request.model_dump(by_alias=True)
         )
 
     @allure.step("Refresh authentication token")
-    @tracker.track_coverage_httpx(f"{APIRoutes.AUTHENTICATION}/refresh")
-    def refresh_api(self, request: RefreshRequestSchema) -> Response:
+    @track_coverage_httpx(f"{APIRoutes.AUTHENTICATION}/refresh")
+    def refresh_api(self, request: RefreshRequestSchema) -> APIResponse:
         """
         This method refreshes the authorization token.
 
         :param request: A RefreshRequestSchema object containing refreshToken.
-        :return: The server response as an httpx.Response object.
+        :return: The server response as an APIResponse object.
         """
         return self.post(
             f"{APIRoutes.AUTHENTICATION}/refresh", json=request.model_dump(by_alias=True)
@@ -54,7 +55,17 @@ class AuthenticationClient(APIClient):
         :return: The parsed response containing authentication tokens.
         """
         response = self.login_api(request)
-        return LoginResponseSchema.model_validate_json(response.text)
+        return response.parse(LoginResponseSchema)
+
+    def refresh(self, request: RefreshRequestSchema) -> LoginResponseSchema:
+        """
+        Refreshes the authorization token and returns the parsed JSON response.
+
+        :param request: A RefreshRequestSchema object containing refreshToken.
+        :return: The parsed response containing new authentication tokens.
+        """
+        response = self.refresh_api(request)
+        return response.parse(LoginResponseSchema)
 
 
 def get_authentication_client() -> AuthenticationClient:
@@ -64,3 +75,54 @@ def get_authentication_client() -> AuthenticationClient:
     :return: Ready-to-use AuthenticationClient.
     """
     return AuthenticationClient(client=get_public_http_client())
+
+
+class AsyncAuthenticationClient(AsyncAPIClient):
+    """
+    Async client for working with /api/v1/authentication
+    """
+
+    @async_step("Authenticate user")
+    @track_coverage_httpx_async(f"{APIRoutes.AUTHENTICATION}/login")
+    async def login_api(self, request: LoginRequestSchema) -> APIResponse:
+        """
+        This method performs user authentication.
+
+        :param request: A LoginRequestSchema object containing email and password.
+        :return: The server response as an APIResponse object.
+        """
+        return await self.post(
+            f"{APIRoutes.AUTHENTICATION}/login", json=request.model_dump(by_alias=True)
+        )
+
+    @async_step("Refresh authentication token")
+    @track_coverage_httpx_async(f"{APIRoutes.AUTHENTICATION}/refresh")
+    async def refresh_api(self, request: RefreshRequestSchema) -> APIResponse:
+        """
+        This method refreshes the authorization token.
+
+        :param request: A RefreshRequestSchema object containing refreshToken.
+        :return: The server response as an APIResponse object.
+        """
+        return await self.post(
+            f"{APIRoutes.AUTHENTICATION}/refresh", json=request.model_dump(by_alias=True)
+        )
+
+    async def login(self, request: LoginRequestSchema) -> LoginResponseSchema:
+        """
+        Performs user authentication and returns the parsed JSON response.
+
+        :param request: A LoginRequestSchema object containing email and password.
+        :return: The parsed response containing authentication tokens.
+        """
+        response = await self.login_api(request)
+        return response.parse(LoginResponseSchema)
+
+
+def get_async_authentication_client() -> AsyncAuthenticationClient:
+    """
+    Creates an instance of AsyncAuthenticationClient with a pre-configured HTTP client.
+
+    :return: Ready-to-use AsyncAuthenticationClient.
+    """
+    return AsyncAuthenticationClient(client=get_async_public_http_client())
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from tools.fakers import fake
 
@@ -35,4 +35,6 @@ class RefreshRequestSchema(BaseModel):
     Description of the request structure for token refresh.
     """
 
+    model_config = ConfigDict(populate_by_name=True)
+
     refresh_token: str = Field(alias=str("refreshToken"), default_factory=fake.sentence)
@@ -0,0 +1,88 @@
+import asyncio
+from collections.abc import AsyncGenerator, Callable, Generator
+from http import HTTPStatus
+
+from httpx import Auth, Request, Response
+from pydantic import ValidationError
+
+from clients.authentication.authentication_client import get_authentication_client
+from clients.authentication.authentication_schema import RefreshRequestSchema, TokenSchema
+from clients.authentication.token_cache import CachedTokenSchema, get_token_cache
+from config import settings
+
+
+class BearerAuth(Auth):
+    """
+    Applies the user's access token to every request sent by a client and keeps it fresh.
+
+    Unlike a default Authorization header, the auth object belongs to the client and not
+    to the connection pool, so clients of different users can share one transport.
+
+    The token is refreshed with the refresh endpoint shortly before it expires
+    (settings.authentication.token_expiry_margin), and a request rejected with 401
+    is retried once with a refreshed token. Refreshes go through the shared token cache,
+    so concurrent clients of one user send a single refresh request.
+    """
+
+    def __init__(self, email: str, token: CachedTokenSchema, login: Callable[[], TokenSchema]):
+        """
+        :param email: Email of the user the token belongs to.
+        :param token: Current tokens of the user.
+        :param login: Function logging the user in again if the refresh token is rejected.
+        """
+        self.email = email
+        self.token = token
+        self.login = login
+
+    def sync_auth_flow(self, request: Request) -> Generator[Request, Response, None]:
+        token = self.get_token()
+        request.headers["Authorization"] = f"Bearer {token.token.access_token}"
+        response = yield request
+
+        if response.status_code == HTTPStatus.UNAUTHORIZED:
+            token = self.refresh_token(token)
+            request.headers["Authorization"] = f"Bearer {token.token.access_token}"
+            yield request
+
+    async def async_auth_flow(self, request: Request) -> AsyncGenerator[Request, Response]:
+        # Refresh performs blocking file locking and HTTP calls, so it runs in a thread
+        token = self.token
+        if not token.is_valid(settings.authentication.token_expiry_margin):
+            token = await asyncio.to_thread(self.refresh_token, token)
+
+        request.headers["Authorization"] = f"Bearer {token.token.access_token}"
+        response = yield request
+
+        if response.status_code == HTTPStatus.UNAUTHORIZED:
+            token = await asyncio.to_thread(self.refresh_token, token)
+            request.headers["Authorization"] = f"Bearer {token.token.access_token}"
+            yield request
+
+    def get_token(self) -> CachedTokenSchema:
+        """
+        :return: Current token, refreshed first if it is about to expire.
+        """
+        if self.token.is_valid(settings.authentication.token_expiry_margin):
+            return self.token
+
+        return self.refresh_token(self.token)
+
+    def refresh_token(self, stale: CachedTokenSchema) -> CachedTokenSchema:
+        """
+        Replaces the stale token with a refreshed one.
+
+        :param stale: Token that has expired or has been rejected by the server.
+        :return: Valid token of the user.
+        """
+        self.token = get_token_cache().refresh(self.email, stale, self._refresh)
+        return self.token
+
+    def _refresh(self, token: TokenSchema) -> TokenSchema:
+        authentication_client = get_authentication_client()
+        request = RefreshRequestSchema(refresh_token=token.refresh_token)
+
+        with authentication_client.client:
+            try:
+                return authentication_client.refresh(request).token
+            except ValidationError:
+                return self.login()
@@ -0,0 +1,243 @@
+import base64
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import stat
+import time
+import uuid
+from collections.abc import Callable
+from functools import cache
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from clients.authentication.authentication_schema import TokenSchema
+from config import settings
+from tools.logger import get_logger
+
+RUN_ID_ENV = "TOKEN_CACHE_RUN_ID"
+
+logger = get_logger("TOKEN_CACHE")
+
+
+class CachedTokenSchema(BaseModel):
+    """
+    Description of a token cache entry.
+    """
+
+    email: str
+    token: TokenSchema
+    expires_at: float
+
+    def is_valid(self, margin: float) -> bool:
+        """
+        :param margin: Number of seconds before expiry after which the token is considered stale.
+        :return: True if the access token can still be used.
+        """
+        return self.expires_at - margin > time.time()
+
+
+def get_token_expiry(access_token: str) -> float:
+    """
+    Reads the expiry time from the "exp" claim of a JWT access token.
+
+    The signature is not verified, the claim is only used to decide when to log in again.
+    If the token is not a JWT, settings.authentication.token_ttl is used instead.
+
+    :param access_token: Access token returned by the login or refresh endpoint.
+    :return: Expiry time as a UNIX timestamp.
+    """
+    try:
+        payload = access_token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return time.time() + settings.authentication.token_ttl
+
+
+class TokenCache:
+    """
+    File-backed token cache shared by the pytest-xdist controller and all of its workers.
+
+    Every email has its own entry file guarded by an exclusive flock, so a credential logs in
+    only once per session even if several workers request it at the same time, while logins
+    of different users do not wait for each other.
+
+    The cache lives in the shared temp directory, so the directory and its parent are private
+    to the current user (0700, entries 0600), and a directory created by someone else is refused.
+    """
+
+    def __init__(self, directory: Path):
+        """
+        :param directory: Directory with cache entries, shared by all processes of the run.
+        :raises PermissionError: If the directory or its parent belongs to another user.
+        """
+        self.directory = directory
+        for path in (directory.parent, directory):
+            _make_private_dir(path)
+
+    def get_or_login(self, email: str, login: Callable[[], TokenSchema]) -> CachedTokenSchema:
+        """
+        Returns a valid cached token for the email or logs in and caches the new one.
+
+        :param email: Email of the user, used as the cache key.
+        :param login: Function performing the login and returning the tokens.
+        :return: CachedTokenSchema with a valid access token.
+        """
+        with self._lock(email):
+            if (entry := self._read(email)) and entry.is_valid(self._margin):
+                return entry
+
+            logger.info("Token cache miss for %s, logging in", email)
+            return self._write(email, login())
+
+    def get(self, email: str) -> CachedTokenSchema | None:
+        """
+        :param email: Email of the user.
+        :return: Valid cached token or None.
+        """
+        with self._lock(email):
+            if (entry := self._read(email)) and entry.is_valid(self._margin):
+                return entry
+
+            return None
+
+    def get_latest(self, email: str) -> CachedTokenSchema | None:
+        """
+        :param email: Email of the user.
+        :return: Last cached token even if it has expired (its refresh token may still be
+        accepted) or None.
+        """
+        with self._lock(email):
+            return self._read(email)
+
+    def store(self, email: str, token: TokenSchema) -> CachedTokenSchema:
+        """
+        Stores the tokens of the user (e.g., after a login or refresh).
+
+        :param email: Email of the user.
+        :param token: Tokens returned by the login or refresh endpoint.
+        :return: The stored cache entry.
+        """
+        with self._lock(email):
+            return self._write(email, token)
+
+    def refresh(
+        self,
+        email: str,
+        current: CachedTokenSchema,
+        refresh: Callable[[TokenSchema], TokenSchema],
+    ) -> CachedTokenSchema:
+        """
+        Replaces the current tokens of the user with refreshed ones.
+
+        If another thread or worker has already replaced the current access token with a valid
+        one while this call was waiting for the lock, that token is returned and no request is
+        sent, so many clients of one user do not refresh at the same time.
+
+        :param email: Email of the user.
+        :param current: The entry whose access token has become stale.
+        :param refresh: Function exchanging the stale tokens for new ones.
+        :return: CachedTokenSchema with a valid access token.
+        """
+        with self._lock(email):
+            entry = self._read(email)
+            if (
+                entry
+                and entry.token.access_token != current.token.access_token
+                and entry.is_valid(self._margin)
+            ):
+                return entry
+
+            logger.info("Refreshing token for %s", email)
+            return self._write(email, refresh(current.token))
+
+    def clear(self) -> None:
+        """
+        Removes the cache directory with all entries.
+        """
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    @property
+    def _margin(self) -> float:
+        return settings.authentication.token_expiry_margin
+
+    def _path(self, email: str) -> Path:
+        return self.directory.joinpath(hashlib.sha256(email.encode()).hexdigest())
+
+    def _lock(self, email: str) -> "_FileLock":
+        return _FileLock(self._path(email).with_suffix(".lock"))
+
+    def _read(self, email: str) -> CachedTokenSchema | None:
+        path = self._path(email).with_suffix(".json")
+        if not path.exists():
+            return None
+
+        return CachedTokenSchema.model_validate_json(path.read_text())
+
+    def _write(self, email: str, token: TokenSchema) -> CachedTokenSchema:
+        entry = CachedTokenSchema(
+            email=email, token=token, expires_at=get_token_expiry(token.access_token)
+        )
+
+        path = self._path(email).with_suffix(".json")
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with os.fdopen(_open_private(temp_path, os.O_WRONLY | os.O_TRUNC), "w") as file:
+            file.write(entry.model_dump_json(by_alias=True))
+
+        temp_path.replace(path)
+
+        return entry
+
+
+def _make_private_dir(path: Path) -> None:
+    path.mkdir(mode=0o700, exist_ok=True)
+
+    # lstat, so a symlink planted by someone else is not followed
+    info = path.lstat()
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid():
+        raise PermissionError(f"Token cache directory {path} is not a directory owned by the user")
+
+    if stat.S_IMODE(info.st_mode) != 0o700:
+        path.chmod(0o700)
+
+
+def _open_private(path: Path, flags: int) -> int:
+    return os.open(path, os.O_CREAT | flags, 0o600)
+
+
+class _FileLock:
+    def __init__(self, path: Path):
+        self.path = path
+
+    def __enter__(self):
+        self.file = os.fdopen(_open_private(self.path, os.O_WRONLY | os.O_APPEND), "a")
+        fcntl.flock(self.file, fcntl.LOCK_EX)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        fcntl.flock(self.file, fcntl.LOCK_UN)
+        self.file.close()
+
+
+def get_token_cache_run_id() -> str:
+    """
+    Returns the identifier of the current run, creating it if necessary.
+
+    The identifier is kept in an environment variable, so pytest-xdist workers spawned
+    by the controller inherit it and use the same cache directory.
+
+    :return: Identifier of the current run.
+    """
+    return os.environ.setdefault(RUN_ID_ENV, uuid.uuid4().hex)
+
+
+@cache
+def get_token_cache() -> TokenCache:
+    """
+    Function returns the token cache of the current run.
+
+    :return: TokenCache located in settings.authentication.token_cache_dir.
+    """
+    return TokenCache(settings.authentication.token_cache_dir.joinpath(get_token_cache_run_id()))
@@ -1,15 +1,21 @@
 import allure
-from httpx import QueryParams, Response
+from httpx import QueryParams
 
-from clients.api_client import APIClient
-from clients.api_coverage import tracker
+from clients.api_client import APIClient, AsyncAPIClient
+from clients.api_coverage import track_coverage_httpx, track_coverage_httpx_async
+from clients.api_response import APIResponse
 from clients.courses.courses_schema import (
     CreateCourseRequestSchema,
     CreateCourseResponseSchema,
     GetCoursesQuerySchema,
     UpdateCourseRequestSchema,
 )
-from clients.private_http_builder import AuthenticationUserSchema, get_private_http_client
+from clients.private_http_builder import (
+    AuthenticationUserSchema,
+    get_async_private_http_client,
+    get_private_http_client,
+)
+from tools.allure.steps import async_step
 from tools.routes import APIRoutes
 
 
@@ -19,60 +25,60 @@ class CoursesClient(APIClient):
     """
 
     @allure.step("Get courses")
-    @tracker.track_coverage_httpx(APIRoutes.COURSES)
-    def get_courses_api(self, query: GetCoursesQuerySchema) -> Response:
+    @track_coverage_httpx(APIRoutes.COURSES)
+    def get_courses_api(self, query: GetCoursesQuerySchema) -> APIResponse:
         """
         Method to retrieve a list of courses based on query parameters.
 
         :param query: Query parameters for filtering courses as a GetCoursesQuerySchema object.
-        :return: The server response as an httpx.Response object.
+        :return: The server response as an APIResponse object.
         """
         return self.get(APIRoutes.COURSES, params=QueryParams(query.model_dump(by_alias=True)))
 
     @allure.step("Get course by id {course_id}")
-    @tracker.track_coverage_httpx(f"{APIRoutes.COURSES}/{{course_id}}")
-    def get_course_api(self, course_id: str) -> Response:
+    @track_coverage_httpx(f"{APIRoutes.COURSES}/{{course_id}}")
+    def get_course_api(self, course_id: str) -> APIResponse:
         """
         Method to retrieve a course by its identifier.
 
         :param course_id: The identifier of the course.
-        :return: The server response as an httpx.Response object.
+        :return: The server response as an APIResponse object.
         """
         return self.get(f"{APIRoutes.COURSES}/{course_id}")
 
     @allure.step("Create course")
-    @tracker.track_coverage_httpx(APIRoutes.COURSES)
-    def create_course_api(self, request: CreateCourseRequestSchema) -> Response:
+    @track_coverage_httpx(APIRoutes.COURSES)
+    def create_course_api(self, request: CreateCourseRequestSchema) -> APIResponse:
         """
         Method to create a new course.
 
         :param request: Course data for creation as a CreateCourseRequestSchema object.
-        :return: The server response as an httpx.Response object.
+        :return: The server response as an APIResponse object.
         """
         return self.post(APIRoutes.COURSES, json=request.model_dump(by_alias=True))
 
     @allure.step("Update course by id {course_id}")
-    @tracker.track_coverage_httpx(f"{APIRoutes.COURSES}/{{course_id}}")
-    def update_course_api(self, course_id: str, request: UpdateCourseRequestSchema) -> Response:
+    @track_coverage_httpx(f"{APIRoutes.COURSES}/{{course_id}}")
+    def update_course_api(self, course_id: str, request: UpdateCourseRequestSchema) -> APIResponse:
         """
         Method to update a course by its identifier.
 
         :param course_id: The identifier of the course.
         :param request: Course data for update as an UpdateCourseRequestSchema object.
-        :return: The server response as an httpx.Response object.
+        :return: The server response as an APIResponse object.
         """
         return self.patch(
             f"{APIRoutes.COURSES}/{course_id}", json=request.model_dump(by_alias=True)
         )
 
     @allure.step("Delete course by id {course_id}")
-    @tracker.track_coverage_httpx(f"{APIRoutes.COURSES}/{{course_id}}")
-    def delete_course_api(self, course_id: str) -> Response:
+    @track_coverage_httpx(f"{APIRoutes.COURSES}/{{course_id}}")
+    def delete_course_api(self, course_id: str) -> APIResponse:
         """
         Method to delete a course by its identifier.
 
         :param course_id: The identifier of the course.
-        :return: The server response as an httpx.Response object.
+        :return: The server response as an APIResponse object.
         """
         return self.delete(f"{APIRoutes.COURSES}/{course_id}")
 
@@ -84,7 +90,7 @@ class CoursesClient(APIClient):
         :return: The created course as a CreateCourseResponseSchema object.
         """
         response = self.create_course_api(request)
-        return CreateCourseResponseSchema.model_validate_json(response.text)
+        return response.parse(CreateCourseResponseSchema)
 
 
 def get_courses_client(user: AuthenticationUserSchema) -> CoursesClient:
@@ -95,3 +101,91 @@ def get_courses_client(user: AuthenticationUserSchema) -> CoursesClient:
     :return: A ready-to-use CoursesClient.
     """
     return CoursesClient(client=get_private_http_client(user))
+
+
+class AsyncCoursesClient(AsyncAPIClient):
+    """
+    Async client for working with /api/v1/courses
+    """
+
+    @async_step("Get courses")
+    @track_coverage_httpx_async(APIRoutes.COURSES)
+    async def get_courses_api(self, query: GetCoursesQuerySchema) -> APIResponse:
+        """
+        Method to retrieve a list of courses based on query parameters.
+
+        :param query: Query parameters for filtering courses as a GetCoursesQuerySchema object.
+        :return: The server response as an APIResponse object.
+        """
+        return await self.get(
+            APIRoutes.COURSES, params=QueryParams(query.model_dump(by_alias=True))
+        )
+
+    @async_step("Get course by id {course_id}")
+    @track_coverage_httpx_async(f"{APIRoutes.COURSES}/{{course_id}}")
+    async def get_course_api(self, course_id: str) -> APIResponse:
+        """
+        Method to retrieve a course by its identifier.
+
+        :param course_id: The identifier of the course.
+        :return: The server response as an APIResponse object.
+        """
+        return await self.get(f"{APIRoutes.COURSES}/{course_id}")
+
+    @async_step("Create course")
+    @track_coverage_httpx_async(APIRoutes.COURSES)
+    async def create_course_api(self, request: CreateCourseRequestSchema) -> APIResponse:
+        """
+        Method to create a new course.
+
+        :param request: Course data for creation as a CreateCourseRequestSchema object.
+        :return: The server response as an APIResponse object.
+        """
+        return await self.post(APIRoutes.COURSES, json=request.model_dump(by_alias=True))
+
+    @async_step("Update course by id {course_id}")
+    @track_coverage_httpx_async(f"{APIRoutes.COURSES}/{{course_id}}")
+    async def update_course_api(
+        self, course_id: str, request: UpdateCourseRequestSchema
+    ) -> APIResponse:
+        """
+        Method to update a course by its identifier.
+
+        :param course_id: The identifier of the course.
+        :param request: Course data for update as an UpdateCourseRequestSchema object.
+        :return: The server response as an APIResponse object.
+        """
+        return await self.patch(
+            f"{APIRoutes.COURSES}/{course_id}", json=request.model_dump(by_alias=True)
+        )
+
+    @async_step("Delete course by id {course_id}")
+    @track_coverage_httpx_async(f"{APIRoutes.COURSES}/{{course_id}}")
+    async def delete_course_api(self, course_id: str) -> APIResponse:
+        """
+        Method to delete a course by its identifier.
+
+        :param course_id: The identifier of the course.
+        :return: The server response as an APIResponse object.
+        """
+        return await self.delete(f"{APIRoutes.COURSES}/{course_id}")
+
+    async def create_course(self, request: CreateCourseRequestSchema) -> CreateCourseResponseSchema:
+        """
+        Method to create a new course.
+
+        :param request: Course data for creation as a CreateCourseRequestSchema object.
+        :return: The created course as a CreateCourseResponseSchema object.
+        """
+        response = await self.create_course_api(request)
+        return response.parse(CreateCourseResponseSchema)
+
+
+async def get_async_courses_client(user: AuthenticationUserSchema) -> AsyncCoursesClient:
+    """
+    Function to create an instance of AsyncCoursesClient with a pre-configured HTTP client.
+
+    :param user: User authentication data.
+    :return: A ready-to-use AsyncCoursesClient.
+    """
+    return AsyncCoursesClient(client=await get_async_private_http_client(user))
@@ -1,34 +1,30 @@
-import allure
+from collections.abc import Awaitable, Callable
+
 from httpx import Request, Response
 
-from tools.http.curl import make_curl_from_request
+from clients.request_timings import finish_request_timing, start_request_timing
+from tools.http.capture import capture_curl
 from tools.logger import get_logger
+from tools.resources.registry import get_created_resource_kind, track_created_resource
 
 logger = get_logger("HTTP_CLIENT")
 
 
 def curl_event_hook(request: Request):
     """
-    Event hook for automatically attaching cURL command to Allure report.
+    Event hook for capturing the cURL command of the request for the Allure report.
 
-    This function generates a cURL command from the HTTP request object and
-    attaches it to the Allure test report as a text attachment for debugging
-    and documentation purposes.
+    The command is not rendered here: the request is passed to the cURL capture of the current
+    test, which attaches the commands of failed tests, sampled tests and every test
+    in debug mode (see tools.http.capture and fixtures.curl).
 
     Args:
         request (Request): HTTP request object passed to the httpx client.
 
     Returns:
         None
-
-    Note:
-        This function is designed to be used as an event hook with httpx client
-        to automatically capture and attach cURL commands to test reports.
     """
-
-    curl_command = make_curl_from_request(request)
-
-    allure.attach(curl_command, "cURL command", allure.attachment_type.TEXT)
+    capture_curl(request)
 
 
 def log_request_event_hook(request: Request):
@@ -38,7 +34,7 @@ def log_request_event_hook(request: Request):
     Args:
         request: HTTPX request object.
     """
-    logger.info(f"Make {request.method} request to {request.url}")
+    logger.info("Make %s request to %s", request.method, request.url)
 
 
 def log_response_event_hook(response: Response):
@@ -48,4 +44,116 @@ def log_response_event_hook(response: Response):
     Args:
         response: HTTPX response object.
     """
-    logger.info(f"Got response {response.status_code} {response.reason_phrase} from {response.url}")
+    logger.info(
+        "Got response %s %s from %s", response.status_code, response.reason_phrase, response.url
+    )
+
+
+def timing_request_event_hook(request: Request):
+    """
+    Starts measuring the request, see clients.request_timings.
+
+    Args:
+        request: HTTPX request object.
+    """
+    start_request_timing(request)
+
+
+def timing_response_event_hook(response: Response):
+    """
+    Finishes measuring the request and reports its timing to the subscribed listeners.
+
+    Args:
+        response: HTTPX response object.
+    """
+    finish_request_timing(response)
+
+
+async def async_curl_event_hook(request: Request):
+    """
+    Async counterpart of curl_event_hook for httpx.AsyncClient, which awaits its event hooks.
+
+    Args:
+        request (Request): HTTP request object passed to the httpx client.
+    """
+    curl_event_hook(request)
+
+
+async def async_log_request_event_hook(request: Request):
+    """
+    Async counterpart of log_request_event_hook for httpx.AsyncClient.
+
+    Args:
+        request: HTTPX request object.
+    """
+    log_request_event_hook(request)
+
+
+async def async_log_response_event_hook(response: Response):
+    """
+    Async counterpart of log_response_event_hook for httpx.AsyncClient.
+
+    Args:
+        response: HTTPX response object.
+    """
+    log_response_event_hook(response)
+
+
+async def async_timing_request_event_hook(request: Request):
+    """
+    Async counterpart of timing_request_event_hook for httpx.AsyncClient.
+
+    Args:
+        request: HTTPX request object.
+    """
+    start_request_timing(request)
+
+
+async def async_timing_response_event_hook(response: Response):
+    """
+    Async counterpart of timing_response_event_hook for httpx.AsyncClient.
+
+    Args:
+        response: HTTPX response object.
+    """
+    finish_request_timing(response)
+
+
+def get_track_resources_event_hook(owner: str | None = None) -> Callable[[Response], None]:
+    """
+    Creates an event hook recording the entities created by the client for the teardown.
+
+    Args:
+        owner: Email of the user the client is authenticated as, None for public clients.
+
+    Returns:
+        Response event hook for httpx.Client.
+    """
+
+    def track_resources_event_hook(response: Response):
+        if get_created_resource_kind(response.request):
+            response.read()
+            track_created_resource(response, owner)
+
+    return track_resources_event_hook
+
+
+def get_async_track_resources_event_hook(
+    owner: str | None = None,
+) -> Callable[[Response], Awaitable[None]]:
+    """
+    Async counterpart of get_track_resources_event_hook for httpx.AsyncClient.
+
+    Args:
+        owner: Email of the user the client is authenticated as, None for public clients.
+
+    Returns:
+        Response event hook for httpx.AsyncClient.
+    """
+
+    async def track_resources_event_hook(response: Response):
+        if get_created_resource_kind(response.request):
+            await response.aread()
+            track_created_resource(response, owner)
+
+    return track_resources_event_hook
@@ -1,8 +1,8 @@
 import allure
-from httpx import Response
 
-from clients.api_client import APIClient
-from clients.api_coverage import tracker
+from clients.api_client import APIClient, AsyncAPIClient
+from clients.api_coverage import track_coverage_httpx, track_coverage_httpx_async
+from clients.api_response import APIResponse
 from clients.exercises.exercises_schema import (
     CreateExerciseRequestSchema,
     CreateExerciseResponseSchema,
@@ -12,7 +12,12 @@ from clients.exercises.exercises_schema import (
     UpdateExerciseRequestSchema,
     UpdateExerciseResponseSchema,
 )
-from clients.private_http_builder import AuthenticationUserSchema, get_private_http_client
+from clients.private_http_builder import (
+    AuthenticationUserSchema,
+    get_async_private_http_client,
+    get_private_http_client,
+)
+from tools.allure.steps import async_step
 from tools.routes import APIRoutes
 
 
@@ -22,64 +27,64 @@ class ExercisesClient(APIClient):
     """
 
     @allure.step("Get exercises")
-    @tracker.track_coverage_httpx(APIRoutes.EXERCISES)
-    def get_exercises_api(self, query: GetExercisesQuerySchema) -> Response:
+    @track_coverage_httpx(APIRoutes.EXERCISES)
+    def get_exercises_api(self, query: GetExercisesQuerySchema) -> APIResponse:
         """
         Method to retrieve a list of exercises based on query parameters.
 
         :param query: Dictionary with query parameters for filtering exercises.
-        :return: The server response as an httpx.Response object.
+        :return: The server response as an APIResponse object.
         """
         return self.get(
             APIRoutes.EXERCISES, params=query.model_dump(by_alias=True, exclude_none=True)
         )  # type: ignore
 
     @allure.step("Get exercise by id {exercise_id}")
-    @tracker.track_coverage_httpx(f"{APIRoutes.EXERCISES}/{{exercise_id}}")
-    def get_exercise_api(self, exercise_id: str) -> Response:
+    @track_coverage_httpx(f"{APIRoutes.EXERCISES}/{{exercise_id}}")
+    def get_exercise_api(self, exercise_id: str) -> APIResponse:
         """
         Method to retrieve a specific exercise by ID.
 
         :param exercise_id: The identifier of the exercise.
-        :return: The server response as an httpx.Response object.
+        :return: The server response as an APIResponse object.
         """
         return self.get(f"{APIRoutes.EXERCISES}/{exercise_id}")
 
     @allure.step("Create exercise")
-    @tracker.track_coverage_httpx(APIRoutes.EXERCISES)
-    def create_exercise_api(self, request: CreateExerciseRequestSchema) -> Response:
+    @track_coverage_httpx(APIRoutes.EXERCISES)
+    def create_exercise_api(self, request: CreateExerciseRequestSchema) -> APIResponse:
         """
         Method to create a new exercise.
 
         :param request: Dictionary with exercise data for creation.
-        :return: The server response as an httpx.Response object.
+        :return: The server response as an APIResponse object.
         """
         return self.post(APIRoutes.EXERCISES, json=request.model_dump(by_alias=True))
 
     @allure.step("Update exercise by id {exercise_id}")
-    @tracker.track_coverage_httpx(f"{APIRoutes.EXERCISES}/{{exercise_id}}")
+    @track_coverage_httpx(f"{APIRoutes.EXERCISES}/{{exercise_id}}")
     def update_exercise_api(
         self, exercise_id: str, request: UpdateExerciseRequestSchema
-    ) -> Response:
+    ) -> APIResponse:
         """
         Method to update an existing exercise.
 
         :param exercise_id: The identifier of the exercise to update.
         :param request: Dictionary with exercise data to update.
-        :return: The server response as an httpx.Response object.
+        :return: The server response as an APIResponse object.
         """
         return self.patch(
             f"{APIRoutes.EXERCISES}/{exercise_id}", json=request.model_dump(by_alias=True)
         )
 
     @allure.step("Delete exercise by id {exercise_id}")
-    @tracker.track_coverage_httpx(f"{APIRoutes.EXERCISES}/{{exercise_id}}")
-    def delete_exercise_api(self, exercise_id: str) -> Response:
+    @track_coverage_httpx(f"{APIRoutes.EXERCISES}/{{exercise_id}}")
+    def delete_exercise_api(self, exercise_id: str) -> APIResponse:
         """
         Method to delete an exercise.
 
         :param exercise_id: The identifier of the exercise to delete.
-        :return: The server response as an httpx.Response object.
+        :return: The server response as an APIResponse object.
         """
         return self.delete(f"{APIRoutes.EXERCISES}/{exercise_id}")
 
@@ -91,7 +96,7 @@ class ExercisesClient(APIClient):
         :return: Parsed JSON response containing exercises data.
         """
         response = self.get_exercises_api(query)
-        return GetExercisesResponseSchema.model_validate_json(response.text)
+        return response.parse(GetExercisesResponseSchema)
 
     def get_exercise(self, exercise_id: str) -> GetExerciseResponseSchema:
         """
@@ -101,7 +106,7 @@ class ExercisesClient(APIClient):
         :return: Parsed JSON response containing exercise data.
         """
         response = self.get_exercise_api(exercise_id)
-        return GetExerciseResponseSchema.model_validate_json(response.text)
+        return response.parse(GetExerciseResponseSchema)
 
     def create_exercise(self, request: CreateExerciseRequestSchema) -> CreateExerciseResponseSchema:
         """
@@ -111,7 +116,7 @@ class ExercisesClient(APIClient):
         :return: Parsed JSON response containing the created exercise data.
         """
         response = self.create_exercise_api(request)
-        return CreateExerciseResponseSchema.model_validate_json(response.text)
+        return response.parse(CreateExerciseResponseSchema)
 
     def update_exercise(
         self, exercise_id: str, request: UpdateExerciseRequestSchema
@@ -124,7 +129,7 @@ class ExercisesClient(APIClient):
         :return: Parsed JSON response containing the updated exercise data.
         """
         response = self.update_exercise_api(exercise_id, request)
-        return UpdateExerciseResponseSchema.model_validate_json(response.text)
+        return response.parse(UpdateExerciseResponseSchema)
 
 
 def get_exercises_client(user: AuthenticationUserSchema) -> ExercisesClient:
@@ -135,3 +140,126 @@ def get_exercises_client(user: AuthenticationUserSchema) -> ExercisesClient:
     :return: A ready-to-use ExercisesClient.
     """
     return ExercisesClient(get_private_http_client(user))
+
+
+class AsyncExercisesClient(AsyncAPIClient):
+    """
+    Async client for exercises API operations.
+    """
+
+    @async_step("Get exercises")
+    @track_coverage_httpx_async(APIRoutes.EXERCISES)
+    async def get_exercises_api(self, query: GetExercisesQuerySchema) -> APIResponse:
+        """
+        Method to retrieve a list of exercises based on query parameters.
+
+        :param query: Dictionary with query parameters for filtering exercises.
+        :return: The server response as an APIResponse object.
+        """
+        return await self.get(
+            APIRoutes.EXERCISES, params=query.model_dump(by_alias=True, exclude_none=True)
+        )  # type: ignore
+
+    @async_step("Get exercise by id {exercise_id}")
+    @track_coverage_httpx_async(f"{APIRoutes.EXERCISES}/{{exercise_id}}")
+    async def get_exercise_api(self, exercise_id: str) -> APIResponse:
+        """
+        Method to retrieve a specific exercise by ID.
+
+        :param exercise_id: The identifier of the exercise.
+        :return: The server response as an APIResponse object.
+        """
+        return await self.get(f"{APIRoutes.EXERCISES}/{exercise_id}")
+
+    @async_step("Create exercise")
+    @track_coverage_httpx_async(APIRoutes.EXERCISES)
+    async def create_exercise_api(self, request: CreateExerciseRequestSchema) -> APIResponse:
+        """
+        Method to create a new exercise.
+
+        :param request: Dictionary with exercise data for creation.
+        :return: The server response as an APIResponse object.
+        """
+        return await self.post(APIRoutes.EXERCISES, json=request.model_dump(by_alias=True))
+
+    @async_step("Update exercise by id {exercise_id}")
+    @track_coverage_httpx_async(f"{APIRoutes.EXERCISES}/{{exercise_id}}")
+    async def update_exercise_api(
+        self, exercise_id: str, request: UpdateExerciseRequestSchema
+    ) -> APIResponse:
+        """
+        Method to update an existing exercise.
+
+        :param exercise_id: The identifier of the exercise to update.
+        :param request: Dictionary with exercise data to update.
+        :return: The server response as an APIResponse object.
+        """
+        return await self.patch(
+            f"{APIRoutes.EXERCISES}/{exercise_id}", json=request.model_dump(by_alias=True)
+        )
+
+    @async_step("Delete exercise by id {exercise_id}")
+    @track_coverage_httpx_async(f"{APIRoutes.EXERCISES}/{{exercise_id}}")
+    async def delete_exercise_api(self, exercise_id: str) -> APIResponse:
+        """
+        Method to delete an exercise.
+
+        :param exercise_id: The identifier of the exercise to delete.
+        :return: The server response as an APIResponse object.
+        """
+        return await self.delete(f"{APIRoutes.EXERCISES}/{exercise_id}")
+
+    async def get_exercises(self, query: GetExercisesQuerySchema) -> GetExercisesResponseSchema:
+        """
+        Method to retrieve a list of exercises based on query parameters.
+
+        :param query: Dictionary with query parameters for filtering exercises.
+        :return: Parsed JSON response containing exercises data.
+        """
+        response = await self.get_exercises_api(query)
+        return response.parse(GetExercisesResponseSchema)
+
+    async def get_exercise(self, exercise_id: str) -> GetExerciseResponseSchema:
+        """
+        Method to retrieve a specific exercise by ID.
+
+        :param exercise_id: The identifier of the exercise.
+        :return: Parsed JSON response containing exercise data.
+        """
+        response = await self.get_exercise_api(exercise_id)
+        return response.parse(GetExerciseResponseSchema)
+
+    async def create_exercise(
+        self, request: CreateExerciseRequestSchema
+    ) -> CreateExerciseResponseSchema:
+        """
+        Method to create a new exercise.
+
+        :param request: Dictionary with exercise data for creation.
+        :return: Parsed JSON response containing the created exercise data.
+        """
+        response = await self.create_exercise_api(request)
+        return response.parse(CreateExerciseResponseSchema)
+
+    async def update_exercise(
+        self, exercise_id: str, request: UpdateExerciseRequestSchema
+    ) -> UpdateExerciseResponseSchema:
+        """
+        Method to update an existing exercise.
+
+        :param exercise_id: The identifier of the exercise to update.
+        :param request: Dictionary with exercise data to update.
+        :return: Parsed JSON response containing the updated exercise data.
+        """
+        response = await self.update_exercise_api(exercise_id, request)
+        return response.parse(UpdateExerciseResponseSchema)
+
+
+async def get_async_exercises_client(user: AuthenticationUserSchema) -> AsyncExercisesClient:
+    """
+    Function that creates an instance of AsyncExercisesClient with a preconfigured HTTP client.
+
+    :param user: User authentication details.
+    :return: A ready-to-use AsyncExercisesClient.
+    """
+    return AsyncExercisesClient(await get_async_private_http_client(user))
@@ -1,10 +1,15 @@
 import allure
-from httpx import Response
 
-from clients.api_client import APIClient
-from clients.api_coverage import tracker
+from clients.api_client import APIClient, AsyncAPIClient
+from clients.api_coverage import track_coverage_httpx, track_coverage_httpx_async
+from clients.api_response import APIResponse
 from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema
-from clients.private_http_builder import AuthenticationUserSchema, get_private_http_client
+from clients.private_http_builder import (
+    AuthenticationUserSchema,
+    get_async_private_http_client,
+    get_private_http_client,
+)
+from tools.allure.steps import async_step
 from tools.routes import APIRoutes
 
 
@@ -14,40 +19,43 @@ class FilesClient(APIClient):
     """
 
     @allure.step("Get file by id {file_id}")
-    @tracker.track_coverage_httpx(f"{APIRoutes.FILES}/{{file_id}}")
-    def get_file_api(self, file_id: str) -> Response:
+    @track_coverage_httpx(f"{APIRoutes.FILES}/{{file_id}}")
+    def get_file_api(self, file_id: str) -> APIResponse:
         """
         Method to retrieve a file by its identifier.
 
         :param file_id: The identifier of the file.
-        :return: The server response as an httpx.Response object.
+        :return: The server response as an APIResponse object.
         """
         return self.get(f"{APIRoutes.FILES}/{file_id}")
 
     @allure.step("Create file")
-    @tracker.track_coverage_httpx(APIRoutes.FILES)
-    def create_file_api(self, request: CreateFileRequestSchema) -> Response:
+    @track_coverage_httpx(APIRoutes.FILES)
+    def create_file_api(self, request: CreateFileRequestSchema) -> APIResponse:
         """
         Method to create a new file.
 
+        The file is streamed from disk in chunks instead of being loaded into memory.
+
         :param request: CreateFileRequestSchema with file data including filename, directory and
         path to the file to upload.
-        :return: The server response as an httpx.Response object.
+        :return: The server response as an APIResponse object.
         """
-        return self.post(
-            url=APIRoutes.FILES,
-            data=request.model_dump(by_alias=True, exclude={"upload_file"}),
-            files={"upload_file": request.upload_file.read_bytes()},
-        )
+        with request.upload_file.open("rb") as upload_file:
+            return self.post(
+                url=APIRoutes.FILES,
+                data=request.model_dump(by_alias=True, exclude={"upload_file"}),
+                files={"upload_file": upload_file},
+            )
 
     @allure.step("Delete file by id {file_id}")
-    @tracker.track_coverage_httpx(f"{APIRoutes.FILES}/{{file_id}}")
-    def delete_file_api(self, file_id: str) -> Response:
+    @track_coverage_httpx(f"{APIRoutes.FILES}/{{file_id}}")
+    def delete_file_api(self, file_id: str) -> APIResponse:
         """
         Method to delete a file by its identifier.
 
         :param file_id: The identifier of the file.
-        :return: The server response as an httpx.Response object.
+        :return: The server response as an APIResponse object.
         """
         return self.delete(f"{APIRoutes.FILES}/{file_id}")
 
@@ -60,7 +68,7 @@ class FilesClient(APIClient):
         :return: CreateFileResponseSchema with data of the created file.
         """
         response = self.create_file_api(request)
-        return CreateFileResponseSchema.model_validate_json(response.text)
+        return response.parse(CreateFileResponseSchema)
 
 
 def get_files_client(user: AuthenticationUserSchema) -> FilesClient:
@@ -71,3 +79,71 @@ def get_files_client(user: AuthenticationUserSchema) -> FilesClient:
     :return: Ready-to-use FilesClient.
     """
     return FilesClient(client=get_private_http_client(user))
+
+
+class AsyncFilesClient(AsyncAPIClient):
+    """
+    Async client for working with /api/v1/files
+    """
+
+    @async_step("Get file by id {file_id}")
+    @track_coverage_httpx_async(f"{APIRoutes.FILES}/{{file_id}}")
+    async def get_file_api(self, file_id: str) -> APIResponse:
+        """
+        Method to retrieve a file by its identifier.
+
+        :param file_id: The identifier of the file.
+        :return: The server response as an APIResponse object.
+        """
+        return await self.get(f"{APIRoutes.FILES}/{file_id}")
+
+    @async_step("Create file")
+    @track_coverage_httpx_async(APIRoutes.FILES)
+    async def create_file_api(self, request: CreateFileRequestSchema) -> APIResponse:
+        """
+        Method to create a new file.
+
+        The file is streamed from disk in chunks instead of being loaded into memory.
+
+        :param request: CreateFileRequestSchema with file data including filename, directory and
+        path to the file to upload.
+        :return: The server response as an APIResponse object.
+        """
+        with request.upload_file.open("rb") as upload_file:
+            return await self.post(
+                url=APIRoutes.FILES,
+                data=request.model_dump(by_alias=True, exclude={"upload_file"}),
+                files={"upload_file": upload_file},
+            )
+
+    @async_step("Delete file by id {file_id}")
+    @track_coverage_httpx_async(f"{APIRoutes.FILES}/{{file_id}}")
+    async def delete_file_api(self, file_id: str) -> APIResponse:
+        """
+        Method to delete a file by its identifier.
+
+        :param file_id: The identifier of the file.
+        :return: The server response as an APIResponse object.
+        """
+        return await self.delete(f"{APIRoutes.FILES}/{file_id}")
+
+    async def create_file(self, request: CreateFileRequestSchema) -> CreateFileResponseSchema:
+        """
+        Method to create a new file and return the response data.
+
+        :param request: CreateFileRequestSchema with file data including filename, directory and
+        path to the file to upload.
+        :return: CreateFileResponseSchema with data of the created file.
+        """
+        response = await self.create_file_api(request)
+        return response.parse(CreateFileResponseSchema)
+
+
+async def get_async_files_client(user: AuthenticationUserSchema) -> AsyncFilesClient:
+    """
+    Function creates an instance of AsyncFilesClient with a pre-configured HTTP client.
+
+    :param user: User authentication data.
+    :return: Ready-to-use AsyncFilesClient.
+    """
+    return AsyncFilesClient(client=await get_async_private_http_client(user))
@@ -0,0 +1,115 @@
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from threading import Lock
+
+from httpx import Client
+from pydantic import BaseModel
+
+
+class HTTPClientRegistryStats(BaseModel):
+    """
+    Counters describing how the registry has been used.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+
+class HTTPClientRegistry:
+    """
+    Bounded cache of httpx.Client objects with LRU and TTL eviction.
+
+    A client that leaves the registry because it is full or the entry is older than the TTL
+    may still be used by whoever got it earlier (a running test, a provisioner thread),
+    so it is not closed right away: it is released when nothing references it anymore, and
+    the clients still referenced are closed by close() at the end of the session together
+    with the cached ones.
+    """
+
+    def __init__(self, max_size: int, ttl: float | None = None):
+        """
+        :param max_size: Maximum number of clients kept open at the same time.
+        :param ttl: Maximum age of a client in seconds. None disables TTL eviction.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+
+        self._lock = Lock()
+        self._clients: OrderedDict[Hashable, tuple[Client, float]] = OrderedDict()
+        self._evicted: weakref.WeakSet[Client] = weakref.WeakSet()
+        self._stats = HTTPClientRegistryStats()
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Client]) -> Client:
+        """
+        Returns the client stored under the key or creates it with the factory.
+
+        The factory is called outside the lock, so slow client creation (e.g., login)
+        for one key does not block other keys.
+
+        :param key: Key of the client (e.g., AuthenticationUserSchema).
+        :param factory: Function creating a new client for the key.
+        :return: Ready-to-use httpx.Client object.
+        """
+        with self._lock:
+            if client := self._get(key):
+                self._stats.hits += 1
+                return client
+
+            self._stats.misses += 1
+
+        client = factory()
+
+        with self._lock:
+            if existing := self._get(key):
+                client.close()
+                return existing
+
+            self._clients[key] = (client, time.monotonic())
+            while len(self._clients) > self.max_size:
+                _, (evicted, _) = self._clients.popitem(last=False)
+                self._evict(evicted)
+
+        return client
+
+    def close(self) -> None:
+        """
+        Closes all clients kept in the registry and the evicted clients still in use.
+        """
+        with self._lock:
+            for client, _ in self._clients.values():
+                client.close()
+
+            for client in list(self._evicted):
+                client.close()
+
+            self._clients.clear()
+            self._evicted.clear()
+
+    @property
+    def stats(self) -> HTTPClientRegistryStats:
+        """
+        :return: Snapshot of the registry counters.
+        """
+        with self._lock:
+            return self._stats.model_copy(update={"size": len(self._clients)})
+
+    def _get(self, key: Hashable) -> Client | None:
+        if (entry := self._clients.get(key)) is None:
+            return None
+
+        client, created_at = entry
+        if self.ttl is not None and time.monotonic() - created_at > self.ttl:
+            del self._clients[key]
+            self._evict(client)
+            return None
+
+        self._clients.move_to_end(key)
+        return client
+
+    def _evict(self, client: Client) -> None:
+        self._stats.evictions += 1
+        self._evicted.add(client)
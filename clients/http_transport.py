@@ -0,0 +1,50 @@
+from functools import cache
+
+from httpx import BaseTransport, HTTPTransport, Request, Response
+
+from config import settings
+
+
+class SharedHTTPTransport(BaseTransport):
+    """
+    Transport that shares one connection pool between many httpx.Client objects.
+
+    httpx.Client.close() also closes its transport, so the wrapper ignores close()
+    coming from individual clients. The underlying pool is closed once at the end of
+    the session with close_shared_http_transport().
+    """
+
+    def __init__(self, transport: HTTPTransport):
+        """
+        :param transport: Transport owning the shared connection pool.
+        """
+        self.transport = transport
+
+    def handle_request(self, request: Request) -> Response:
+        return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        pass
+
+
+@cache
+def get_shared_http_transport() -> SharedHTTPTransport:
+    """
+    Function returns the transport shared by all public and private sync clients.
+
+    :return: SharedHTTPTransport with pool limits from settings.http_client.
+    """
+    return SharedHTTPTransport(HTTPTransport(limits=settings.http_client.limits))
+
+
+def close_shared_http_transport() -> None:
+    """
+    Function closes the shared connection pool. Does nothing if the pool is not open.
+
+    A client created after the call opens a new pool, which has to be closed again.
+    """
+    if not get_shared_http_transport.cache_info().currsize:
+        return
+
+    get_shared_http_transport().transport.close()
+    get_shared_http_transport.cache_clear()
@@ -1,11 +1,29 @@
-from functools import lru_cache
-
-from httpx import Client
+from httpx import AsyncClient, Client
 from pydantic import BaseModel
 
-from clients.authentication.authentication_client import get_authentication_client
-from clients.authentication.authentication_schema import LoginRequestSchema
-from clients.event_hooks import curl_event_hook, log_request_event_hook, log_response_event_hook
+from clients.authentication.authentication_client import (
+    get_async_authentication_client,
+    get_authentication_client,
+)
+from clients.authentication.authentication_schema import LoginRequestSchema, TokenSchema
+from clients.authentication.bearer_auth import BearerAuth
+from clients.authentication.token_cache import get_token_cache
+from clients.event_hooks import (
+    async_curl_event_hook,
+    async_log_request_event_hook,
+    async_log_response_event_hook,
+    async_timing_request_event_hook,
+    async_timing_response_event_hook,
+    curl_event_hook,
+    get_async_track_resources_event_hook,
+    get_track_resources_event_hook,
+    log_request_event_hook,
+    log_response_event_hook,
+    timing_request_event_hook,
+    timing_response_event_hook,
+)
+from clients.http_client_registry import HTTPClientRegistry
+from clients.http_transport import get_shared_http_transport
 from config import settings
 
 
@@ -14,24 +32,103 @@ class AuthenticationUserSchema(BaseModel, frozen=True):
     password: str
 
 
-@lru_cache(maxsize=None)
+private_http_clients = HTTPClientRegistry(
+    max_size=settings.http_client.cache_max_size,
+    ttl=settings.http_client.cache_ttl,
+)
+
+
 def get_private_http_client(user: AuthenticationUserSchema) -> Client:
     """
-    Function creates an instance of httpx.Client with user authentication.
+    Function returns an instance of httpx.Client with user authentication.
+
+    Clients are cached per user in a bounded registry, evicted clients stay usable
+    until the end of the session.
 
     :param user: AuthenticationUserSchema object with user's email and password.
-    :return: Ready-to-use httpx.Client object with Authorization header set.
+    :return: Ready-to-use httpx.Client object authenticated as the user.
+    """
+    return private_http_clients.get_or_create(user, lambda: build_private_http_client(user))
+
+
+def build_private_http_client(user: AuthenticationUserSchema) -> Client:
+    """
+    Function creates a new instance of httpx.Client with user authentication.
+
+    The access token is taken from the token cache shared by all pytest-xdist workers,
+    so every user logs in only once per session. The client sends requests through the
+    shared connection pool, the token is applied per request by BearerAuth, which also
+    refreshes it before it expires.
+
+    :param user: AuthenticationUserSchema object with user's email and password.
+    :return: Ready-to-use httpx.Client object authenticated as the user.
+    """
+    cached_token = get_token_cache().get_or_login(user.email, lambda: login_user(user))
+
+    return Client(
+        auth=BearerAuth(user.email, cached_token, lambda: login_user(user)),
+        timeout=settings.http_client.timeout,
+        base_url=settings.http_client.client_url,
+        transport=get_shared_http_transport(),
+        event_hooks={
+            "request": [curl_event_hook, log_request_event_hook, timing_request_event_hook],
+            "response": [
+                timing_response_event_hook,
+                log_response_event_hook,
+                get_track_resources_event_hook(user.email),
+            ],
+        },
+    )
+
+
+def login_user(user: AuthenticationUserSchema) -> TokenSchema:
+    """
+    Function logs the user in, bypassing the token cache.
+
+    :param user: AuthenticationUserSchema object with user's email and password.
+    :return: Tokens returned by the login endpoint.
     """
     authentication_client = get_authentication_client()
     login_request = LoginRequestSchema(email=user.email, password=user.password)
-    login_response = authentication_client.login(login_request)
+    with authentication_client.client:
+        return authentication_client.login(login_request).token
 
-    return Client(
+
+async def get_async_private_http_client(user: AuthenticationUserSchema) -> AsyncClient:
+    """
+    Function creates an instance of httpx.AsyncClient with user authentication.
+
+    Unlike get_private_http_client the result is neither cached nor attached to the shared
+    connection pool: an httpx.AsyncClient and its connections are bound to the event loop
+    they were first used in, so they cannot be shared between asyncio.run calls.
+
+    :param user: AuthenticationUserSchema object with user's email and password.
+    :return: Ready-to-use httpx.AsyncClient object authenticated as the user.
+    """
+    token_cache = get_token_cache()
+    if not (cached_token := token_cache.get(user.email)):
+        authentication_client = get_async_authentication_client()
+        login_request = LoginRequestSchema(email=user.email, password=user.password)
+        async with authentication_client.client:
+            login_response = await authentication_client.login(login_request)
+
+        cached_token = token_cache.store(user.email, login_response.token)
+
+    return AsyncClient(
+        auth=BearerAuth(user.email, cached_token, lambda: login_user(user)),
         timeout=settings.http_client.timeout,
         base_url=settings.http_client.client_url,
-        headers={"Authorization": f"Bearer {login_response.token.access_token}"},
+        limits=settings.http_client.limits,
         event_hooks={
-            "request": [curl_event_hook, log_request_event_hook],
-            "response": [log_response_event_hook],
+            "request": [
+                async_curl_event_hook,
+                async_log_request_event_hook,
+                async_timing_request_event_hook,
+            ],
+            "response": [
+                async_timing_response_event_hook,
+                async_log_response_event_hook,
+                get_async_track_resources_event_hook(user.email),
+            ],
         },
     )
@@ -1,6 +1,20 @@
-from httpx import Client
+from httpx import AsyncClient, Client
 
-from clients.event_hooks import curl_event_hook, log_request_event_hook, log_response_event_hook
+from clients.event_hooks import (
+    async_curl_event_hook,
+    async_log_request_event_hook,
+    async_log_response_event_hook,
+    async_timing_request_event_hook,
+    async_timing_response_event_hook,
+    curl_event_hook,
+    get_async_track_resources_event_hook,
+    get_track_resources_event_hook,
+    log_request_event_hook,
+    log_response_event_hook,
+    timing_request_event_hook,
+    timing_response_event_hook,
+)
+from clients.http_transport import get_shared_http_transport
 from config import settings
 
 
@@ -8,13 +22,45 @@ def get_public_http_client() -> Client:
     """
     Function creates an instance of httpx.Client with basic settings.
 
+    The client sends requests through the shared connection pool.
+
     :return: Ready-to-use httpx.Client object.
     """
     return Client(
         timeout=settings.http_client.timeout,
         base_url=settings.http_client.client_url,
+        transport=get_shared_http_transport(),
+        event_hooks={
+            "request": [curl_event_hook, log_request_event_hook, timing_request_event_hook],
+            "response": [
+                timing_response_event_hook,
+                log_response_event_hook,
+                get_track_resources_event_hook(),
+            ],
+        },
+    )
+
+
+def get_async_public_http_client() -> AsyncClient:
+    """
+    Function creates an instance of httpx.AsyncClient with basic settings.
+
+    :return: Ready-to-use httpx.AsyncClient object.
+    """
+    return AsyncClient(
+        timeout=settings.http_client.timeout,
+        base_url=settings.http_client.client_url,
+        limits=settings.http_client.limits,
         event_hooks={
-            "request": [curl_event_hook, log_request_event_hook],
-            "response": [log_response_event_hook]
+            "request": [
+                async_curl_event_hook,
+                async_log_request_event_hook,
+                async_timing_request_event_hook,
+            ],
+            "response": [
+                async_timing_response_event_hook,
+                async_log_response_event_hook,
+                get_async_track_resources_event_hook(),
+            ],
         },
     )
@@ -0,0 +1,99 @@
+import time
+from collections.abc import Callable
+
+from httpx import Request, Response
+from pydantic import BaseModel
+
+from clients.api_coverage import get_current_client_method, get_current_endpoint
+
+TIMING_EXTENSION = "autotests_timing"
+
+RequestTimingListener = Callable[["RequestTimingSchema"], None]
+
+listeners: list[RequestTimingListener] = []
+
+
+class RequestTimingSchema(BaseModel):
+    """
+    Description of a timed request.
+
+    elapsed is the time from sending the request to receiving the response headers, in seconds.
+    client_method is the qualified name of the typed client method that sent the request.
+    """
+
+    method: str
+    endpoint: str
+    client_method: str | None = None
+    status_code: int
+    elapsed: float
+
+
+def add_request_timing_listener(listener: RequestTimingListener) -> None:
+    """
+    Subscribes the listener to the timings of all requests sent by the API clients.
+
+    :param listener: Function called with a RequestTimingSchema after every response.
+    """
+    listeners.append(listener)
+
+
+def remove_request_timing_listener(listener: RequestTimingListener) -> None:
+    """
+    :param listener: Listener previously passed to add_request_timing_listener.
+    """
+    listeners.remove(listener)
+
+
+def start_request_timing(request: Request) -> None:
+    """
+    Remembers when the request was sent, the endpoint template it was sent to
+    and the client method that sent it.
+
+    :param request: HTTPX request object.
+    """
+    request.extensions[TIMING_EXTENSION] = (
+        get_current_endpoint(),
+        get_current_client_method(),
+        time.perf_counter(),
+    )
+
+
+def finish_request_timing(response: Response) -> None:
+    """
+    Saves the elapsed time to the response extensions (see get_response_time)
+    and passes the timing of the request to the listeners.
+
+    Requests sent outside of the typed client methods are grouped by their URL path.
+
+    :param response: HTTPX response object.
+    """
+    finished_at = time.perf_counter()
+    if TIMING_EXTENSION not in response.request.extensions:
+        return
+
+    endpoint, client_method, started_at = response.request.extensions[TIMING_EXTENSION]
+    response.extensions[TIMING_EXTENSION] = finished_at - started_at
+    if not listeners:
+        return
+
+    timing = RequestTimingSchema(
+        method=response.request.method,
+        endpoint=endpoint or response.request.url.path,
+        client_method=client_method,
+        status_code=response.status_code,
+        elapsed=finished_at - started_at,
+    )
+    for listener in tuple(listeners):
+        listener(timing)
+
+
+def get_response_time(response: Response) -> float:
+    """
+    :param response: Response received by one of the API clients.
+    :return: Time from sending the request to receiving the response headers, in seconds.
+    Falls back to httpx's own elapsed time for responses that were not timed by the event hooks.
+    """
+    if (elapsed := response.extensions.get(TIMING_EXTENSION)) is not None:
+        return elapsed
+
+    return response.elapsed.total_seconds()
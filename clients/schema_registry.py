@@ -0,0 +1,150 @@
+import hashlib
+import importlib
+import json
+import os
+from functools import cache
+from pathlib import Path
+from threading import Lock
+
+import pydantic
+from pydantic import BaseModel
+
+from config import settings
+from tools.logger import get_logger
+
+logger = get_logger("SCHEMA_REGISTRY")
+
+CLIENTS_DIR = Path(__file__).parent
+
+
+def get_schema_modules() -> list[str]:
+    """
+    :return: Names of the modules describing API data, i.e. clients/*/*_schema.py
+    and clients/*_schema.py, sorted by name.
+    """
+    paths = [*CLIENTS_DIR.glob("*_schema.py"), *CLIENTS_DIR.glob("*/*_schema.py")]
+    return sorted(
+        ".".join(path.relative_to(CLIENTS_DIR.parent).with_suffix("").parts) for path in paths
+    )
+
+
+def get_model_key(model: type[BaseModel]) -> str:
+    """
+    :param model: Pydantic model.
+    :return: Unique name of the model, e.g. "clients.courses.courses_schema.CourseSchema".
+    """
+    return f"{model.__module__}.{model.__qualname__}"
+
+
+class JSONSchemaRegistry:
+    """
+    JSON schemas of the models from the schema modules, generated once per process.
+
+    Nested models (e.g., CourseSchema -> FileSchema, UserSchema) make model_json_schema()
+    expensive, so the schemas of all models are generated on first use and, if a cache directory
+    is given, saved to a file named after the hash of the schema modules' source code and the
+    pydantic version. Other processes and pytest-xdist workers load that file instead of
+    generating the schemas again; any change to the models produces a new hash.
+
+    The returned schemas are shared and must not be modified.
+    """
+
+    def __init__(self, modules: list[str], cache_dir: Path | None = None):
+        """
+        :param modules: Names of the modules to collect pydantic models from.
+        :param cache_dir: Directory of the persisted schemas. None disables persistence.
+        """
+        self.modules = modules
+        self.cache_dir = cache_dir
+
+        self._lock = Lock()
+        self._schemas: dict[str, dict] | None = None
+
+    def get(self, model: type[BaseModel]) -> dict:
+        """
+        :param model: Pydantic model, e.g. CreateCourseResponseSchema.
+        :return: JSON schema of the model. Models outside of the schema modules
+        are generated on first use.
+        """
+        schemas = self._load()
+        key = get_model_key(model)
+        if (schema := schemas.get(key)) is None:
+            schema = schemas.setdefault(key, model.model_json_schema())
+
+        return schema
+
+    def _load(self) -> dict[str, dict]:
+        if self._schemas is not None:
+            return self._schemas
+
+        with self._lock:
+            if self._schemas is None:
+                self._schemas = self._read() or self._generate()
+
+        return self._schemas
+
+    def _get_models(self) -> list[type[BaseModel]]:
+        models = []
+        for name in self.modules:
+            module = importlib.import_module(name)
+            models.extend(
+                value
+                for value in vars(module).values()
+                if isinstance(value, type)
+                and issubclass(value, BaseModel)
+                and value.__module__ == name
+            )
+
+        return models
+
+    def _get_path(self) -> Path | None:
+        if self.cache_dir is None:
+            return None
+
+        digest = hashlib.sha256(pydantic.VERSION.encode())
+        for name in self.modules:
+            digest.update(name.encode())
+            digest.update(Path(importlib.import_module(name).__file__).read_bytes())
+
+        return self.cache_dir.joinpath(f"{digest.hexdigest()}.json")
+
+    def _read(self) -> dict[str, dict] | None:
+        path = self._get_path()
+        if path is None or not path.exists():
+            return None
+
+        logger.info("Loading JSON schemas from %s", path)
+        return json.loads(path.read_text())
+
+    def _generate(self) -> dict[str, dict]:
+        models = self._get_models()
+        logger.info("Generating JSON schemas of %s models", len(models))
+        schemas = {get_model_key(model): model.model_json_schema() for model in models}
+
+        if path := self._get_path():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            temp_path.write_text(json.dumps(schemas))
+            temp_path.replace(path)
+
+        return schemas
+
+
+@cache
+def get_schema_registry() -> JSONSchemaRegistry:
+    """
+    Function returns the JSON schema registry of the current process.
+
+    :return: JSONSchemaRegistry of the models in clients/*/*_schema.py.
+    """
+    return JSONSchemaRegistry(get_schema_modules(), settings.schema_validation.cache_dir)
+
+
+def get_json_schema(model: type[BaseModel]) -> dict:
+    """
+    Returns the JSON schema of a model without generating it again.
+
+    :param model: Pydantic model, e.g. CreateCourseResponseSchema.
+    :return: JSON schema of the model. Must not be modified.
+    """
+    return get_schema_registry().get(model)
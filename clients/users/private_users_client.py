@@ -1,10 +1,15 @@
 import allure
-from httpx import Response
 
-from clients.api_client import APIClient
-from clients.api_coverage import tracker
-from clients.private_http_builder import AuthenticationUserSchema, get_private_http_client
+from clients.api_client import APIClient, AsyncAPIClient
+from clients.api_coverage import track_coverage_httpx, track_coverage_httpx_async
+from clients.api_response import APIResponse
+from clients.private_http_builder import (
+    AuthenticationUserSchema,
+    get_async_private_http_client,
+    get_private_http_client,
+)
 from clients.users.users_schema import GetUserResponseSchema, UpdateUserRequestSchema
+from tools.allure.steps import async_step
 from tools.routes import APIRoutes
 
 
@@ -14,46 +19,46 @@ class PrivateUsersClient(APIClient):
     """
 
     @allure.step("Get user me")
-    @tracker.track_coverage_httpx(f"{APIRoutes.USERS}/me")
-    def get_user_me_api(self) -> Response:
+    @track_coverage_httpx(f"{APIRoutes.USERS}/me")
+    def get_user_me_api(self) -> APIResponse:
         """
         Method to retrieve information about the current user.
 
-        :return: The server response as an httpx.Response object.
+        :return: The server response as an APIResponse object.
         """
         return self.get(f"{APIRoutes.USERS}/me")
 
     @allure.step("Get user by id {user_id}")
-    @tracker.track_coverage_httpx(f"{APIRoutes.USERS}/{{user_id}}")
-    def get_user_api(self, user_id: str) -> Response:
+    @track_coverage_httpx(f"{APIRoutes.USERS}/{{user_id}}")
+    def get_user_api(self, user_id: str) -> APIResponse:
         """
         Method to retrieve a user by their identifier.
 
         :param user_id: The identifier of the user.
-        :return: The server response as an httpx.Response object.
+        :return: The server response as an APIResponse object.
         """
         return self.get(f"{APIRoutes.USERS}/{user_id}")
 
     @allure.step("Update user by id {user_id}")
-    @tracker.track_coverage_httpx(f"{APIRoutes.USERS}/{{user_id}}")
-    def update_user_api(self, user_id: str, request: UpdateUserRequestSchema) -> Response:
+    @track_coverage_httpx(f"{APIRoutes.USERS}/{{user_id}}")
+    def update_user_api(self, user_id: str, request: UpdateUserRequestSchema) -> APIResponse:
         """
         Method to update a user by their identifier.
 
         :param user_id: The identifier of the user.
         :param request: UpdateUserRequestSchema with user data to update.
-        :return: The server response as an httpx.Response object.
+        :return: The server response as an APIResponse object.
         """
         return self.patch(f"{APIRoutes.USERS}/{user_id}", json=request.model_dump(by_alias=True))
 
     @allure.step("Delete user by id {user_id}")
-    @tracker.track_coverage_httpx(f"{APIRoutes.USERS}/{{user_id}}")
-    def delete_user_api(self, user_id: str) -> Response:
+    @track_coverage_httpx(f"{APIRoutes.USERS}/{{user_id}}")
+    def delete_user_api(self, user_id: str) -> APIResponse:
         """
         Method to delete a user by their identifier.
 
         :param user_id: The identifier of the user.
-        :return: The server response as an httpx.Response object.
+        :return: The server response as an APIResponse object.
         """
         return self.delete(f"{APIRoutes.USERS}/{user_id}")
 
@@ -65,7 +70,7 @@ class PrivateUsersClient(APIClient):
         :return: GetUserResponseSchema containing the user information.
         """
         response = self.get_user_api(user_id)
-        return GetUserResponseSchema.model_validate_json(response.text)
+        return response.parse(GetUserResponseSchema)
 
 
 def get_private_users_client(user: AuthenticationUserSchema) -> PrivateUsersClient:
@@ -76,3 +81,77 @@ def get_private_users_client(user: AuthenticationUserSchema) -> PrivateUsersClie
     :return: A ready-to-use PrivateUsersClient.
     """
     return PrivateUsersClient(client=get_private_http_client(user))
+
+
+class AsyncPrivateUsersClient(AsyncAPIClient):
+    """
+    Async client for working with /api/v1/users
+    """
+
+    @async_step("Get user me")
+    @track_coverage_httpx_async(f"{APIRoutes.USERS}/me")
+    async def get_user_me_api(self) -> APIResponse:
+        """
+        Method to retrieve information about the current user.
+
+        :return: The server response as an APIResponse object.
+        """
+        return await self.get(f"{APIRoutes.USERS}/me")
+
+    @async_step("Get user by id {user_id}")
+    @track_coverage_httpx_async(f"{APIRoutes.USERS}/{{user_id}}")
+    async def get_user_api(self, user_id: str) -> APIResponse:
+        """
+        Method to retrieve a user by their identifier.
+
+        :param user_id: The identifier of the user.
+        :return: The server response as an APIResponse object.
+        """
+        return await self.get(f"{APIRoutes.USERS}/{user_id}")
+
+    @async_step("Update user by id {user_id}")
+    @track_coverage_httpx_async(f"{APIRoutes.USERS}/{{user_id}}")
+    async def update_user_api(self, user_id: str, request: UpdateUserRequestSchema) -> APIResponse:
+        """
+        Method to update a user by their identifier.
+
+        :param user_id: The identifier of the user.
+        :param request: UpdateUserRequestSchema with user data to update.
+        :return: The server response as an APIResponse object.
+        """
+        return await self.patch(
+            f"{APIRoutes.USERS}/{user_id}", json=request.model_dump(by_alias=True)
+        )
+
+    @async_step("Delete user by id {user_id}")
+    @track_coverage_httpx_async(f"{APIRoutes.USERS}/{{user_id}}")
+    async def delete_user_api(self, user_id: str) -> APIResponse:
+        """
+        Method to delete a user by their identifier.
+
+        :param user_id: The identifier of the user.
+        :return: The server response as an APIResponse object.
+        """
+        return await self.delete(f"{APIRoutes.USERS}/{user_id}")
+
+    async def get_user(self, user_id: str) -> GetUserResponseSchema:
+        """
+        Method to retrieve a user by their identifier.
+
+        :param user_id: The identifier of the user.
+        :return: GetUserResponseSchema containing the user information.
+        """
+        response = await self.get_user_api(user_id)
+        return response.parse(GetUserResponseSchema)
+
+
+async def get_async_private_users_client(
+    user: AuthenticationUserSchema,
+) -> AsyncPrivateUsersClient:
+    """
+    Function that creates an instance of AsyncPrivateUsersClient with a preconfigured HTTP client.
+
+    :param user: User authentication details.
+    :return: A ready-to-use AsyncPrivateUsersClient.
+    """
+    return AsyncPrivateUsersClient(client=await get_async_private_http_client(user))
@@ -1,10 +1,11 @@
 import allure
-from httpx import Response
 
-from clients.api_client import APIClient
-from clients.api_coverage import tracker
-from clients.public_http_builder import get_public_http_client
+from clients.api_client import APIClient, AsyncAPIClient
+from clients.api_coverage import track_coverage_httpx, track_coverage_httpx_async
+from clients.api_response import APIResponse
+from clients.public_http_builder import get_async_public_http_client, get_public_http_client
 from clients.users.users_schema import CreateUserRequestSchema, CreateUserResponseSchema
+from tools.allure.steps import async_step
 from tools.routes import APIRoutes
 
 
@@ -14,13 +15,13 @@ class PublicUsersClient(APIClient):
     """
 
     @allure.step("Create user")
-    @tracker.track_coverage_httpx(APIRoutes.USERS)
-    def create_user_api(self, request: CreateUserRequestSchema) -> Response:
+    @track_coverage_httpx(APIRoutes.USERS)
+    def create_user_api(self, request: CreateUserRequestSchema) -> APIResponse:
         """
         This method sends a request to create a new user.
 
         :param request: A CreateUserRequestSchema object containing user data.
-        :return: The server response as an httpx.Response object.
+        :return: The server response as an APIResponse object.
         """
         return self.post(APIRoutes.USERS, json=request.model_dump(by_alias=True))
 
@@ -32,7 +33,7 @@ class PublicUsersClient(APIClient):
         :return: CreateUserResponseSchema object containing the created user information.
         """
         response = self.create_user_api(request)
-        return CreateUserResponseSchema.model_validate_json(response.text)
+        return response.parse(CreateUserResponseSchema)
 
 
 def get_public_users_client() -> PublicUsersClient:
@@ -42,3 +43,39 @@ def get_public_users_client() -> PublicUsersClient:
     :return: A ready-to-use PublicUsersClient.
     """
     return PublicUsersClient(client=get_public_http_client())
+
+
+class AsyncPublicUsersClient(AsyncAPIClient):
+    """
+    Async client for working with /api/v1/users
+    """
+
+    @async_step("Create user")
+    @track_coverage_httpx_async(APIRoutes.USERS)
+    async def create_user_api(self, request: CreateUserRequestSchema) -> APIResponse:
+        """
+        This method sends a request to create a new user.
+
+        :param request: A CreateUserRequestSchema object containing user data.
+        :return: The server response as an APIResponse object.
+        """
+        return await self.post(APIRoutes.USERS, json=request.model_dump(by_alias=True))
+
+    async def create_user(self, request: CreateUserRequestSchema) -> CreateUserResponseSchema:
+        """
+        This method creates a new user and returns the parsed response.
+
+        :param request: A CreateUserRequestSchema object containing user data.
+        :return: CreateUserResponseSchema object containing the created user information.
+        """
+        response = await self.create_user_api(request)
+        return response.parse(CreateUserResponseSchema)
+
+
+def get_async_public_users_client() -> AsyncPublicUsersClient:
+    """
+    This function creates an instance of AsyncPublicUsersClient with a pre-configured HTTP client.
+
+    :return: A ready-to-use AsyncPublicUsersClient.
+    """
+    return AsyncPublicUsersClient(client=get_async_public_http_client())
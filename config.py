@@ -1,17 +1,115 @@
-from typing import Self
+import tempfile
+from pathlib import Path
+from typing import Literal, Self
 
-from pydantic import BaseModel, DirectoryPath, FilePath, HttpUrl
+from httpx import Limits
+from pydantic import BaseModel, ByteSize, DirectoryPath, FilePath, HttpUrl, PositiveInt
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class HTTPClientConfig(BaseModel):
     url: HttpUrl
     timeout: float
+    cache_max_size: int = 64
+    cache_ttl: float | None = None
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 5.0
 
     @property
     def client_url(self) -> str:
         return str(self.url)
 
+    @property
+    def limits(self) -> Limits:
+        return Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+class AuthenticationConfig(BaseModel):
+    token_cache_dir: Path = Path(tempfile.gettempdir(), "autotests-api-tokens")
+    token_expiry_margin: float = 60
+    token_ttl: float = 1800
+
+
+class UserPoolConfig(BaseModel):
+    size: int = 10
+
+
+class ProvisioningConfig(BaseModel):
+    prebuild: int = 2
+    workers: int = 4
+
+
+class ResourcesConfig(BaseModel):
+    track: bool = True
+    teardown: bool = True
+    journal_dir: Path = Path(tempfile.gettempdir(), "autotests-api-resources")
+    teardown_workers: int = 8
+    teardown_batch_size: int = 20
+
+
+# Percentile of latency SLOs that don't set one: in LATENCY.SLOS and in the latency_slo marker
+DEFAULT_LATENCY_SLO_PERCENTILE = 95.0
+
+
+class LatencySLOConfig(BaseModel):
+    budget_ms: float
+    percentile: float = DEFAULT_LATENCY_SLO_PERCENTILE
+    endpoint: str | None = None
+    client_method: str | None = None
+
+
+class LatencyConfig(BaseModel):
+    report_file: Path = Path("./reports/latency-report.json")
+    slos: list[LatencySLOConfig] = []
+
+
+class SchemaValidationConfig(BaseModel):
+    backend: Literal["jsonschema", "fastjsonschema"] = "jsonschema"
+    cache_dir: Path | None = Path(tempfile.gettempdir(), "autotests-api-schemas")
+
+
+class BenchmarkConfig(BaseModel):
+    enabled: bool = False
+    file_sizes: list[ByteSize] = [ByteSize(64 * 1024), ByteSize(1024**2), ByteSize(16 * 1024**2)]
+    concurrency: list[PositiveInt] = [1, 4]
+    uploads: PositiveInt = 8
+    files_dir: Path = Path(tempfile.gettempdir(), "autotests-api-benchmark")
+    report_file: Path = Path("./reports/files-benchmark.json")
+
+
+class FakerConfig(BaseModel):
+    seed: int | None = None
+    pool_size: int = 0
+
+
+class LoggingConfig(BaseModel):
+    level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "DEBUG"
+    json_dir: Path | None = None
+    queued: bool = False
+
+
+class CurlConfig(BaseModel):
+    debug: bool = False
+    sample_rate: float = 0.0
+    buffer_size: int = 20
+    redact_headers: list[str] = ["Authorization", "Cookie", "X-API-Key"]
+    max_body_size: ByteSize | None = ByteSize(16 * 1024)
+
+
+class AllureConfig(BaseModel):
+    writer: Literal["sync", "background"] = "background"
+    compress_min_size: ByteSize | None = ByteSize(1024**2)
+    dedupe: bool = True
+
+
+class AssertionsConfig(BaseModel):
+    step_granularity: Literal["full", "summary", "failures"] = "full"
+
 
 class TestDataConfig(BaseModel):
     image_png_file: FilePath
@@ -27,6 +125,18 @@ class Settings(BaseSettings):
 
     test_data: TestDataConfig
     http_client: HTTPClientConfig
+    authentication: AuthenticationConfig = AuthenticationConfig()
+    user_pool: UserPoolConfig = UserPoolConfig()
+    provisioning: ProvisioningConfig = ProvisioningConfig()
+    resources: ResourcesConfig = ResourcesConfig()
+    latency: LatencyConfig = LatencyConfig()
+    schema_validation: SchemaValidationConfig = SchemaValidationConfig()
+    benchmark: BenchmarkConfig = BenchmarkConfig()
+    faker: FakerConfig = FakerConfig()
+    logging: LoggingConfig = LoggingConfig()
+    curl: CurlConfig = CurlConfig()
+    allure: AllureConfig = AllureConfig()
+    assertions: AssertionsConfig = AssertionsConfig()
     allure_results_dir: DirectoryPath
 
     @classmethod
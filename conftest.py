@@ -4,5 +4,12 @@ pytest_plugins = (
     "fixtures.courses",
     "fixtures.authentication",
     "fixtures.exercises",
+    "fixtures.fakers",
+    "fixtures.provisioning",
     "fixtures.allure",
+    "fixtures.http_clients",
+    "fixtures.resources",
+    "fixtures.latency",
+    "fixtures.logs",
+    "fixtures.curl",
 )
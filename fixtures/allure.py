@@ -1,9 +1,43 @@
+from functools import partial
+
+import allure_commons
+import allure_pytest.plugin
 import pytest
+from allure_commons.logger import AllureFileLogger
 
+from config import settings
 from tools.allure.environment import create_allure_environment_file
+from tools.allure.writer import BackgroundAllureFileLogger
 
 
 @pytest.fixture(scope="session", autouse=True)
 def save_allure_environment_file():
     yield
     create_allure_environment_file()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config):
+    """
+    With ALLURE.WRITER=background, makes allure-pytest write the results of --alluredir
+    with BackgroundAllureFileLogger instead of its synchronous file logger.
+
+    allure-pytest creates, registers and cleans up its file logger itself,
+    so only the class it instantiates is replaced.
+    """
+    if settings.allure.writer == "background":
+        allure_pytest.plugin.AllureFileLogger = partial(
+            BackgroundAllureFileLogger,
+            compress_min_size=settings.allure.compress_min_size,
+            dedupe=settings.allure.dedupe,
+        )
+
+
+def pytest_unconfigure(config: pytest.Config):
+    """
+    Waits until the background writer has written all results of the session.
+    """
+    allure_pytest.plugin.AllureFileLogger = AllureFileLogger
+    for plugin in allure_commons.plugin_manager.get_plugins():
+        if isinstance(plugin, BackgroundAllureFileLogger):
+            plugin.close()
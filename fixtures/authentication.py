@@ -4,6 +4,25 @@ from clients.authentication.authentication_client import (
     AuthenticationClient,
     get_authentication_client,
 )
+from clients.authentication.token_cache import get_token_cache, get_token_cache_run_id
+
+
+def pytest_configure(config: pytest.Config):
+    """
+    Creates the token cache run identifier before pytest-xdist spawns its workers,
+    so the controller and all workers share one token cache.
+    """
+    if not hasattr(config, "workerinput"):
+        get_token_cache_run_id()
+
+
+def pytest_unconfigure(config: pytest.Config):
+    """
+    Removes the token cache of the run once the controller (or the only process) finishes,
+    so no tokens outlive the run.
+    """
+    if not hasattr(config, "workerinput"):
+        get_token_cache().clear()
 
 
 @pytest.fixture
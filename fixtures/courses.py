@@ -24,20 +24,28 @@ def course_client(function_user: UserFixture) -> CoursesClient:
 
 @pytest.fixture
 def function_course(
-    course_client: CoursesClient, function_user: UserFixture, function_file: FileFixture
+    request: pytest.FixtureRequest,
+    course_client: CoursesClient,
+    function_user: UserFixture,
+    function_file: FileFixture,
 ) -> CourseFixture:
     """
     Creates a test course for the current test function.
     Generates a new course using the function-scoped user and file,
     and returns both the request and response objects.
+    If the test uses function_chain, the course of the chain is returned instead.
+    :param request: Pytest request of the current test.
     :param course_client: Client for course creation.
     :param function_user: The user fixture for the current test function.
     :param function_file: The file fixture for the current test function.
     :return: A CourseFixture containing request and response data.
     """
-    request = CreateCourseRequestSchema(
+    if "function_chain" in request.fixturenames:
+        return request.getfixturevalue("function_chain").course
+
+    create_request = CreateCourseRequestSchema(
         preview_file_id=function_file.response.file.id,
         created_by_user_id=function_user.response.user.id,
     )
-    response = course_client.create_course(request=request)
-    return CourseFixture(request=request, response=response)
+    response = course_client.create_course(request=create_request)
+    return CourseFixture(request=create_request, response=response)
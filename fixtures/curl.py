@@ -0,0 +1,34 @@
+import random
+
+import pytest
+
+from config import settings
+from tools.http.capture import get_curl_capture, start_curl_capture, stop_curl_capture
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_protocol(item: pytest.Item):
+    """
+    Captures the requests of every test for the cURL attachments, see tools.http.capture.
+
+    In debug mode (CURL.DEBUG) and for a random CURL.SAMPLE_RATE fraction of tests every request
+    is attached when it is sent; other tests attach their last requests only if they fail.
+    """
+    attach_all = settings.curl.debug or random.random() < settings.curl.sample_rate
+    start_curl_capture(settings.curl.buffer_size, attach_all)
+    try:
+        return (yield)
+    finally:
+        stop_curl_capture()
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
+    """
+    Attaches the cURL commands of the requests buffered so far when a test phase fails.
+    """
+    report: pytest.TestReport = yield
+    if report.failed and (capture := get_curl_capture()):
+        capture.attach_buffered()
+
+    return report
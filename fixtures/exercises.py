@@ -1,3 +1,5 @@
+from typing import TYPE_CHECKING
+
 import pytest
 from pydantic import BaseModel
 
@@ -6,9 +8,11 @@ from clients.exercises.exercises_schema import (
     CreateExerciseRequestSchema,
     CreateExerciseResponseSchema,
 )
-from fixtures.courses import CourseFixture
 from fixtures.users import UserFixture
 
+if TYPE_CHECKING:
+    from fixtures.provisioning import ChainFixture
+
 
 class ExercisesFixture(BaseModel):
     request: CreateExerciseRequestSchema
@@ -27,19 +31,15 @@ def exercise_client(function_user: UserFixture) -> ExercisesClient:
 
 
 @pytest.fixture
-def function_exercise(
-    exercise_client: ExercisesClient, function_course: CourseFixture
-) -> ExercisesFixture:
+def function_exercise(function_chain: "ChainFixture") -> ExercisesFixture:
     """
-    Creates a test exercise associated with the function-scoped course.
+    Provides a test exercise associated with the function-scoped course.
 
-    Generates a new exercise for each test function that requires it and returns
-    both the request and response objects.
+    The exercise is taken from the function-scoped chain, which is usually prebuilt
+    in the background, so function_user, function_file and function_course
+    of the same test are the entities the exercise belongs to.
 
-    :param exercise_client: Client for exercise creation.
-    :param function_course: The fixture providing the course to associate the exercise with.
+    :param function_chain: The fixture providing the user → file → course → exercise chain.
     :return: An ExercisesFixture containing request and response data for the created exercise.
     """
-    request = CreateExerciseRequestSchema(course_id=function_course.response.course.id)
-    response = exercise_client.create_exercise(request=request)
-    return ExercisesFixture(request=request, response=response)
+    return function_chain.exercise
@@ -0,0 +1,71 @@
+import os
+import random
+
+import pytest
+
+from clients.authentication.token_cache import get_token_cache_run_id
+from config import settings
+from tools.fakers import derive_seed, fake, get_email_namespace
+
+SEED_ENV = "FAKER_SESSION_SEED"
+
+
+def pytest_addoption(parser: pytest.Parser):
+    parser.addoption(
+        "--faker-seed",
+        type=int,
+        default=None,
+        help="Session seed of the fake data, e.g. the one printed by a failed run to replay it",
+    )
+
+
+def get_session_seed(config: pytest.Config) -> int:
+    """
+    Returns the session seed: --faker-seed, FAKER.SEED or a random one.
+
+    The seed is kept in an environment variable, so pytest-xdist workers spawned
+    by the controller inherit the seed chosen by the controller.
+
+    :param config: Pytest config.
+    :return: Seed of the session.
+    """
+    seed = config.getoption("--faker-seed")
+    if seed is None:
+        seed = settings.faker.seed
+
+    if seed is None:
+        seed = int(os.environ.setdefault(SEED_ENV, str(random.getrandbits(32))))
+
+    return seed
+
+
+def pytest_configure(config: pytest.Config):
+    """
+    Seeds the fake data with the session seed and makes the emails of every worker unique.
+    """
+    fake.namespace = get_email_namespace(get_token_cache_run_id())
+    fake.seed(derive_seed(get_session_seed(config)))
+
+
+def pytest_report_header(config: pytest.Config) -> str:
+    seed = get_session_seed(config)
+    return f"faker seed: {seed} (replay with --faker-seed={seed})"
+
+
+def pytest_sessionstart(session: pytest.Session):
+    """
+    Pre-generates the pools of fake data (FAKER.POOL_SIZE) before the first test runs.
+    """
+    fake.warm_up()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item: pytest.Item):
+    """
+    Re-seeds the fake data before every test with a seed derived from the session seed
+    and the test node ID, so the data of a test doesn't depend on the tests that ran before it
+    or on the worker it runs on. The session seed is saved to the test's user properties.
+    """
+    seed = get_session_seed(item.config)
+    item.user_properties.append(("faker_seed", seed))
+    fake.seed(derive_seed(seed, item.nodeid))
@@ -1,3 +1,9 @@
+import os
+import shutil
+from collections.abc import Callable, Iterator
+from functools import cache
+from pathlib import Path
+
 import pytest
 from pydantic import BaseModel
 
@@ -6,6 +12,7 @@ from config import settings
 from clients.files.files_client import FilesClient, get_files_client
 from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema
 from fixtures.users import UserFixture
+from tools.benchmark.uploads import generate_file
 
 
 class FileFixture(BaseModel):
@@ -24,15 +31,38 @@ def files_client(function_user: UserFixture) -> FilesClient:
 
 
 @pytest.fixture
-def function_file(files_client: FilesClient) -> FileFixture:
+def function_file(request: pytest.FixtureRequest, files_client: FilesClient) -> FileFixture:
     """
     Creates a test file for the current test function.
     Uploads a predefined file using the function-scoped files client.
+    If the test uses function_chain, the file of the chain is returned instead.
+    :param request: Pytest request of the current test.
     :param files_client: Client for file operations, authenticated as the function user.
     :return: A FilesFixture containing the request and response data for the created file.
     """
-    request = CreateFileRequestSchema(
+    if "function_chain" in request.fixturenames:
+        return request.getfixturevalue("function_chain").file
+
+    create_request = CreateFileRequestSchema(
         upload_file=settings.test_data.image_png_file
     )
-    response = files_client.create_file(request=request)
-    return FileFixture(request=request, response=response)
+    response = files_client.create_file(request=create_request)
+    return FileFixture(request=create_request, response=response)
+
+
+@pytest.fixture(scope="session")
+def benchmark_file_factory() -> Iterator[Callable[[int], Path]]:
+    """
+    Generates synthetic files for the upload benchmarks on demand, one per size,
+    in a directory of the current process that is removed at the end of the session.
+    :return: Function returning the path of a generated file of the given size in bytes.
+    """
+    directory = settings.benchmark.files_dir.joinpath(str(os.getpid()))
+    directory.mkdir(parents=True, exist_ok=True)
+
+    @cache
+    def get_benchmark_file(size: int) -> Path:
+        return generate_file(directory.joinpath(f"{size}.bin"), size)
+
+    yield get_benchmark_file
+    shutil.rmtree(directory, ignore_errors=True)
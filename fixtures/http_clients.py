@@ -0,0 +1,27 @@
+import pytest
+
+from clients.http_transport import close_shared_http_transport
+from clients.private_http_builder import private_http_clients
+from tools.logger import get_logger
+
+logger = get_logger("HTTP_CLIENTS_FIXTURES")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def close_http_clients():
+    """
+    Closes all cached private HTTP clients and the shared connection pool at the end
+    of the session and logs the registry hit/miss/eviction counters.
+    """
+    yield
+
+    stats = private_http_clients.stats
+    logger.info(
+        "Private HTTP clients registry: hits=%s, misses=%s, evictions=%s, open=%s",
+        stats.hits,
+        stats.misses,
+        stats.evictions,
+        stats.size,
+    )
+    private_http_clients.close()
+    close_shared_http_transport()
@@ -0,0 +1,91 @@
+import threading
+from pathlib import Path
+
+import allure
+import pytest
+from pydantic import TypeAdapter
+
+from clients.request_timings import add_request_timing_listener, remove_request_timing_listener
+from config import settings
+from tools.allure.session import report_session_attachment
+from tools.assertions.latency import assert_latency_slo
+from tools.latency.recorder import EndpointLatencySchema, LatencyRecorder, get_latency_recorder
+from tools.logger import get_logger
+
+WORKER_OUTPUT_KEY = "latency"
+
+logger = get_logger("LATENCY_FIXTURES")
+
+
+def pytest_configure(config: pytest.Config):
+    """
+    Starts recording the latency of every request sent by the API clients of this process.
+    """
+    add_request_timing_listener(get_latency_recorder().record)
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item: pytest.Item):
+    """
+    Checks the latency SLOs of tests marked with @pytest.mark.latency_slo(budget_ms, ...).
+
+    Only the requests sent by the test itself count: requests of fixtures are sent during setup
+    and requests of background threads (e.g., prebuilt chains) are sent from other threads.
+    """
+    markers = list(item.iter_markers("latency_slo"))
+    if not markers:
+        return (yield)
+
+    recorder = LatencyRecorder(thread_id=threading.get_ident())
+    add_request_timing_listener(recorder.record)
+    try:
+        result = yield
+    finally:
+        remove_request_timing_listener(recorder.record)
+
+    for marker in markers:
+        assert_latency_slo(recorder, *marker.args, name=item.name, **marker.kwargs)
+
+    return result
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """
+    Merges the histograms sent by a finished pytest-xdist worker into the controller's recorder.
+    """
+    if data := getattr(node, "workeroutput", {}).get(WORKER_OUTPUT_KEY):
+        get_latency_recorder().merge_dict(data)
+
+
+def pytest_sessionfinish(session: pytest.Session):
+    """
+    Workers send their histograms to the controller. The controller (or the only process)
+    writes p50/p90/p99/max per endpoint to settings.latency.report_file and to the Allure report
+    and fails the run if the merged histograms violate any of settings.latency.slos.
+    """
+    config = session.config
+    if hasattr(config, "workerinput"):
+        config.workeroutput[WORKER_OUTPUT_KEY] = get_latency_recorder().to_dict()
+        return
+
+    for slo in settings.latency.slos:
+        try:
+            assert_latency_slo(get_latency_recorder(), **slo.model_dump(exclude_none=True))
+        except AssertionError as error:
+            logger.error("%s", error)
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    report = get_latency_recorder().build_report()
+    if not report:
+        return
+
+    body = TypeAdapter(list[EndpointLatencySchema]).dump_json(report, indent=2).decode()
+    settings.latency.report_file.parent.mkdir(parents=True, exist_ok=True)
+    settings.latency.report_file.write_text(body)
+    logger.info("Latency of %s endpoints saved to %s", len(report), settings.latency.report_file)
+
+    if report_dir := getattr(config.option, "allure_report_dir", None):
+        report_session_attachment(
+            Path(report_dir), "Endpoint latency", body, allure.attachment_type.JSON
+        )
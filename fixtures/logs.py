@@ -0,0 +1,19 @@
+import pytest
+
+from tools.logger import flush_logs
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_logreport(report: pytest.TestReport):
+    """
+    Writes the queued logs of the test phase before pytest prints its result.
+    """
+    flush_logs()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_terminal_summary():
+    """
+    Writes the queued logs of the session (e.g., of the teardown) before the summary.
+    """
+    flush_logs()
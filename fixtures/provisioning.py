@@ -0,0 +1,111 @@
+from collections.abc import Generator
+
+import pytest
+from pydantic import BaseModel
+
+from clients.courses.courses_client import get_courses_client
+from clients.courses.courses_schema import CreateCourseRequestSchema
+from clients.exercises.exercises_client import get_exercises_client
+from clients.exercises.exercises_schema import CreateExerciseRequestSchema
+from clients.files.files_client import get_files_client
+from clients.files.files_schema import CreateFileRequestSchema
+from clients.users.public_users_client import PublicUsersClient
+from config import settings
+from fixtures.courses import CourseFixture
+from fixtures.exercises import ExercisesFixture
+from fixtures.fakers import get_session_seed
+from fixtures.files import FileFixture
+from fixtures.users import UserFixture, UserPool, create_user
+from tools.provisioning import Provisioner, ProvisioningGraph
+
+
+class ChainFixture(BaseModel):
+    user: UserFixture
+    file: FileFixture
+    course: CourseFixture
+    exercise: ExercisesFixture
+
+
+def build_chain_graph(user_pool: UserPool) -> ProvisioningGraph:
+    """
+    Describes how the entities of a user → file → course → exercise chain depend on each other.
+
+    :param user_pool: Pool the chain users are leased from.
+    :return: ProvisioningGraph of the chain.
+    """
+
+    def create_file(user: UserFixture) -> FileFixture:
+        request = CreateFileRequestSchema(upload_file=settings.test_data.image_png_file)
+        response = get_files_client(user.authentication_user).create_file(request)
+        return FileFixture(request=request, response=response)
+
+    def create_course(user: UserFixture, file: FileFixture) -> CourseFixture:
+        request = CreateCourseRequestSchema(
+            preview_file_id=file.response.file.id, created_by_user_id=user.response.user.id
+        )
+        response = get_courses_client(user.authentication_user).create_course(request)
+        return CourseFixture(request=request, response=response)
+
+    def create_exercise(user: UserFixture, course: CourseFixture) -> ExercisesFixture:
+        request = CreateExerciseRequestSchema(course_id=course.response.course.id)
+        response = get_exercises_client(user.authentication_user).create_exercise(request)
+        return ExercisesFixture(request=request, response=response)
+
+    return (
+        ProvisioningGraph()
+        .add("user", user_pool.lease)
+        .add("file", create_file, depends_on=("user",))
+        .add("course", create_course, depends_on=("user", "file"))
+        .add("exercise", create_exercise, depends_on=("user", "course"))
+    )
+
+
+@pytest.fixture(scope="session")
+def provisioner(
+    pytestconfig: pytest.Config, user_pool: UserPool
+) -> Generator[Provisioner, None, None]:
+    """
+    Provides a provisioner of course/exercise chains for the session.
+    Starts building settings.provisioning.prebuild chains in the background right away.
+    The fake data of the chains is seeded with the session seed, see Provisioner.
+    :param pytestconfig: Pytest config holding the session seed.
+    :param user_pool: Pool the chain users are leased from.
+    :return: A started Provisioner
+    """
+    provisioner = Provisioner(
+        graph=build_chain_graph(user_pool),
+        prebuild=settings.provisioning.prebuild,
+        workers=settings.provisioning.workers,
+        seed=get_session_seed(pytestconfig),
+    )
+    provisioner.start()
+    yield provisioner
+
+    for chain in provisioner.shutdown():
+        user_pool.release(chain["user"])
+
+
+@pytest.fixture
+def function_chain(
+    request: pytest.FixtureRequest,
+    provisioner: Provisioner,
+    user_pool: UserPool,
+    public_users_client: PublicUsersClient,
+) -> Generator[ChainFixture, None, None]:
+    """
+    Provides a user with a file, a course and an exercise for the current test function.
+    Takes a chain prebuilt in the background, so the test does not wait for four requests in a row.
+    Tests marked with @pytest.mark.dirty_user get a chain built for a brand-new user.
+    :param request: Pytest request of the current test
+    :param provisioner: Provisioner of the chains
+    :param user_pool: Pool the chain user is returned to after the test
+    :param public_users_client: Client for user creation
+    :return: A ChainFixture with all entities of the chain
+    """
+    if request.node.get_closest_marker("dirty_user"):
+        yield ChainFixture(**provisioner.build({"user": create_user(public_users_client)}))
+        return
+
+    chain = ChainFixture(**provisioner.take())
+    yield chain
+    user_pool.release(chain.user)
@@ -0,0 +1,59 @@
+import shutil
+
+import pytest
+
+from clients.http_transport import close_shared_http_transport
+from config import settings
+from tools.logger import get_logger
+from tools.resources.registry import get_resource_journal_dir, read_resources
+from tools.resources.teardown import ResourceTeardown, cache_owner_tokens
+
+logger = get_logger("RESOURCES_FIXTURES")
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session: pytest.Session):
+    """
+    Deletes every entity created during the run once the controller (or the only process)
+    finishes, i.e. after all pytest-xdist workers have finished their tests.
+
+    The journals are kept if some entities could not be deleted, so the sweeper can retry later.
+
+    Passwords are not journaled: every worker makes sure the users it created have a cached
+    token, which the controller then uses to delete their entities.
+
+    Both log users in through the shared connection pool, which the close_http_clients fixture
+    has already closed by now, so the pool is closed once more when they are done.
+    """
+    if not settings.resources.teardown:
+        return
+
+    try:
+        if hasattr(session.config, "workerinput"):
+            _cache_owner_tokens()
+        else:
+            _delete_resources()
+    finally:
+        close_shared_http_transport()
+
+
+def _cache_owner_tokens() -> None:
+    if failed := cache_owner_tokens():
+        logger.warning("Entities of %s users cannot be deleted", len(failed))
+
+
+def _delete_resources() -> None:
+    directory = get_resource_journal_dir()
+    resources = read_resources(directory)
+    if not resources:
+        return
+
+    teardown = ResourceTeardown(
+        workers=settings.resources.teardown_workers,
+        batch_size=settings.resources.teardown_batch_size,
+    )
+    if failed := teardown.run(resources):
+        logger.warning("%s entities were left, run tools.resources.sweeper to retry", len(failed))
+        return
+
+    shutil.rmtree(directory, ignore_errors=True)
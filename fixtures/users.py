@@ -1,10 +1,23 @@
+import asyncio
+from collections import deque
+from collections.abc import Generator
+from threading import Lock
+
 import pytest
 from pydantic import BaseModel, EmailStr
 
+from clients.authentication.authentication_client import get_async_authentication_client
+from clients.authentication.authentication_schema import LoginRequestSchema
+from clients.authentication.token_cache import get_token_cache
 from clients.private_http_builder import AuthenticationUserSchema
 from clients.users.private_users_client import PrivateUsersClient, get_private_users_client
-from clients.users.public_users_client import PublicUsersClient, get_public_users_client
+from clients.users.public_users_client import (
+    PublicUsersClient,
+    get_async_public_users_client,
+    get_public_users_client,
+)
 from clients.users.users_schema import CreateUserRequestSchema, CreateUserResponseSchema
+from config import settings
 
 
 class UserFixture(BaseModel):
@@ -24,6 +37,84 @@ class UserFixture(BaseModel):
         return AuthenticationUserSchema(email=self.email, password=self.password)
 
 
+class UserPool:
+    """
+    Pool of pre-created and logged-in users leased to tests.
+
+    The pool lives per session, i.e. per pytest-xdist worker, so leased users are never
+    shared between workers. If all users are leased, a new one is created on demand.
+    """
+
+    def __init__(self, public_users_client: PublicUsersClient):
+        """
+        :param public_users_client: Client used to create users on demand.
+        """
+        self.public_users_client = public_users_client
+
+        self._lock = Lock()
+        self._users: deque[UserFixture] = deque()
+
+    def fill(self, size: int) -> None:
+        """
+        Creates and logs in the given number of users concurrently.
+
+        :param size: Number of users to add to the pool.
+        """
+        users = asyncio.run(self._create_users(size))
+
+        with self._lock:
+            self._users.extend(users)
+
+    def lease(self) -> UserFixture:
+        """
+        :return: A user that is not used by any other test.
+        """
+        with self._lock:
+            if self._users:
+                return self._users.popleft()
+
+        return create_user(self.public_users_client)
+
+    def release(self, user: UserFixture) -> None:
+        """
+        Returns a leased user back to the pool.
+
+        :param user: The user returned by lease().
+        """
+        with self._lock:
+            self._users.append(user)
+
+    @staticmethod
+    async def _create_users(size: int) -> list[UserFixture]:
+        public_users_client = get_async_public_users_client()
+        authentication_client = get_async_authentication_client()
+
+        async def create() -> UserFixture:
+            request = CreateUserRequestSchema()
+            response = await public_users_client.create_user(request)
+
+            login_request = LoginRequestSchema(email=request.email, password=request.password)
+            login_response = await authentication_client.login(login_request)
+            get_token_cache().store(request.email, login_response.token)
+
+            return UserFixture(request=request, response=response)
+
+        async with public_users_client.client, authentication_client.client:
+            return list(await asyncio.gather(*(create() for _ in range(size))))
+
+
+def create_user(public_users_client: PublicUsersClient) -> UserFixture:
+    """
+    Creates a new user.
+
+    :param public_users_client: Client for user creation.
+    :return: A UserFixture containing request and response data.
+    """
+    request = CreateUserRequestSchema()
+    response = public_users_client.create_user(request)
+    return UserFixture(request=request, response=response)
+
+
 @pytest.fixture
 def public_users_client() -> PublicUsersClient:
     """
@@ -34,18 +125,43 @@ def public_users_client() -> PublicUsersClient:
     return get_public_users_client()
 
 
+@pytest.fixture(scope="session")
+def user_pool() -> UserPool:
+    """
+    Provides a pool of pre-created users for the session (i.e. for the pytest-xdist worker).
+    Creates settings.user_pool.size users concurrently when the first test needs a user.
+    :return: A filled UserPool
+    """
+    pool = UserPool(public_users_client=get_public_users_client())
+    pool.fill(settings.user_pool.size)
+    return pool
+
+
 @pytest.fixture
-def function_user(public_users_client: PublicUsersClient) -> UserFixture:
+def function_user(
+    request: pytest.FixtureRequest, user_pool: UserPool, public_users_client: PublicUsersClient
+) -> Generator[UserFixture, None, None]:
     """
-    Creates a test user for the current test function.
-    Generates a new user for each test function that requires it and returns
-    both the request and response objects.
+    Provides a test user for the current test function.
+    Leases a pre-created user from the pool and returns it to the pool after the test.
+    Tests marked with @pytest.mark.dirty_user get a brand-new user that is never reused.
+    If the test uses function_chain, the user of the chain is returned instead.
+    :param request: Pytest request of the current test
+    :param user_pool: Pool of pre-created users
     :param public_users_client: Client for user creation
     :return: A UserFixture containing request and response data
     """
-    request = CreateUserRequestSchema()
-    response = public_users_client.create_user(request)
-    return UserFixture(request=request, response=response)
+    if "function_chain" in request.fixturenames:
+        yield request.getfixturevalue("function_chain").user
+        return
+
+    if request.node.get_closest_marker("dirty_user"):
+        yield create_user(public_users_client)
+        return
+
+    user = user_pool.lease()
+    yield user
+    user_pool.release(user)
 
 
 @pytest.fixture
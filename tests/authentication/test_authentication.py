@@ -29,8 +29,8 @@ class TestAuthentication:
     def test_login(self, function_user: UserFixture, authentication_client: AuthenticationClient):
         request = LoginRequestSchema(email=function_user.email, password=function_user.password)
         response = authentication_client.login_api(request)
-        response_data = LoginResponseSchema.model_validate_json(response.text)
+        response_data = response.parse(LoginResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_login_response(response_data)
-        validate_json_schema(instance=response.json(), schema=response_data.model_json_schema())
+        validate_json_schema(instance=response.json(), schema=LoginResponseSchema)
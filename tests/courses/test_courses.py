@@ -52,17 +52,18 @@ class TestCourses:
             created_by_user_id=function_user.response.user.id,
         )
         response = course_client.create_course_api(request)
-        response_data = CreateCourseResponseSchema.model_validate_json(response.text)
+        response_data = response.parse(CreateCourseResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_create_course_response(request, response_data)
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), CreateCourseResponseSchema)
 
     @allure.tag(AllureTag.GET_ENTITIES)
     @allure.story(AllureStory.GET_ENTITIES)
     @allure.severity(Severity.BLOCKER)
     @allure.title("Get courses")
     @allure.sub_suite(AllureStory.GET_ENTITIES)
+    @pytest.mark.dirty_user
     def test_get_courses(
         self,
         course_client: CoursesClient,
@@ -71,14 +72,14 @@ class TestCourses:
     ):
         query = GetCoursesQuerySchema(user_id=function_user.response.user.id)
         response = course_client.get_courses_api(query)
-        response_data = GetCoursesResponseSchema.model_validate_json(response.text)
+        response_data = response.parse(GetCoursesResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_get_courses_response(
             response_data,
             [function_course.response],
         )
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), GetCoursesResponseSchema)
 
     @allure.tag(AllureTag.UPDATE_ENTITY)
     @allure.story(AllureStory.UPDATE_ENTITY)
@@ -91,8 +92,8 @@ class TestCourses:
             function_course.response.course.id,
             request,
         )
-        response_data = UpdateCourseResponseSchema.model_validate_json(response.text)
+        response_data = response.parse(UpdateCourseResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_update_course_response(request, response_data)
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), UpdateCourseResponseSchema)
@@ -51,11 +51,11 @@ class TestExercises:
     ):
         request = CreateExerciseRequestSchema(course_id=function_course.response.course.id)
         response = exercise_client.create_exercise_api(request)
-        response_data = CreateExerciseResponseSchema.model_validate_json(response.text)
+        response_data = response.parse(CreateExerciseResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_create_exercise_response(request, response_data)
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), CreateExerciseResponseSchema)
 
     @allure.tag(AllureTag.GET_ENTITY)
     @allure.story(AllureStory.GET_ENTITY)
@@ -68,14 +68,14 @@ class TestExercises:
         function_exercise: ExercisesFixture,
     ):
         response = exercise_client.get_exercise_api(exercise_id=function_exercise.response.exercise.id)
-        response_data = GetExerciseResponseSchema.model_validate_json(response.text)
+        response_data = response.parse(GetExerciseResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_get_exercise_response(
             response_data,
             function_exercise.response,
         )
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), GetExerciseResponseSchema)
 
     @allure.tag(AllureTag.UPDATE_ENTITY)
     @allure.story(AllureStory.UPDATE_ENTITY)
@@ -92,11 +92,11 @@ class TestExercises:
             function_exercise.response.exercise.id,
             request,
         )
-        response_data = UpdateExerciseResponseSchema.model_validate_json(response.text)
+        response_data = response.parse(UpdateExerciseResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_update_exercise_response(request, response_data)
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), UpdateExerciseResponseSchema)
 
     @allure.tag(AllureTag.DELETE_ENTITY)
     @allure.story(AllureStory.DELETE_ENTITY)
@@ -112,12 +112,12 @@ class TestExercises:
         assert_status_code(delete_response.status_code, HTTPStatus.OK)
 
         get_response = exercise_client.get_exercise_api(function_exercise.response.exercise.id)
-        get_response_data = InternalErrorResponseSchema.model_validate_json(get_response.text)
+        get_response_data = get_response.parse(InternalErrorResponseSchema)
 
         assert_status_code(get_response.status_code, HTTPStatus.NOT_FOUND)
         assert_exercise_not_found_response(get_response_data)
 
-        validate_json_schema(get_response.json(), get_response_data.model_json_schema())
+        validate_json_schema(get_response.json(), InternalErrorResponseSchema)
 
     @allure.tag(AllureTag.GET_ENTITIES)
     @allure.story(AllureStory.GET_ENTITIES)
@@ -132,11 +132,11 @@ class TestExercises:
     ):
         query = GetExercisesQuerySchema(course_id=function_course.response.course.id)
         response = exercise_client.get_exercises_api(query)
-        response_data = GetExercisesResponseSchema.model_validate_json(response.text)
+        response_data = response.parse(GetExercisesResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_get_exercises_response(
             response_data,
             [function_exercise.response],
         )
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), GetExercisesResponseSchema)
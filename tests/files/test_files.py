@@ -44,11 +44,11 @@ class TestFiles:
     def test_create_file(self, files_client: FilesClient):
         request = CreateFileRequestSchema(upload_file=settings.test_data.image_png_file)
         response = files_client.create_file_api(request)
-        response_data = CreateFileResponseSchema.model_validate_json(response.text)
+        response_data = response.parse(CreateFileResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_create_file_response(request, response_data)
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), CreateFileResponseSchema)
 
     @allure.tag(AllureTag.GET_ENTITY)
     @allure.story(AllureStory.GET_ENTITY)
@@ -57,11 +57,11 @@ class TestFiles:
     @allure.sub_suite(AllureStory.GET_ENTITY)
     def test_get_file(self, files_client: FilesClient, function_file: FileFixture):
         response = files_client.get_file_api(function_file.response.file.id)
-        response_data = GetFileResponseSchema.model_validate_json(response.text)
+        response_data = response.parse(GetFileResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_get_file_response(response_data, function_file.response)
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), GetFileResponseSchema)
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
     @allure.story(AllureStory.VALIDATE_ENTITY)
@@ -74,11 +74,11 @@ class TestFiles:
             upload_file=settings.test_data.image_png_file,
         )
         response = files_client.create_file_api(request)
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.parse(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_create_file_with_empty_filename_response(response_data)
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
     @allure.story(AllureStory.VALIDATE_ENTITY)
@@ -91,11 +91,11 @@ class TestFiles:
             upload_file=settings.test_data.image_png_file,
         )
         response = files_client.create_file_api(request)
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.parse(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_create_file_with_empty_directory_response(response_data)
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
 
     @allure.tag(AllureTag.DELETE_ENTITY)
     @allure.story(AllureStory.DELETE_ENTITY)
@@ -107,12 +107,12 @@ class TestFiles:
         assert_status_code(delete_response.status_code, HTTPStatus.OK)
 
         get_response = files_client.get_file_api(function_file.response.file.id)
-        get_response_data = InternalErrorResponseSchema.model_validate_json(get_response.text)
+        get_response_data = get_response.parse(InternalErrorResponseSchema)
 
         assert_status_code(get_response.status_code, HTTPStatus.NOT_FOUND)
         assert_file_not_found_response(get_response_data)
 
-        validate_json_schema(get_response.json(), get_response_data.model_json_schema())
+        validate_json_schema(get_response.json(), InternalErrorResponseSchema)
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
     @allure.story(AllureStory.VALIDATE_ENTITY)
@@ -121,8 +121,8 @@ class TestFiles:
     @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
     def test_get_file_with_incorrect_file_id(self, files_client: FilesClient):
         response = files_client.get_file_api(file_id="incorrect-file-id")
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.parse(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_get_file_with_incorrect_file_id_response(response_data)
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
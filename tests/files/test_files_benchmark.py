@@ -0,0 +1,58 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import allure
+import pytest
+from allure_commons.types import Severity
+from pydantic import ByteSize
+
+from clients.files.files_client import FilesClient
+from config import settings
+from tools.allure.epics import AllureEpic
+from tools.allure.features import AllureFeature
+from tools.allure.stories import AllureStory
+from tools.allure.tag import AllureTag
+from tools.benchmark.uploads import run_upload_benchmark, save_upload_benchmark
+
+
+@pytest.mark.files
+@pytest.mark.benchmark
+@pytest.mark.skipif(not settings.benchmark.enabled, reason="BENCHMARK.ENABLED is false")
+@allure.epic(AllureEpic.LMS)
+@allure.feature(AllureFeature.FILES)
+@allure.parent_suite(AllureEpic.LMS)
+@allure.suite(AllureFeature.FILES)
+class TestFilesBenchmark:
+    @allure.tag(AllureTag.BENCHMARK)
+    @allure.story(AllureStory.BENCHMARK)
+    @allure.severity(Severity.NORMAL)
+    @allure.title("Upload files benchmark")
+    @allure.sub_suite(AllureStory.BENCHMARK)
+    @pytest.mark.parametrize(
+        "file_size",
+        settings.benchmark.file_sizes,
+        ids=lambda size: ByteSize(size).human_readable(separator=""),
+    )
+    @pytest.mark.parametrize(
+        "concurrency", settings.benchmark.concurrency, ids=lambda value: f"x{value}"
+    )
+    def test_upload_files(
+        self,
+        files_client: FilesClient,
+        benchmark_file_factory: Callable[[int], Path],
+        file_size: int,
+        concurrency: int,
+    ):
+        path = benchmark_file_factory(file_size)
+
+        result = run_upload_benchmark(
+            files_client, path, concurrency=concurrency, uploads=settings.benchmark.uploads
+        )
+        save_upload_benchmark(settings.benchmark.report_file, result)
+        allure.attach(
+            result.model_dump_json(indent=2),
+            "Upload benchmark",
+            allure.attachment_type.JSON,
+        )
+
+        assert result.errors == 0, f"{result.errors} of {result.uploads} uploads failed"
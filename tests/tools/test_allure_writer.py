@@ -0,0 +1,146 @@
+import gzip
+import json
+import uuid
+from pathlib import Path
+
+import pytest
+from allure_commons import model2
+from allure_commons.model2 import Attachment
+
+from tools.allure.writer import GZIP_MIME_TYPE, BackgroundAllureFileLogger, iter_attachments
+
+LARGE_BODY = b"x" * 2048
+
+
+def attach(writer: BackgroundAllureFileLogger, body: str | bytes, name: str) -> Attachment:
+    file_name = f"{uuid.uuid4()}-attachment.json"
+    writer.report_attached_data(body=body, file_name=file_name)
+    return Attachment(name=name, source=file_name, type="application/json")
+
+
+def read_items(report_dir: Path) -> list[dict]:
+    return [
+        json.loads(path.read_text())
+        for pattern in ("*-result.json", "*-container.json")
+        for path in report_dir.glob(pattern)
+    ]
+
+
+def read_attachments(item: dict) -> list[dict]:
+    attachments = list(item.get("attachments", []))
+    for child in (*item.get("steps", []), *item.get("befores", []), *item.get("afters", [])):
+        attachments.extend(read_attachments(child))
+
+    return attachments
+
+
+def read_attachment(report_dir: Path, attachment: dict) -> bytes:
+    data = report_dir.joinpath(attachment["source"]).read_bytes()
+    return gzip.decompress(data) if attachment.get("type") == GZIP_MIME_TYPE else data
+
+
+@pytest.mark.tools
+class TestBackgroundAllureFileLogger:
+    def test_duplicate_and_large_attachments(self, tmp_path: Path):
+        writer = BackgroundAllureFileLogger(tmp_path, compress_min_size=1024)
+        result = model2.TestResult(
+            uuid=str(uuid.uuid4()),
+            name="test",
+            attachments=[attach(writer, "{}", "request"), attach(writer, "{}", "response")],
+            steps=[
+                model2.TestStepResult(
+                    name="step", attachments=[attach(writer, LARGE_BODY, "large")]
+                )
+            ],
+        )
+        container = model2.TestResultContainer(
+            uuid=str(uuid.uuid4()),
+            befores=[
+                model2.TestBeforeResult(name="fixture", attachments=[attach(writer, "{}", "setup")])
+            ],
+        )
+        writer.report_result(result)
+        writer.report_container(container)
+        writer.close()
+
+        attachments = [
+            attachment for item in read_items(tmp_path) for attachment in read_attachments(item)
+        ]
+        assert sorted(attachment["name"] for attachment in attachments) == [
+            "large (gzip)",
+            "request",
+            "response",
+            "setup",
+        ]
+        for attachment in attachments:
+            assert tmp_path.joinpath(attachment["source"]).is_file(), attachment
+
+        assert len({attachment["source"] for attachment in attachments}) == 2
+        assert len(list(tmp_path.glob("*-attachment*"))) == 2
+        assert not list(tmp_path.glob(".*.tmp"))
+        assert {read_attachment(tmp_path, attachment) for attachment in attachments} == {
+            b"{}",
+            LARGE_BODY,
+        }
+
+    def test_attached_file(self, tmp_path: Path):
+        source = tmp_path.joinpath("request.txt")
+        source.write_text("curl http://localhost")
+        writer = BackgroundAllureFileLogger(tmp_path.joinpath("results"))
+
+        file_name = f"{uuid.uuid4()}-attachment.txt"
+        writer.report_attached_file(source=str(source), file_name=file_name)
+        writer.report_result(
+            model2.TestResult(uuid=str(uuid.uuid4()), attachments=[Attachment(source=file_name)])
+        )
+        writer.close()
+
+        [attachment] = read_attachments(read_items(tmp_path.joinpath("results"))[0])
+        assert read_attachment(tmp_path.joinpath("results"), attachment) == source.read_bytes()
+
+    def test_nothing_is_lost_on_close(self, tmp_path: Path):
+        writer = BackgroundAllureFileLogger(tmp_path, compress_min_size=1024)
+        results = [
+            model2.TestResult(
+                uuid=str(uuid.uuid4()), attachments=[attach(writer, str(index), "body")]
+            )
+            for index in range(200)
+        ]
+        for result in results:
+            writer.report_result(result)
+
+        writer.close()
+        # Reported after close, e.g. by a plugin cleaning up later
+        late = model2.TestResult(
+            uuid=str(uuid.uuid4()), attachments=[attach(writer, LARGE_BODY, "late")]
+        )
+        writer.report_result(late)
+        writer.close()
+
+        items = read_items(tmp_path)
+        assert sorted(item["uuid"] for item in items) == sorted(
+            result.uuid for result in [*results, late]
+        )
+        for item in items:
+            for attachment in read_attachments(item):
+                assert tmp_path.joinpath(attachment["source"]).is_file(), attachment
+
+    def test_without_dedupe_and_compression_sources_are_kept(self, tmp_path: Path):
+        writer = BackgroundAllureFileLogger(tmp_path, dedupe=False)
+        attachments = [attach(writer, LARGE_BODY, "body") for _ in range(2)]
+        sources = [attachment.source for attachment in attachments]
+        writer.report_result(model2.TestResult(uuid=str(uuid.uuid4()), attachments=attachments))
+        writer.close()
+
+        [item] = read_items(tmp_path)
+        assert [attachment["source"] for attachment in read_attachments(item)] == sources
+        assert all(tmp_path.joinpath(source).read_bytes() == LARGE_BODY for source in sources)
+
+    def test_iter_attachments_walks_nested_items(self):
+        nested = Attachment(name="nested")
+        item = model2.TestResult(
+            attachments=[Attachment(name="top")],
+            steps=[model2.TestStepResult(steps=[model2.TestStepResult(attachments=[nested])])],
+        )
+
+        assert [attachment.name for attachment in iter_attachments(item)] == ["top", "nested"]
@@ -0,0 +1,166 @@
+from collections.abc import Iterator
+from typing import Any
+
+import allure_commons
+import pytest
+
+from tools.allure.steps import StepGranularity, assertion_step, step_granularity
+
+
+class AllureStepRecorder:
+    """
+    Allure plugin collecting the reported steps as a tree of (title, status, children) tuples.
+    """
+
+    def __init__(self):
+        self.steps: list[tuple] = []
+        self._started: list[tuple[str, list[tuple]]] = []
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        self._started.append((title, []))
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        title, children = self._started.pop()
+        step = (title, "passed" if exc_type is None else "failed", children)
+        (self._started[-1][1] if self._started else self.steps).append(step)
+
+
+@pytest.fixture
+def allure_steps() -> Iterator[list[tuple]]:
+    recorder = AllureStepRecorder()
+    allure_commons.plugin_manager.register(recorder)
+    try:
+        yield recorder.steps
+    finally:
+        allure_commons.plugin_manager.unregister(recorder)
+
+
+@assertion_step("Check that {name} equals to {expected}")
+def check_equals(actual: Any, expected: Any, name: str):
+    assert actual == expected, f'Incorrect value: "{name}". Expected: {expected}. Actual: {actual}'
+
+
+@assertion_step("Check {name}")
+def check_entity(actual: dict, expected: dict, name: str):
+    for field, value in expected.items():
+        check_equals(actual.get(field), value, field)
+
+
+@assertion_step("Check {name} if present")
+def check_optional_entity(actual: dict, expected: dict, name: str):
+    try:
+        check_entity(actual, expected, name)
+    except AssertionError:
+        pass
+
+
+@assertion_step("Check {name} and its title")
+def check_entity_and_title(actual: dict, expected: dict, name: str):
+    check_optional_entity(actual, expected, name)
+    check_equals(actual.get("title"), expected["title"], "title")
+
+
+def check(granularity: StepGranularity, func, *args):
+    with step_granularity(granularity):
+        func(*args)
+
+
+EXPECTED = {"id": 1, "title": "Course"}
+
+
+@pytest.mark.tools
+class TestAssertionSteps:
+    def test_full_reports_nested_helpers(self, allure_steps: list[tuple]):
+        check("full", check_entity, EXPECTED, EXPECTED, "course")
+
+        assert allure_steps == [
+            (
+                "Check 'course'",
+                "passed",
+                [
+                    ("Check that 'id' equals to 1", "passed", []),
+                    ("Check that 'title' equals to 'Course'", "passed", []),
+                ],
+            )
+        ]
+
+    def test_summary_aggregates_passed_checks(self, allure_steps: list[tuple]):
+        check("summary", check_entity, EXPECTED, EXPECTED, "course")
+
+        assert allure_steps == [
+            ("Check 'course'", "passed", [("2 checks passed: id; title", "passed", [])])
+        ]
+
+    def test_summary_reports_failed_check_in_full(self, allure_steps: list[tuple]):
+        with pytest.raises(AssertionError):
+            check("summary", check_entity, {"id": 1, "title": "Other"}, EXPECTED, "course")
+
+        assert allure_steps == [
+            (
+                "Check 'course'",
+                "failed",
+                [
+                    ("1 checks passed: id", "passed", []),
+                    ("Check that 'title' equals to 'Course'", "failed", []),
+                ],
+            )
+        ]
+
+    def test_failures_reports_nothing_if_passed(self, allure_steps: list[tuple]):
+        check("failures", check_entity, EXPECTED, EXPECTED, "course")
+
+        assert allure_steps == []
+
+    def test_failures_reports_path_to_failed_check(self, allure_steps: list[tuple]):
+        with pytest.raises(AssertionError):
+            check("failures", check_entity, {"id": 2, "title": "Course"}, EXPECTED, "course")
+
+        assert allure_steps == [
+            ("Check 'course'", "failed", [("Check that 'id' equals to 1", "failed", [])])
+        ]
+
+    @pytest.mark.parametrize("granularity", ["summary", "failures"])
+    def test_caught_child_failure_is_not_reported_as_failed(
+        self, allure_steps: list[tuple], granularity: StepGranularity
+    ):
+        check(granularity, check_optional_entity, {"id": 2}, EXPECTED, "course")
+
+        statuses = []
+        pending = list(allure_steps)
+        while pending:
+            _, status, children = pending.pop()
+            statuses.append(status)
+            pending.extend(children)
+
+        assert "failed" not in statuses
+
+    def test_caught_child_failure_is_passed_in_summary(self, allure_steps: list[tuple]):
+        check("summary", check_optional_entity, {"id": 2}, EXPECTED, "course")
+
+        assert allure_steps == [
+            (
+                "Check 'course' if present",
+                "passed",
+                [
+                    (
+                        "Check 'course'",
+                        "passed",
+                        [("1 checks passed: id", "passed", [])],
+                    )
+                ],
+            )
+        ]
+
+    def test_caught_child_failure_is_not_on_failed_path(self, allure_steps: list[tuple]):
+        with pytest.raises(AssertionError):
+            check("failures", check_entity_and_title, {"id": 2}, EXPECTED, "course")
+
+        assert allure_steps == [
+            (
+                "Check 'course' and its title",
+                "failed",
+                [("Check that 'title' equals to 'Course'", "failed", [])],
+            )
+        ]
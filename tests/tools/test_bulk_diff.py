@@ -0,0 +1,119 @@
+import pytest
+from pydantic import BaseModel
+
+from tools.assertions.bulk import (
+    FieldMismatchSchema,
+    ListDiffSchema,
+    assert_models_match,
+    diff_models,
+    flatten,
+    format_diff_table,
+)
+
+
+class PreviewSchema(BaseModel):
+    id: str
+    url: str
+
+
+class ItemSchema(BaseModel):
+    id: str
+    title: str
+    preview: PreviewSchema
+    tags: list[str] = []
+
+
+def build_item(id: str, title: str = "Title", preview_id: str = "p1") -> ItemSchema:
+    return ItemSchema(id=id, title=title, preview=PreviewSchema(id=preview_id, url="http://x"))
+
+
+@pytest.mark.tools
+class TestBulkDiff:
+    def test_flatten(self):
+        data = {"id": "1", "preview": {"id": "p1", "file": {"size": 10}}, "tags": ["a"]}
+
+        assert flatten(data) == {
+            "id": "1",
+            "preview.id": "p1",
+            "preview.file.size": 10,
+            "tags": ["a"],
+        }
+
+    def test_diff_models_equal(self):
+        diff = diff_models([build_item("1"), build_item("2")], [build_item("1"), build_item("2")])
+
+        assert diff.is_empty
+        assert diff.compared == 2
+
+    def test_diff_models_nested_mismatch(self):
+        diff = diff_models([build_item("1", preview_id="p2")], [build_item("1")])
+
+        assert diff.mismatches == [
+            FieldMismatchSchema(item="[0]", field="preview.id", expected="p1", actual="p2")
+        ]
+        assert not diff.is_empty
+
+    def test_diff_models_by_position_missing_and_unexpected(self):
+        items = [build_item("1"), build_item("2")]
+
+        assert diff_models(items[:1], items).missing == ["[1]"]
+        assert diff_models(items, items[:1]).unexpected == ["[1]"]
+
+    def test_diff_models_by_key(self):
+        diff = diff_models(
+            [build_item("3"), build_item("1", title="Other")],
+            [build_item("1"), build_item("2")],
+            key="id",
+        )
+
+        assert diff.compared == 1
+        assert diff.mismatches == [
+            FieldMismatchSchema(item="1", field="title", expected="Title", actual="Other")
+        ]
+        assert diff.missing == ["2"]
+        assert diff.unexpected == ["3"]
+
+    def test_diff_models_duplicates(self):
+        diff = diff_models([build_item("1"), build_item("1")], [build_item("1")], key="id")
+
+        assert diff.duplicates == ["1"]
+        assert diff.expected_duplicates == []
+        assert not diff.is_empty
+
+    def test_diff_models_expected_duplicates(self):
+        diff = diff_models(
+            [build_item("1")], [build_item("1"), build_item("1", title="Other")], key="id"
+        )
+
+        assert diff.duplicates == []
+        assert diff.expected_duplicates == ["1"]
+        assert not diff.is_empty
+
+    def test_format_diff_table_truncates_rows(self):
+        diff = ListDiffSchema(
+            compared=3,
+            mismatches=[
+                FieldMismatchSchema(item=f"[{index}]", field="title", expected="a", actual="b")
+                for index in range(3)
+            ],
+            missing=["[3]"],
+            expected_duplicates=["[4]"],
+        )
+
+        lines = format_diff_table(diff, max_rows=2).splitlines()
+
+        assert lines[0] == (
+            "Compared items: 3, mismatching fields: 3, missing items: 1, unexpected items: 0, "
+            "duplicate items: 0, duplicate expected items: 1"
+        )
+        assert "Missing: [3]" in lines
+        assert "Duplicate expected: [4]" in lines
+        assert sum(line.startswith("[") for line in lines) == 2
+        assert lines[-1] == "... and 1 more mismatching fields"
+        assert "more mismatching fields" not in format_diff_table(diff)
+
+    def test_assert_models_match(self):
+        assert_models_match([build_item("1")], [build_item("1")], "items")
+
+        with pytest.raises(AssertionError, match='Incorrect items: "items"'):
+            assert_models_match([build_item("1")], [build_item("2")], "items", key="id")
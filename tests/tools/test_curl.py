@@ -0,0 +1,107 @@
+import hashlib
+import subprocess
+from pathlib import Path
+
+import pytest
+from httpx import Request
+
+from tools.http.curl import (
+    REDACTED,
+    decode_body,
+    make_curl_from_request,
+    quote,
+    redact_header,
+    summarize_binary,
+    truncate,
+)
+
+URL = "http://localhost:8000/api/v1/files"
+
+
+@pytest.mark.tools
+class TestCurl:
+    @pytest.mark.parametrize(
+        "name, value, expected",
+        [
+            ("Authorization", "Bearer secret", f"Bearer {REDACTED}"),
+            ("authorization", "Bearer secret", f"Bearer {REDACTED}"),
+            ("AUTHORIZATION", "secret", REDACTED),
+            ("Cookie", "session=secret; theme=dark", REDACTED),
+            ("cookie", "session=secret", REDACTED),
+            ("Accept", "application/json", "application/json"),
+        ],
+    )
+    def test_redact_header(self, name: str, value: str, expected: str):
+        assert redact_header(name, value, ["Authorization", "cookie"]) == expected
+
+    def test_redacted_headers_are_not_in_command(self):
+        request = Request(
+            "GET", URL, headers={"authorization": "Bearer secret", "COOKIE": "session=secret"}
+        )
+
+        command = make_curl_from_request(request, redact_headers=["Authorization", "Cookie"])
+
+        assert "secret" not in command
+        assert f"-H 'authorization: Bearer {REDACTED}'" in command
+        assert f"-H 'cookie: {REDACTED}'" in command
+
+    def test_truncate_keeps_whole_characters(self):
+        # "é" takes two bytes, the limit cuts the third one in half
+        assert truncate("ééé", 5) == "éé...<truncated: 2 of 6 bytes>"
+        assert truncate("ééé", 6) == "ééé"
+        assert truncate("ééé", None) == "ééé"
+
+    def test_decode_body_truncates_at_character_boundary(self):
+        assert decode_body("ééé".encode(), 5) == "éé...<truncated: 2 of 6 bytes>"
+        assert decode_body(b"\xff\xfe", None) is None
+
+    def test_text_body_is_truncated(self):
+        request = Request("POST", URL, json={"title": "x" * 100})
+
+        command = make_curl_from_request(request, max_body_size=10)
+
+        assert '-d \'{"title":"...<truncated: ' in command
+
+    @pytest.mark.parametrize("content_type", ["image/png", None])
+    def test_binary_body_is_summarized(self, content_type: str | None):
+        body = bytes(range(256))
+        headers = {"Content-Type": content_type} if content_type else {}
+        request = Request("POST", URL, content=body, headers=headers)
+
+        command = make_curl_from_request(request)
+
+        summary = summarize_binary(body, content_type)
+        assert f"--data-binary '{summary}'" in command
+        assert summary == (
+            f"<binary body: {content_type or 'unknown type'}, 256 bytes, "
+            f"sha256 {hashlib.sha256(body).hexdigest()}>"
+        )
+
+    def test_multipart_lists_fields_and_files(self, tmp_path: Path):
+        path = tmp_path.joinpath("image.png")
+        path.write_bytes(b"\x89PNG" + bytes(100))
+
+        with path.open("rb") as file:
+            request = Request(
+                "POST",
+                URL,
+                data={"filename": "image.png", "directory": "courses"},
+                files={"upload_file": ("image.png", file, "image/png")},
+            )
+            command = make_curl_from_request(request)
+
+        assert f"-F 'upload_file=@{path};type=image/png'" in command
+        assert "-F 'filename=image.png'" in command
+        assert "-F 'directory=courses'" in command
+        assert "Content-Type" not in command
+        assert command.splitlines()[-1] == "# upload_file: image.png, 104 bytes"
+
+    @pytest.mark.parametrize("value", ["it's", "'", "a'b'c", "$HOME `id` \\"])
+    def test_quote_is_safe_for_shell(self, value: str):
+        assert quote(value) == "'" + value.replace("'", "'\\''") + "'"
+        assert (
+            subprocess.run(
+                f"printf %s {quote(value)}", shell=True, capture_output=True, text=True, check=True
+            ).stdout
+            == value
+        )
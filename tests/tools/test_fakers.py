@@ -0,0 +1,97 @@
+import pytest
+from faker import Faker
+
+from tools.fakers import Fake, derive_seed, fake, get_email_namespace
+from tools.provisioning import Provisioner, ProvisioningGraph
+
+
+def generate_user(fake: Fake) -> dict[str, str]:
+    return {
+        "email": fake.email(),
+        "password": fake.password(),
+        "first_name": fake.first_name(),
+        "last_name": fake.last_name(),
+    }
+
+
+def build_user_graph() -> ProvisioningGraph:
+    return (
+        ProvisioningGraph()
+        .add("user", lambda: generate_user(fake))
+        .add("title", lambda user: fake.sentence(), depends_on=("user",))
+        .add("description", lambda user: fake.text(), depends_on=("user",))
+    )
+
+
+def provision(seed: int, chains: int) -> list[dict]:
+    provisioner = Provisioner(build_user_graph(), prebuild=chains, workers=4, seed=seed)
+    provisioner.start()
+    try:
+        return [provisioner.take() for _ in range(chains)]
+    finally:
+        provisioner.shutdown()
+
+
+@pytest.mark.tools
+class TestFake:
+    @pytest.mark.parametrize("pool_size", [0, 50])
+    def test_seeded_context_is_reproducible(self, pool_size: int):
+        first = Fake(faker=Faker(), seed=1, pool_size=pool_size, namespace="gw0run")
+        second = Fake(faker=Faker(), seed=1, pool_size=pool_size, namespace="gw0run")
+        # Pools are shared by all contexts, like in a session they are generated up front
+        first.warm_up()
+        second.warm_up()
+
+        with first.seeded(42):
+            expected = generate_user(first)
+
+        second.first_name()  # Values generated outside the context don't change the ones inside
+        with second.seeded(42):
+            assert generate_user(second) == expected
+
+        with second.seeded(43):
+            assert generate_user(second) != expected
+
+    def test_seeded_context_does_not_consume_test_values(self):
+        expected = generate_user(Fake(faker=Faker(), seed=1, namespace="gw0run"))
+        fake = Fake(faker=Faker(), seed=1, namespace="gw0run")
+
+        with fake.seeded(42):
+            generate_user(fake)
+
+        assert generate_user(fake) == expected
+
+    def test_emails_are_unique_across_namespaces(self, monkeypatch: pytest.MonkeyPatch):
+        emails = set()
+        for worker in ("gw0", "gw1"):
+            monkeypatch.setenv("PYTEST_XDIST_WORKER", worker)
+            for run_id in ("run-a", "run-b"):
+                # Every worker of every run replays the same seed
+                fake = Fake(faker=Faker(), seed=1, namespace=get_email_namespace(run_id))
+                emails.update(fake.email() for _ in range(10))
+                for seed in (1, 2):
+                    with fake.seeded(seed):
+                        emails.update(fake.email() for _ in range(10))
+
+        assert len(emails) == 2 * 2 * 3 * 10
+
+    def test_derive_seed_is_stable(self):
+        assert derive_seed(1, "test_a") == derive_seed(1, "test_a")
+        assert derive_seed(1, "test_a") != derive_seed(1, "test_b")
+        assert derive_seed(1, 0) != derive_seed(2, 0)
+
+
+@pytest.mark.tools
+class TestProvisionerSeed:
+    def test_same_seed_gives_same_chains(self):
+        expected = provision(seed=7, chains=4)
+        fake.first_name()  # The running test generating values in the meantime
+        actual = provision(seed=7, chains=4)
+
+        assert actual == expected
+        assert len({chain["user"]["email"] for chain in actual}) == 4
+
+    def test_other_seed_gives_other_chains(self):
+        first, second = provision(seed=7, chains=2), provision(seed=8, chains=2)
+
+        assert [chain["user"] for chain in first] != [chain["user"] for chain in second]
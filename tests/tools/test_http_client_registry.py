@@ -0,0 +1,99 @@
+import gc
+from types import SimpleNamespace
+
+import pytest
+from httpx import Client
+
+from clients import http_client_registry
+from clients.http_client_registry import HTTPClientRegistry
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(http_client_registry, "time", SimpleNamespace(monotonic=clock.monotonic))
+    return clock
+
+
+@pytest.mark.tools
+class TestHTTPClientRegistry:
+    def test_returns_cached_client(self):
+        registry = HTTPClientRegistry(max_size=2)
+
+        client = registry.get_or_create("a", Client)
+
+        assert registry.get_or_create("a", Client) is client
+        assert registry.stats.model_dump() == {"hits": 1, "misses": 1, "evictions": 0, "size": 1}
+        registry.close()
+
+    def test_evicts_least_recently_used(self):
+        registry = HTTPClientRegistry(max_size=2)
+        first = registry.get_or_create("a", Client)
+        second = registry.get_or_create("b", Client)
+
+        registry.get_or_create("a", Client)  # "b" becomes the least recently used
+        registry.get_or_create("c", Client)
+
+        assert registry.get_or_create("a", Client) is first
+        assert registry.get_or_create("b", Client) is not second
+        assert registry.stats.model_dump() == {"hits": 2, "misses": 4, "evictions": 2, "size": 2}
+        registry.close()
+
+    def test_evicts_expired_client(self, clock: FakeClock):
+        registry = HTTPClientRegistry(max_size=2, ttl=10)
+        client = registry.get_or_create("a", Client)
+
+        clock.now = 10
+        assert registry.get_or_create("a", Client) is client
+
+        clock.now = 10.1
+        assert registry.get_or_create("a", Client) is not client
+        assert registry.stats.evictions == 1
+        registry.close()
+
+    def test_evicted_client_stays_open_until_close(self):
+        registry = HTTPClientRegistry(max_size=1)
+        evicted = registry.get_or_create("a", Client)
+        cached = registry.get_or_create("b", Client)
+
+        assert not evicted.is_closed
+
+        registry.close()
+
+        assert evicted.is_closed
+        assert cached.is_closed
+        assert registry.stats.size == 0
+
+    def test_unreferenced_evicted_client_is_released(self):
+        registry = HTTPClientRegistry(max_size=1)
+        registry.get_or_create("a", Client)
+        registry.get_or_create("b", Client)
+
+        gc.collect()
+
+        assert len(registry._evicted) == 0
+        registry.close()
+
+    def test_concurrently_created_client_is_closed(self):
+        registry = HTTPClientRegistry(max_size=2)
+        losers: list[Client] = []
+
+        def factory() -> Client:
+            # Another caller stores a client for the key while this one is being created
+            registry._clients["a"] = (winner, 0.0)
+            losers.append(Client())
+            return losers[-1]
+
+        winner = Client()
+
+        assert registry.get_or_create("a", factory) is winner
+        assert losers[0].is_closed
+        registry.close()
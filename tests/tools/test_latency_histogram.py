@@ -0,0 +1,90 @@
+import json
+import math
+import random
+
+import pytest
+
+from tools.latency.histogram import LatencyHistogram
+
+
+def get_exact_percentile(values: list[int], q: float) -> int:
+    ordered = sorted(values)
+    return ordered[max(math.ceil(q / 100 * len(ordered)), 1) - 1]
+
+
+def build_histogram(values: list[int]) -> LatencyHistogram:
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value / 1_000_000)
+
+    return histogram
+
+
+def generate_latencies(seed: int, count: int = 5000) -> list[int]:
+    generator = random.Random(seed)
+    # Microseconds from 1 us to about 20 s, spread over all magnitudes
+    return [int(generator.lognormvariate(10, 2.5)) + 1 for _ in range(count)]
+
+
+@pytest.mark.tools
+class TestLatencyHistogram:
+    @pytest.mark.parametrize("significant_bits", [4, 8, 11])
+    def test_buckets_cover_values_with_relative_precision(self, significant_bits: int):
+        histogram = LatencyHistogram(significant_bits=significant_bits)
+        precision = 1 / 2 ** (significant_bits - 1)
+
+        previous_index = histogram._get_index(0)
+        for value in range(1, 1 << (significant_bits + 8)):
+            index = histogram._get_index(value)
+            highest = histogram._get_highest_value(index)
+
+            assert index in (previous_index, previous_index + 1), f"Index gap at {value}"
+            assert value <= highest < value * (1 + precision), f"Wrong bucket of {value}"
+            if index != previous_index:
+                assert histogram._get_highest_value(previous_index) == value - 1
+
+            previous_index = index
+
+    @pytest.mark.parametrize("q", [0, 50, 90, 99, 99.9, 100])
+    def test_percentile_relative_error(self, q: float):
+        values = generate_latencies(seed=1)
+        histogram = build_histogram(values)
+
+        exact = get_exact_percentile(values, q)
+        actual = histogram.percentile(q) * 1_000_000
+
+        assert exact <= round(actual) <= exact * (1 + 1 / 128)
+
+    def test_percentile_of_empty_histogram(self):
+        assert LatencyHistogram().percentile(99) == 0.0
+
+    def test_max_is_exact(self):
+        histogram = build_histogram([3, 1_234_567, 42])
+
+        assert histogram.max == 1_234_567
+        assert histogram.percentile(100) == 1.234567
+
+    def test_merge_equals_recording_into_one_histogram(self):
+        first, second = generate_latencies(seed=2), generate_latencies(seed=3)
+
+        merged = build_histogram(first)
+        merged.merge(build_histogram(second))
+        expected = build_histogram(first + second)
+
+        assert merged.counts == expected.counts
+        assert merged.total == expected.total
+        assert merged.max == expected.max
+        assert [merged.percentile(q) for q in (50, 99)] == [
+            expected.percentile(q) for q in (50, 99)
+        ]
+
+    def test_dict_round_trip_is_lossless(self):
+        histogram = build_histogram(generate_latencies(seed=4))
+
+        restored = LatencyHistogram.from_dict(json.loads(json.dumps(histogram.to_dict())))
+
+        assert restored.significant_bits == histogram.significant_bits
+        assert restored.counts == histogram.counts
+        assert restored.total == histogram.total
+        assert restored.max == histogram.max
+        assert restored.to_dict() == histogram.to_dict()
@@ -0,0 +1,59 @@
+from types import SimpleNamespace
+
+import pytest
+
+from clients import request_timings
+from clients.request_timings import RequestTimingSchema
+from config import DEFAULT_LATENCY_SLO_PERCENTILE, LatencySLOConfig
+from fixtures import latency
+
+# 19 requests within the budget and one over it: p95 passes, p100 fails
+ELAPSED = [0.01] * 19 + [1.0]
+
+
+def run_marked_test(*marks: pytest.MarkDecorator) -> None:
+    item = SimpleNamespace(
+        name="test_get_course", iter_markers=lambda name: [mark.mark for mark in marks]
+    )
+
+    hook = latency.pytest_runtest_call(item)
+    next(hook)
+    for elapsed in ELAPSED:
+        timing = RequestTimingSchema(
+            method="GET", endpoint="/api/v1/courses", status_code=200, elapsed=elapsed
+        )
+        for listener in list(request_timings.listeners):
+            listener(timing)
+
+    with pytest.raises(StopIteration):
+        hook.send(None)
+
+
+@pytest.fixture(autouse=True)
+def timing_listeners(monkeypatch: pytest.MonkeyPatch):
+    # Keeps the timings of the tests out of the latency report of the session
+    monkeypatch.setattr(request_timings, "listeners", [])
+
+
+@pytest.mark.tools
+class TestLatencySLOMarker:
+    def test_marker_and_config_share_default_percentile(self):
+        assert LatencySLOConfig(budget_ms=100).percentile == DEFAULT_LATENCY_SLO_PERCENTILE == 95
+
+    def test_marker_checks_default_percentile(self):
+        run_marked_test(pytest.mark.latency_slo(100))
+
+    def test_marker_fails_over_budget(self):
+        with pytest.raises(AssertionError):
+            run_marked_test(pytest.mark.latency_slo(100, percentile=100))
+
+    def test_marker_checks_endpoint(self):
+        run_marked_test(pytest.mark.latency_slo(100, endpoint="GET /api/v1/courses"))
+
+        with pytest.raises(AssertionError):
+            run_marked_test(pytest.mark.latency_slo(budget_ms=5, endpoint="GET /api/v1/courses"))
+
+    def test_listener_is_removed_after_test(self):
+        run_marked_test(pytest.mark.latency_slo(100))
+
+        assert request_timings.listeners == []
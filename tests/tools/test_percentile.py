@@ -0,0 +1,16 @@
+import pytest
+
+from tools.latency.percentile import percentile
+
+
+@pytest.mark.tools
+class TestPercentile:
+    @pytest.mark.parametrize(
+        "q, expected",
+        [(0, 1.0), (10, 1.0), (11, 2.0), (50, 5.0), (90, 9.0), (99, 10.0), (100, 10.0)],
+    )
+    def test_nearest_rank(self, q: float, expected: float):
+        assert percentile([float(value) for value in range(1, 11)], q) == expected
+
+    def test_no_values(self):
+        assert percentile([], 99) == 0.0
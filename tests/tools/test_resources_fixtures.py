@@ -0,0 +1,59 @@
+from functools import cache
+from types import SimpleNamespace
+
+import pytest
+from httpx import HTTPTransport
+
+from clients import http_transport
+from clients.http_transport import SharedHTTPTransport, close_shared_http_transport
+from config import settings
+from fixtures import resources
+
+
+@pytest.fixture
+def shared_transport(monkeypatch: pytest.MonkeyPatch):
+    # A pool of its own, the one of the session stays open for the other tests
+    @cache
+    def get_shared_http_transport() -> SharedHTTPTransport:
+        return SharedHTTPTransport(HTTPTransport())
+
+    monkeypatch.setattr(http_transport, "get_shared_http_transport", get_shared_http_transport)
+    return get_shared_http_transport
+
+
+@pytest.mark.tools
+class TestResourcesSessionFinish:
+    @pytest.mark.parametrize(
+        "config, patched",
+        [
+            (SimpleNamespace(workerinput={}), "cache_owner_tokens"),
+            (SimpleNamespace(), "read_resources"),
+        ],
+        ids=["worker", "controller"],
+    )
+    def test_shared_pool_is_closed_after_logins(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        shared_transport,
+        config: SimpleNamespace,
+        patched: str,
+    ):
+        opened: list[SharedHTTPTransport] = []
+
+        def login(*args) -> list:
+            # Logging a user in creates a client on the shared connection pool
+            opened.append(shared_transport())
+            return []
+
+        monkeypatch.setattr(settings.resources, "teardown", True)
+        monkeypatch.setattr(resources, patched, login)
+
+        resources.pytest_sessionfinish(SimpleNamespace(config=config))
+
+        assert opened
+        assert shared_transport.cache_info().currsize == 0
+
+    def test_close_without_open_pool_does_not_open_one(self, shared_transport):
+        close_shared_http_transport()
+
+        assert shared_transport.cache_info().currsize == 0
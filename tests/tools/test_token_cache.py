@@ -0,0 +1,48 @@
+import stat
+from pathlib import Path
+
+import pytest
+
+from clients.authentication.authentication_schema import TokenSchema
+from clients.authentication.token_cache import TokenCache
+
+TOKEN = TokenSchema(tokenType="bearer", accessToken="access", refreshToken="refresh")
+
+
+def get_mode(path: Path) -> int:
+    return stat.S_IMODE(path.stat().st_mode)
+
+
+@pytest.mark.tools
+class TestTokenCache:
+    def test_cache_is_private(self, tmp_path: Path):
+        cache = TokenCache(tmp_path.joinpath("tokens", "run"))
+        cache.store("user@example.com", TOKEN)
+
+        assert get_mode(cache.directory) == 0o700
+        assert get_mode(cache.directory.parent) == 0o700
+        assert [get_mode(path) for path in cache.directory.iterdir()] == [0o600, 0o600]
+        assert cache.get_latest("user@example.com").token == TOKEN
+
+    def test_existing_directory_is_made_private(self, tmp_path: Path):
+        directory = tmp_path.joinpath("run")
+        directory.mkdir(mode=0o755)
+
+        TokenCache(directory)
+
+        assert get_mode(directory) == 0o700
+
+    def test_symlinked_directory_is_refused(self, tmp_path: Path):
+        tmp_path.joinpath("target").mkdir()
+        tmp_path.joinpath("run").symlink_to(tmp_path.joinpath("target"))
+
+        with pytest.raises(PermissionError):
+            TokenCache(tmp_path.joinpath("run"))
+
+    def test_clear_removes_directory(self, tmp_path: Path):
+        cache = TokenCache(tmp_path.joinpath("run"))
+        cache.store("user@example.com", TOKEN)
+
+        cache.clear()
+
+        assert not cache.directory.exists()
@@ -42,11 +42,11 @@ class TestUsers:
     ):
         request = CreateUserRequestSchema(email=fake.email(domain=domain))
         response = public_users_client.create_user_api(request=request)
-        response_data = CreateUserResponseSchema.model_validate_json(response.text)
+        response_data = response.parse(CreateUserResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_create_user_response(request, response_data)
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), CreateUserResponseSchema)
 
     @allure.tag(AllureTag.GET_ENTITY)
     @allure.story(AllureStory.GET_ENTITY)
@@ -55,11 +55,11 @@ class TestUsers:
     @allure.sub_suite(AllureStory.GET_ENTITY)
     def test_get_user_me(self, private_users_client: PrivateUsersClient, function_user: UserFixture):
         response = private_users_client.get_user_me_api()
-        response_data = GetUserResponseSchema.model_validate_json(response.text)
+        response_data = response.parse(GetUserResponseSchema)
 
         assert_status_code(actual=response.status_code, expected=HTTPStatus.OK)
         assert_get_user_response(
             response_data,
             function_user.response,
         )
-        validate_json_schema(instance=response.json(), schema=response_data.model_json_schema())
+        validate_json_schema(instance=response.json(), schema=GetUserResponseSchema)
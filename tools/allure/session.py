@@ -0,0 +1,44 @@
+import hashlib
+import time
+from pathlib import Path
+from uuid import uuid4
+
+from allure_commons.logger import AllureFileLogger
+from allure_commons.model2 import Attachment, Label, Status, TestResult
+from allure_commons.types import AttachmentType
+
+
+def report_session_attachment(
+    report_dir: Path, name: str, body: str, attachment_type: AttachmentType
+) -> None:
+    """
+    Adds an attachment that belongs to the whole session to the Allure results.
+
+    Allure attachments always belong to a test, so the attachment is reported as a separate
+    passed result in the "Session" suite, which is written directly to the results directory
+    and works on the pytest-xdist controller, which runs no tests.
+
+    :param report_dir: Allure results directory.
+    :param name: Name of the result and of the attachment.
+    :param body: Content of the attachment.
+    :param attachment_type: Allure attachment type (e.g., allure.attachment_type.JSON).
+    """
+    logger = AllureFileLogger(report_dir)
+
+    source = f"{uuid4()}-attachment.{attachment_type.extension}"
+    logger.report_attached_data(body=body, file_name=source)
+
+    now = int(time.time() * 1000)
+    logger.report_result(
+        TestResult(
+            uuid=str(uuid4()),
+            name=name,
+            fullName=f"session.{name}",
+            historyId=hashlib.md5(name.encode()).hexdigest(),
+            status=Status.PASSED,
+            start=now,
+            stop=now,
+            labels=[Label(name="suite", value="Session")],
+            attachments=[Attachment(name=name, source=source, type=attachment_type.mime_type)],
+        )
+    )
@@ -0,0 +1,213 @@
+import inspect
+import threading
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+from functools import wraps
+from typing import Literal, ParamSpec, TypeVar
+from uuid import uuid4
+
+import allure
+from allure_commons.model2 import ExecutableItem
+from allure_commons.reporter import ThreadContextItems
+from allure_commons.utils import func_parameters, represent
+
+from config import settings
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+def async_step(title: str) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    """
+    Async counterpart of @allure.step.
+
+    allure.step wraps only the creation of the coroutine, so the step would be closed
+    before the request is actually sent. This decorator opens the step around the awaited call
+    and formats the title with the call arguments exactly like allure.step does.
+
+    :param title: Step title, may reference function arguments (e.g., "Get course by id {course_id}").
+    :return: Decorator for an async function.
+    """
+
+    def wrapper(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        @wraps(func)
+        async def inner(*args: P.args, **kwargs: P.kwargs) -> T:
+            params = func_parameters(func, *args, **kwargs)
+            formatted_args = [represent(arg) for arg in args]
+            with allure.step(title.format(*formatted_args, **params)):
+                return await func(*args, **kwargs)
+
+        return inner
+
+    return wrapper
+
+
+@contextmanager
+def detached_allure_context() -> Iterator[None]:
+    """
+    Sends Allure steps reported from the current thread to a throwaway item.
+
+    Allure binds a new thread to the item that was last started in the main thread, so steps
+    from background threads (e.g., fixtures provisioned ahead of time) would end up in an
+    unrelated, possibly already reported test. Inside this context they are discarded instead.
+    """
+    # Keys are only replaced, never removed: Allure iterates over this dict from the main thread
+    thread = threading.current_thread()
+    thread_context = ThreadContextItems._thread_context
+    previous = thread_context.get(thread, OrderedDict())
+    thread_context[thread] = OrderedDict({str(uuid4()): ExecutableItem()})
+
+    try:
+        yield
+    finally:
+        thread_context[thread] = previous
+
+
+StepGranularity = Literal["full", "summary", "failures"]
+
+_step_granularity: ContextVar[StepGranularity | None] = ContextVar("step_granularity", default=None)
+
+
+def get_step_granularity() -> StepGranularity:
+    """
+    :return: Granularity of assertion steps: set by step_granularity() or
+    ASSERTIONS.STEP_GRANULARITY.
+    """
+    return _step_granularity.get() or settings.assertions.step_granularity
+
+
+@contextmanager
+def step_granularity(granularity: StepGranularity) -> Iterator[None]:
+    """
+    Overrides the granularity of the assertion steps started inside the context,
+    e.g. to check a list of hundreds of entities with "summary" in an otherwise "full" run.
+
+    :param granularity: Granularity, see assertion_step().
+    """
+    token = _step_granularity.set(granularity)
+    try:
+        yield
+    finally:
+        _step_granularity.reset(token)
+
+
+class _AssertionRecord:
+    """
+    Call of an assertion helper recorded for reporting after it has finished.
+    """
+
+    __slots__ = ("title", "func", "args", "kwargs", "children", "error")
+
+    def __init__(self, title: str, func: Callable, args: tuple, kwargs: dict):
+        self.title = title
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.children: list[_AssertionRecord] = []
+        self.error: Exception | None = None
+
+    def format_title(self) -> str:
+        params = func_parameters(self.func, *self.args, **self.kwargs)
+        return self.title.format(*[represent(arg) for arg in self.args], **params)
+
+    def get_label(self) -> str:
+        params = func_parameters(self.func, *self.args, **self.kwargs)
+        return params["name"].strip("'") if "name" in params else self.format_title()
+
+
+_assertion_record: ContextVar[_AssertionRecord | None] = ContextVar(
+    "assertion_record", default=None
+)
+
+
+def _is_caused_by(error: BaseException | None, cause: BaseException) -> bool:
+    # A helper may also wrap the error of the check it called, e.g. raise ... from error
+    while error is not None:
+        if error is cause:
+            return True
+
+        error = error.__cause__ or error.__context__
+
+    return False
+
+
+def _report_record(record: _AssertionRecord, granularity: StepGranularity, failed: bool) -> None:
+    # Failures are re-raised inside the steps of the failed path, so Allure marks them as failed.
+    # A check whose error was caught by its caller did not fail the test and is reported as passed
+    with allure.step(record.format_title()):
+        passed: list[_AssertionRecord] = []
+        for child in [*record.children, None]:
+            child_failed = (
+                child is not None
+                and failed
+                and child.error is not None
+                and _is_caused_by(record.error, child.error)
+            )
+            if child is not None and not child_failed:
+                if not child.children:
+                    passed.append(child)
+                    continue
+
+                if granularity == "failures":
+                    continue
+
+            if passed and granularity == "summary":
+                labels = "; ".join(check.get_label() for check in passed)
+                with allure.step(f"{len(passed)} checks passed: {labels}"):
+                    pass
+
+            passed = []
+            if child is not None:
+                _report_record(child, granularity, child_failed)
+
+        if failed:
+            raise record.error
+
+
+def assertion_step(title: str) -> Callable[[Callable[P, T]], Callable[P, T]]:
+    """
+    @allure.step for assertion helpers, reported with the configured granularity:
+    - "full": every call is a step, like @allure.step;
+    - "summary": a step per entity (a helper calling other helpers) in which the passed checks
+      are aggregated into a single compact step;
+    - "failures": only the path to a failed check is reported.
+
+    With "summary" and "failures" the calls are recorded in memory and reported when the outermost
+    helper returns, so passed checks cost no step bookkeeping. Failed checks are reported in full
+    detail with every granularity.
+
+    :param title: Step title, may reference function arguments (e.g., "Check that {name} equals to {expected}").
+    :return: Decorator for an assertion helper.
+    """
+
+    def wrapper(func: Callable[P, T]) -> Callable[P, T]:
+        stepped = allure.step(title)(func)
+
+        @wraps(func)
+        def inner(*args: P.args, **kwargs: P.kwargs) -> T:
+            parent = _assertion_record.get()
+            if parent is None and (granularity := get_step_granularity()) == "full":
+                return stepped(*args, **kwargs)
+
+            record = _AssertionRecord(title, func, args, kwargs)
+            if parent is not None:
+                parent.children.append(record)
+
+            token = _assertion_record.set(record)
+            try:
+                return func(*args, **kwargs)
+            except Exception as error:
+                record.error = error
+                raise
+            finally:
+                _assertion_record.reset(token)
+                if parent is None and (granularity == "summary" or record.error is not None):
+                    with suppress(Exception):
+                        _report_record(record, granularity, record.error is not None)
+
+        inner.__signature__ = inspect.signature(func)
+        return inner
+
+    return wrapper
@@ -15,3 +15,5 @@ class AllureTag(str, Enum):
     UPDATE_ENTITY = "UPDATE_ENTITY"
     DELETE_ENTITY = "DELETE_ENTITY"
     VALIDATE_ENTITY = "VALIDATE_ENTITY"
+
+    BENCHMARK = "BENCHMARK"
@@ -0,0 +1,162 @@
+import gzip
+import hashlib
+import os
+import queue
+import threading
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from allure_commons import hookimpl
+from allure_commons.logger import AllureFileLogger
+from allure_commons.model2 import Attachment
+
+from tools.logger import get_logger
+
+GZIP_MIME_TYPE = "application/gzip"
+
+logger = get_logger("ALLURE_WRITER")
+
+
+def iter_attachments(item: object) -> Iterator[Attachment]:
+    """
+    :param item: Allure test result, container, fixture result or step.
+    :return: Attachments of the item and of all its nested steps and fixtures.
+    """
+    yield from getattr(item, "attachments", None) or []
+    for child in (
+        *(getattr(item, "steps", None) or []),
+        *(getattr(item, "befores", None) or []),
+        *(getattr(item, "afters", None) or []),
+    ):
+        yield from iter_attachments(child)
+
+
+class BackgroundAllureFileLogger(AllureFileLogger):
+    """
+    Allure results writer that writes results and attachments in a background thread.
+
+    Tests only put the reported items into a queue, so they don't wait for file writes, which
+    are slow on network file systems. Attachments with the same content are written once,
+    to a file named after their SHA-256, which also deduplicates them across pytest-xdist workers.
+    Attachments of at least compress_min_size bytes are written gzip-compressed; the report
+    offers them as .gz downloads. The sources and types of the attachments in results and
+    containers are rewritten accordingly before they are written.
+    """
+
+    def __init__(
+        self,
+        report_dir: str | Path,
+        clean: bool = False,
+        compress_min_size: int | None = None,
+        dedupe: bool = True,
+    ):
+        """
+        :param report_dir: Allure results directory.
+        :param clean: Delete the results of previous runs.
+        :param compress_min_size: Minimum size in bytes of compressed attachments, None disables
+        compression.
+        :param dedupe: Write attachments with the same content once.
+        """
+        super().__init__(report_dir, clean)
+        self.compress_min_size = compress_min_size
+        self.dedupe = dedupe
+
+        # Original file name of an attachment -> (written file name, compressed)
+        self._sources: dict[str, tuple[str, bool]] = {}
+        self._written: set[str] = set()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._queue: queue.SimpleQueue[tuple[Callable, tuple] | None] = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="allure-writer", daemon=True)
+        self._thread.start()
+
+    @hookimpl
+    def report_result(self, result):
+        self._put(self._write_item, result)
+
+    @hookimpl
+    def report_container(self, container):
+        self._put(self._write_item, container)
+
+    @hookimpl
+    def report_attached_file(self, source, file_name):
+        # The file is read in the background, so it must not be deleted right after attaching
+        self._put(self._write_file, source, file_name)
+
+    @hookimpl
+    def report_attached_data(self, body, file_name):
+        self._put(self._write_data, body, file_name)
+
+    def close(self) -> None:
+        """
+        Writes everything reported so far and stops the background thread.
+        Items reported after that are written right away.
+        """
+        with self._lock:
+            if self._closed:
+                return
+
+            self._closed = True
+            self._queue.put(None)
+
+        self._thread.join()
+
+    def _put(self, write: Callable, *args) -> None:
+        with self._lock:
+            if not self._closed:
+                self._queue.put((write, args))
+                return
+
+        # Reported after close(), e.g. by a plugin cleaning up later: there is no thread to write it
+        self._thread.join()
+        write(*args)
+
+    def _run(self) -> None:
+        while (task := self._queue.get()) is not None:
+            write, args = task
+            try:
+                write(*args)
+            except Exception:
+                logger.exception("Failed to write Allure results")
+
+    def _write_item(self, item) -> None:
+        for attachment in iter_attachments(item):
+            if attachment.source not in self._sources:
+                continue
+
+            attachment.source, compressed = self._sources.pop(attachment.source)
+            if compressed:
+                attachment.name = f"{attachment.name} (gzip)"
+                attachment.type = GZIP_MIME_TYPE
+
+        self._report_item(item)
+
+    def _write_file(self, source: str, file_name: str) -> None:
+        self._write_data(Path(source).read_bytes(), file_name)
+
+    def _write_data(self, body: str | bytes, file_name: str) -> None:
+        data = body.encode("utf-8") if isinstance(body, str) else body
+
+        name = file_name
+        if self.dedupe:
+            extension = "".join(Path(file_name).suffixes)
+            name = f"{hashlib.sha256(data).hexdigest()}-attachment{extension}"
+
+        compressed = self.compress_min_size is not None and len(data) >= self.compress_min_size
+        if compressed:
+            name = f"{name}.gz"
+
+        if name != file_name:
+            self._sources[file_name] = (name, compressed)
+
+        if name in self._written:
+            return
+
+        destination = self._report_dir / name
+        if not destination.exists():
+            # Write to a temporary file first, so other workers never see a partial file
+            temporary = self._report_dir / f".{name}.{os.getpid()}.tmp"
+            temporary.write_bytes(gzip.compress(data, compresslevel=6) if compressed else data)
+            temporary.replace(destination)
+
+        self._written.add(name)
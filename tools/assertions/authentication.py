@@ -1,13 +1,12 @@
-import allure
-
 from clients.authentication.authentication_schema import LoginResponseSchema
+from tools.allure.steps import assertion_step
 from tools.assertions.base import assert_equal, assert_is_true
 from tools.logger import get_logger
 
 logger = get_logger("AUTHENTICATION_ASSERTIONS")
 
 
-@allure.step("Check login response")
+@assertion_step("Check login response")
 def assert_login_response(response: LoginResponseSchema):
     """
     Checks the correctness of the response for successful authorization.
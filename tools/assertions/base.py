@@ -1,13 +1,12 @@
 from typing import Any, Sized
 
-import allure
-
+from tools.allure.steps import assertion_step
 from tools.logger import get_logger
 
 logger = get_logger("BASE_ASSERTIONS")
 
 
-@allure.step("Check that response status code equals to {expected}")
+@assertion_step("Check that response status code equals to {expected}")
 def assert_status_code(actual: int, expected: int):
     """
     Verifies that the actual response status code matches the expected one.
@@ -16,14 +15,14 @@ def assert_status_code(actual: int, expected: int):
     :param expected: The expected status code.
     :raises AssertionError: If the status codes do not match.
     """
-    logger.info(f"Check that response status code equals to {expected}")
+    logger.info("Check that response status code equals to %s", expected)
 
     assert actual == expected, (
         f"Incorrect response status code. Expected status code: {expected}. Actual status code: {actual}"
     )
 
 
-@allure.step("Check that {name} equals to {expected}")
+@assertion_step("Check that {name} equals to {expected}")
 def assert_equal(actual: Any, expected: Any, name: str):
     """
     Verifies that the actual value matches the expected one.
@@ -33,14 +32,14 @@ def assert_equal(actual: Any, expected: Any, name: str):
     :param name: The name of the value being verified.
     :raises AssertionError: If the actual value does not match the expected one.
     """
-    logger.info(f'Check that "{name}" equals to {expected}')
+    logger.info('Check that "%s" equals to %s', name, expected)
 
     assert actual == expected, (
         f'Incorrect value: "{name}". Expected value: {expected}. Actual value: {actual}'
     )
 
 
-@allure.step("Check that {name} is true")
+@assertion_step("Check that {name} is true")
 def assert_is_true(actual: Any, name: str):
     """
     Verifies that the actual value is true.
@@ -49,7 +48,7 @@ def assert_is_true(actual: Any, name: str):
     :param name: The name of the value being verified.
     :raises AssertionError: If the actual value is false.
     """
-    logger.info(f'Check that "{name}" is true')
+    logger.info('Check that "%s" is true', name)
 
     assert actual, f'Incorrect value: "{name}". Expected true value but got: {actual}'
 
@@ -63,11 +62,13 @@ def assert_length(actual: Sized, expected: Sized, name: str):
     :param name: The name of the object being verified.
     :raises AssertionError: If the lengths do not match.
     """
-    with allure.step(f"Check that length of {name} equals to {len(expected)}"):
-        logger.info(f'Check that length of "{name}" equals to {len(expected)}')
-
-        assert len(actual) == len(expected), (
-            f'Incorrect object length: "{name}". '
-            f"Expected length: {len(expected)}. "
-            f"Actual length: {len(actual)}"
-        )
+    _assert_length(len(actual), len(expected), name)
+
+
+@assertion_step("Check that length of {name} equals to {expected}")
+def _assert_length(actual: int, expected: int, name: str):
+    logger.info('Check that length of "%s" equals to %s', name, expected)
+
+    assert actual == expected, (
+        f'Incorrect object length: "{name}". Expected length: {expected}. Actual length: {actual}'
+    )
@@ -0,0 +1,202 @@
+from collections.abc import Sequence
+from typing import Any
+
+import allure
+from pydantic import BaseModel
+
+from tools.allure.steps import assertion_step
+from tools.logger import get_logger
+
+logger = get_logger("BULK_ASSERTIONS")
+
+
+class FieldMismatchSchema(BaseModel):
+    """
+    Field of an item whose actual value differs from the expected one.
+    Fields of nested models are dotted, e.g. "preview_file.id".
+    """
+
+    item: str
+    field: str
+    expected: Any
+    actual: Any
+
+
+class ListDiffSchema(BaseModel):
+    """
+    Differences between an actual and an expected list of models. Items are identified by
+    their index ("[0]") or, when matched by a key field, by its value.
+
+    duplicates are keys found more than once in the actual list, expected_duplicates
+    in the expected one; only the last item of a duplicate key is compared.
+    """
+
+    compared: int
+    mismatches: list[FieldMismatchSchema] = []
+    missing: list[str] = []
+    unexpected: list[str] = []
+    duplicates: list[str] = []
+    expected_duplicates: list[str] = []
+
+    @property
+    def is_empty(self) -> bool:
+        return not (
+            self.mismatches
+            or self.missing
+            or self.unexpected
+            or self.duplicates
+            or self.expected_duplicates
+        )
+
+
+def flatten(data: dict[str, Any], prefix: str = "") -> dict[str, Any]:
+    """
+    :param data: Dumped model.
+    :param prefix: Prefix of the keys, used for nested models.
+    :return: The fields of the model and of its nested models with dotted keys.
+    Lists are compared as a whole.
+    """
+    result: dict[str, Any] = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            result.update(flatten(value, f"{prefix}{key}."))
+        else:
+            result[f"{prefix}{key}"] = value
+
+    return result
+
+
+def diff_fields(
+    item: str, actual: dict[str, Any], expected: dict[str, Any]
+) -> list[FieldMismatchSchema]:
+    """
+    :param item: Identifier of the compared item.
+    :param actual: Dumped actual model.
+    :param expected: Dumped expected model.
+    :return: Mismatching fields of the item.
+    """
+    actual, expected = flatten(actual), flatten(expected)
+    return [
+        FieldMismatchSchema(
+            item=item, field=field, expected=expected.get(field), actual=actual.get(field)
+        )
+        for field in expected.keys() | actual.keys()
+        if actual.get(field) != expected.get(field)
+    ]
+
+
+def _dump_by_key(
+    models: Sequence[BaseModel], key: str, duplicates: list[str]
+) -> dict[str, dict[str, Any]]:
+    items: dict[str, dict[str, Any]] = {}
+    for model in models:
+        item = str(getattr(model, key))
+        if item in items:
+            duplicates.append(item)
+
+        items[item] = model.model_dump()
+
+    return items
+
+
+def diff_models(
+    actual: Sequence[BaseModel],
+    expected: Sequence[BaseModel],
+    key: str | None = None,
+) -> ListDiffSchema:
+    """
+    Compares two lists of models in one pass and collects all differences.
+
+    Every model is dumped once; equal dumps are compared by a single dict comparison,
+    only unequal ones are compared field by field.
+
+    :param actual: Actual models, e.g. from a list response.
+    :param expected: Expected models.
+    :param key: Field identifying the items (e.g., "id"), the order of the lists is then ignored.
+    Items are matched by position by default.
+    :return: ListDiffSchema with all mismatching fields and missing, unexpected
+    and duplicate (in either list) items.
+    """
+    diff = ListDiffSchema(compared=0)
+
+    if key is None:
+        actual_items = {f"[{index}]": model.model_dump() for index, model in enumerate(actual)}
+        expected_items = {f"[{index}]": model.model_dump() for index, model in enumerate(expected)}
+    else:
+        actual_items = _dump_by_key(actual, key, diff.duplicates)
+        expected_items = _dump_by_key(expected, key, diff.expected_duplicates)
+
+    for item, expected_data in expected_items.items():
+        actual_data = actual_items.get(item)
+        if actual_data is None:
+            diff.missing.append(item)
+            continue
+
+        diff.compared += 1
+        if actual_data != expected_data:
+            diff.mismatches.extend(
+                sorted(diff_fields(item, actual_data, expected_data), key=lambda m: m.field)
+            )
+
+    diff.unexpected = [item for item in actual_items if item not in expected_items]
+    return diff
+
+
+def format_diff_table(diff: ListDiffSchema, max_rows: int | None = None) -> str:
+    """
+    :param diff: Differences of two lists.
+    :param max_rows: Maximum number of mismatching fields to list, None for all.
+    :return: Human-readable table of the differences.
+    """
+    lines = [
+        f"Compared items: {diff.compared}, mismatching fields: {len(diff.mismatches)}, "
+        f"missing items: {len(diff.missing)}, unexpected items: {len(diff.unexpected)}, "
+        f"duplicate items: {len(diff.duplicates)}, "
+        f"duplicate expected items: {len(diff.expected_duplicates)}"
+    ]
+    for title, items in (
+        ("Missing", diff.missing),
+        ("Unexpected", diff.unexpected),
+        ("Duplicate", diff.duplicates),
+        ("Duplicate expected", diff.expected_duplicates),
+    ):
+        if items:
+            lines.append(f"{title}: {', '.join(items)}")
+
+    if diff.mismatches:
+        rows = diff.mismatches if max_rows is None else diff.mismatches[:max_rows]
+        lines.extend(["", f"{'Item':<40}{'Field':<24}{'Expected':<40}{'Actual'}"])
+        lines.extend(f"{m.item:<40}{m.field:<24}{m.expected!r:<40}{m.actual!r}" for m in rows)
+        if len(rows) < len(diff.mismatches):
+            lines.append(f"... and {len(diff.mismatches) - len(rows)} more mismatching fields")
+
+    return "\n".join(lines)
+
+
+@assertion_step("Check that {name} match")
+def assert_models_match(
+    actual: Sequence[BaseModel],
+    expected: Sequence[BaseModel],
+    name: str,
+    key: str | None = None,
+):
+    """
+    Verifies that two lists of models are equal, see diff_models().
+
+    Unlike asserting item by item, all differences are collected and reported at once:
+    as a table in the error message (first rows) and in an Allure attachment (all rows).
+
+    :param actual: Actual models, e.g. from a list response.
+    :param expected: Expected models.
+    :param name: The name of the lists being verified.
+    :param key: Field identifying the items (e.g., "id"); by default items are matched by position.
+    :raises AssertionError: If the lists differ.
+    """
+    logger.info('Check that "%s" match: %s items', name, len(expected))
+
+    diff = diff_models(actual, expected, key)
+    if diff.is_empty:
+        return
+
+    allure.attach(format_diff_table(diff), f"Diff of {name}", allure.attachment_type.TEXT)
+    raise AssertionError(f'Incorrect items: "{name}".\n{format_diff_table(diff, max_rows=20)}')
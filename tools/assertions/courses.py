@@ -1,5 +1,3 @@
-import allure
-
 from clients.courses.courses_schema import (
     CourseSchema,
     CreateCourseRequestSchema,
@@ -8,7 +6,9 @@ from clients.courses.courses_schema import (
     UpdateCourseRequestSchema,
     UpdateCourseResponseSchema,
 )
-from tools.assertions.base import assert_equal, assert_length
+from tools.allure.steps import assertion_step
+from tools.assertions.base import assert_equal
+from tools.assertions.bulk import assert_models_match
 from tools.assertions.files import assert_file
 from tools.assertions.users import assert_user
 
@@ -17,7 +17,7 @@ from tools.logger import get_logger
 logger = get_logger("COURSES_ASSERTIONS")
 
 
-@allure.step("Check update course response")
+@assertion_step("Check update course response")
 def assert_update_course_response(
     request: UpdateCourseRequestSchema,
     response: UpdateCourseResponseSchema,
@@ -38,7 +38,7 @@ def assert_update_course_response(
     assert_equal(response.course.estimated_time, request.estimated_time, "estimated_time")
 
 
-@allure.step("Check course")
+@assertion_step("Check course")
 def assert_course(actual: CourseSchema, expected: CourseSchema):
     """
     Checks that the actual course data matches the expected data.
@@ -60,7 +60,7 @@ def assert_course(actual: CourseSchema, expected: CourseSchema):
     assert_user(actual.created_by_user, expected.created_by_user)
 
 
-@allure.step("Check get courses response")
+@assertion_step("Check get courses response")
 def assert_get_courses_response(
     get_courses_response: GetCoursesResponseSchema,
     create_course_responses: list[CreateCourseResponseSchema],
@@ -74,13 +74,14 @@ def assert_get_courses_response(
     """
     logger.info("Check get courses response")
 
-    assert_length(get_courses_response.courses, create_course_responses, "courses")
-
-    for index, create_course_response in enumerate(create_course_responses):
-        assert_course(get_courses_response.courses[index], create_course_response.course)
+    assert_models_match(
+        get_courses_response.courses,
+        [create_course_response.course for create_course_response in create_course_responses],
+        "courses",
+    )
 
 
-@allure.step("Check create course response")
+@assertion_step("Check create course response")
 def assert_create_course_response(
     request: CreateCourseRequestSchema,
     response: CreateCourseResponseSchema,
@@ -1,17 +1,16 @@
-import allure
-
 from clients.errors_schema import (
     InternalErrorResponseSchema,
     ValidationErrorResponseSchema,
     ValidationErrorSchema,
 )
+from tools.allure.steps import assertion_step
 from tools.assertions.base import assert_equal, assert_length
 from tools.logger import get_logger
 
 logger = get_logger("ERRORS_ASSERTIONS")
 
 
-@allure.step("Check validation error")
+@assertion_step("Check validation error")
 def assert_validation_error(actual: ValidationErrorSchema, expected: ValidationErrorSchema):
     """
     Checks that the validation error object matches the expected value.
@@ -29,7 +28,7 @@ def assert_validation_error(actual: ValidationErrorSchema, expected: ValidationE
     assert_equal(actual.location, expected.location, "location")
 
 
-@allure.step("Check validation error response")
+@assertion_step("Check validation error response")
 def assert_validation_error_response(
     actual: ValidationErrorResponseSchema,
     expected: ValidationErrorResponseSchema,
@@ -50,7 +49,7 @@ def assert_validation_error_response(
         assert_validation_error(actual.details[index], detail)
 
 
-@allure.step("Check internal error response")
+@assertion_step("Check internal error response")
 def assert_internal_error_response(
     actual: InternalErrorResponseSchema, expected: InternalErrorResponseSchema
 ):
@@ -1,5 +1,3 @@
-import allure
-
 from clients.errors_schema import InternalErrorResponseSchema
 from clients.exercises.exercises_schema import (
     CreateExerciseRequestSchema,
@@ -10,14 +8,16 @@ from clients.exercises.exercises_schema import (
     UpdateExerciseRequestSchema,
     UpdateExerciseResponseSchema,
 )
-from tools.assertions.base import assert_equal, assert_length
+from tools.allure.steps import assertion_step
+from tools.assertions.base import assert_equal
+from tools.assertions.bulk import assert_models_match
 from tools.assertions.errors import assert_internal_error_response
 from tools.logger import get_logger
 
 logger = get_logger("EXERCISES_ASSERTIONS")
 
 
-@allure.step("Check create exercise response")
+@assertion_step("Check create exercise response")
 def assert_create_exercise_response(
     request: CreateExerciseRequestSchema, response: CreateExerciseResponseSchema
 ):
@@ -43,7 +43,7 @@ def assert_create_exercise_response(
     )
 
 
-@allure.step("Check exercise")
+@assertion_step("Check exercise")
 def assert_exercise(actual: ExerciseSchema, expected: ExerciseSchema):
     """
     Checks that the actual exercise matches the expected exercise.
@@ -64,7 +64,7 @@ def assert_exercise(actual: ExerciseSchema, expected: ExerciseSchema):
     assert_equal(actual=actual.estimated_time, expected=expected.estimated_time, name="estimated_time")
 
 
-@allure.step("Check get exercise response")
+@assertion_step("Check get exercise response")
 def assert_get_exercise_response(
     get_exercise_response: GetExerciseResponseSchema,
     create_exercise_response: CreateExerciseResponseSchema,
@@ -81,7 +81,7 @@ def assert_get_exercise_response(
     assert_exercise(get_exercise_response.exercise, create_exercise_response.exercise)
 
 
-@allure.step("Check update exercise response")
+@assertion_step("Check update exercise response")
 def assert_update_exercise_response(
     request: UpdateExerciseRequestSchema,
     response: UpdateExerciseResponseSchema,
@@ -105,7 +105,7 @@ def assert_update_exercise_response(
     )
 
 
-@allure.step("Check exercise not found response")
+@assertion_step("Check exercise not found response")
 def assert_exercise_not_found_response(actual: InternalErrorResponseSchema):
     """
     Checks that the response for an exercise not found error matches the expected internal error.
@@ -119,7 +119,7 @@ def assert_exercise_not_found_response(actual: InternalErrorResponseSchema):
     assert_internal_error_response(actual, expected)
 
 
-@allure.step("Check get exercises response")
+@assertion_step("Check get exercises response")
 def assert_get_exercises_response(
     get_exercises_response: GetExercisesResponseSchema,
     create_exercise_responses: list[CreateExerciseResponseSchema],
@@ -133,6 +133,11 @@ def assert_get_exercises_response(
     """
     logger.info("Check get exercises response")
 
-    assert_length(get_exercises_response.exercises, create_exercise_responses, "exercises")
-    for index, create_exercise_response in enumerate(create_exercise_responses):
-        assert_exercise(get_exercises_response.exercises[index], create_exercise_response.exercise)
+    assert_models_match(
+        get_exercises_response.exercises,
+        [
+            create_exercise_response.exercise
+            for create_exercise_response in create_exercise_responses
+        ],
+        "exercises",
+    )
@@ -1,5 +1,3 @@
-import allure
-
 from clients.errors_schema import (
     InternalErrorResponseSchema,
     ValidationErrorResponseSchema,
@@ -12,6 +10,7 @@ from clients.files.files_schema import (
     GetFileResponseSchema,
 )
 from config import settings
+from tools.allure.steps import assertion_step
 from tools.assertions.base import assert_equal
 from tools.assertions.errors import (
     assert_internal_error_response,
@@ -22,7 +21,7 @@ from tools.logger import get_logger
 logger = get_logger("FILES_ASSERTIONS")
 
 
-@allure.step("Check create file response")
+@assertion_step("Check create file response")
 def assert_create_file_response(
     request: CreateFileRequestSchema,
     response: CreateFileResponseSchema,
@@ -43,7 +42,7 @@ def assert_create_file_response(
     assert_equal(response.file.directory, request.directory, "directory")
 
 
-@allure.step("Check file")
+@assertion_step("Check file")
 def assert_file(actual: FileSchema, expected: FileSchema):
     """
     Checks that the actual file data matches the expected data.
@@ -60,7 +59,7 @@ def assert_file(actual: FileSchema, expected: FileSchema):
     assert_equal(actual=actual.directory, expected=expected.directory, name="directory")
 
 
-@allure.step("Check get file response")
+@assertion_step("Check get file response")
 def assert_get_file_response(
     get_file_response: GetFileResponseSchema, create_file_response: CreateFileResponseSchema
 ):
@@ -76,7 +75,7 @@ def assert_get_file_response(
     assert_file(get_file_response.file, create_file_response.file)
 
 
-@allure.step("Check create file with empty filename response")
+@assertion_step("Check create file with empty filename response")
 def assert_create_file_with_empty_filename_response(actual: ValidationErrorResponseSchema):
     """
     Checks that the response for creating a file with an empty filename matches the expected validation error.
@@ -100,7 +99,7 @@ def assert_create_file_with_empty_filename_response(actual: ValidationErrorRespo
     assert_validation_error_response(actual, expected)
 
 
-@allure.step("Check create file with empty directory response")
+@assertion_step("Check create file with empty directory response")
 def assert_create_file_with_empty_directory_response(actual: ValidationErrorResponseSchema):
     """
     Checks that the response for creating a file with an empty directory value matches the expected validation error.
@@ -124,7 +123,7 @@ def assert_create_file_with_empty_directory_response(actual: ValidationErrorResp
     assert_validation_error_response(actual, expected)
 
 
-@allure.step("Check file not found response")
+@assertion_step("Check file not found response")
 def assert_file_not_found_response(actual: InternalErrorResponseSchema):
     """
     Checks that the response for a file not found error matches the expected internal error.
@@ -139,7 +138,7 @@ def assert_file_not_found_response(actual: InternalErrorResponseSchema):
     assert_internal_error_response(actual, expected)
 
 
-@allure.step("Check get file with incorrect file id response")
+@assertion_step("Check get file with incorrect file id response")
 def assert_get_file_with_incorrect_file_id_response(actual: ValidationErrorResponseSchema):
     """
     Checks that the response for getting a file with an incorrect file ID matches the expected validation error.
@@ -0,0 +1,135 @@
+from collections.abc import Callable
+
+from httpx import Response
+
+from clients.request_timings import get_response_time
+from config import DEFAULT_LATENCY_SLO_PERCENTILE
+from tools.allure.steps import assertion_step
+from tools.latency.histogram import LatencyHistogram
+from tools.latency.recorder import LatencyRecorder, get_latency_recorder
+from tools.logger import get_logger
+
+logger = get_logger("LATENCY_ASSERTIONS")
+
+
+def format_latency_summary(histogram: LatencyHistogram) -> str:
+    """
+    :param histogram: Recorded latencies.
+    :return: One-line summary of the latency distribution in milliseconds.
+    """
+    return (
+        f"requests={histogram.total}, p50={histogram.percentile(50) * 1000:.1f} ms, "
+        f"p90={histogram.percentile(90) * 1000:.1f} ms, "
+        f"p95={histogram.percentile(95) * 1000:.1f} ms, "
+        f"p99={histogram.percentile(99) * 1000:.1f} ms, max={histogram.max / 1000:.1f} ms"
+    )
+
+
+@assertion_step("Check that response time of {name} is within {budget_ms} ms")
+def assert_response_time(response: Response, budget_ms: float, name: str = "response"):
+    """
+    Verifies a single-call latency budget.
+
+    :param response: Response received by one of the API clients.
+    :param budget_ms: Maximum allowed time until the response headers, in milliseconds.
+    :param name: The name of the call being verified.
+    :raises AssertionError: If the response took longer than the budget.
+    """
+    actual = get_response_time(response) * 1000
+    logger.info('Check that response time of "%s" is within %s ms', name, budget_ms)
+
+    assert actual <= budget_ms, (
+        f'Latency budget exceeded: "{name}" ({response.request.method} {response.request.url}). '
+        f"Expected response time: <= {budget_ms} ms. Actual response time: {actual:.1f} ms"
+    )
+
+
+@assertion_step("Check that p{percentile} latency of {name} is within {budget_ms} ms")
+def assert_latency_percentile(
+    histogram: LatencyHistogram, percentile: float, budget_ms: float, name: str
+):
+    """
+    Verifies that a latency percentile stays within the budget.
+
+    :param histogram: Recorded latencies.
+    :param percentile: Percentile from 0 to 100 (100 checks the slowest request).
+    :param budget_ms: Maximum allowed latency of the percentile, in milliseconds.
+    :param name: The name of what was recorded (endpoint, client method, test).
+    :raises AssertionError: If nothing was recorded or the percentile exceeds the budget.
+    """
+    logger.info('Check that p%g latency of "%s" is within %s ms', percentile, name, budget_ms)
+
+    assert histogram.total, f'Latency SLO cannot be checked: no requests of "{name}" recorded'
+
+    actual = histogram.percentile(percentile) * 1000
+    assert actual <= budget_ms, (
+        f'Latency SLO violated: "{name}". '
+        f"Expected p{percentile:g}: <= {budget_ms} ms. Actual p{percentile:g}: {actual:.1f} ms. "
+        f"Recorded: {format_latency_summary(histogram)}"
+    )
+
+
+def assert_client_method_latency(
+    client_method: Callable | str,
+    percentile: float,
+    budget_ms: float,
+    recorder: LatencyRecorder | None = None,
+):
+    """
+    Verifies the latency of all calls of a client method, e.g. across the session.
+
+    :param client_method: The method (e.g., CoursesClient.get_course_api) or its qualified name.
+    :param percentile: Percentile from 0 to 100.
+    :param budget_ms: Maximum allowed latency of the percentile, in milliseconds.
+    :param recorder: Recorder to read from, the one of the current process by default.
+    :raises AssertionError: If the percentile exceeds the budget.
+    """
+    name = client_method if isinstance(client_method, str) else client_method.__qualname__
+    recorder = recorder or get_latency_recorder()
+    assert_latency_percentile(recorder.get_client_method(name), percentile, budget_ms, name)
+
+
+def assert_endpoint_latency(
+    endpoint: str,
+    percentile: float,
+    budget_ms: float,
+    recorder: LatencyRecorder | None = None,
+):
+    """
+    Verifies the latency of all requests to an endpoint, e.g. across the session.
+
+    :param endpoint: HTTP method and endpoint template, e.g. "GET /api/v1/courses/{course_id}".
+    :param percentile: Percentile from 0 to 100.
+    :param budget_ms: Maximum allowed latency of the percentile, in milliseconds.
+    :param recorder: Recorder to read from, the one of the current process by default.
+    :raises AssertionError: If the percentile exceeds the budget.
+    """
+    recorder = recorder or get_latency_recorder()
+    assert_latency_percentile(recorder.get_endpoint(endpoint), percentile, budget_ms, endpoint)
+
+
+def assert_latency_slo(
+    recorder: LatencyRecorder,
+    budget_ms: float,
+    percentile: float = DEFAULT_LATENCY_SLO_PERCENTILE,
+    endpoint: str | None = None,
+    client_method: Callable | str | None = None,
+    name: str = "all requests",
+):
+    """
+    Verifies a latency SLO of an endpoint, of a client method or of all recorded requests.
+
+    :param recorder: Recorder to read from.
+    :param budget_ms: Maximum allowed latency of the percentile, in milliseconds.
+    :param percentile: Percentile from 0 to 100.
+    :param endpoint: HTTP method and endpoint template to check.
+    :param client_method: Client method or its qualified name to check.
+    :param name: The name of the recorded requests if neither endpoint nor method is given.
+    :raises AssertionError: If the percentile exceeds the budget.
+    """
+    if endpoint:
+        assert_endpoint_latency(endpoint, percentile, budget_ms, recorder)
+    elif client_method:
+        assert_client_method_latency(client_method, percentile, budget_ms, recorder)
+    else:
+        assert_latency_percentile(recorder.get_all(), percentile, budget_ms, name)
@@ -1,27 +1,110 @@
+import json
+from collections.abc import Callable
+from functools import cache
+from threading import Lock
 from typing import Any
 
-import allure
-from jsonschema import validate
+from jsonschema.exceptions import best_match
 from jsonschema.validators import Draft202012Validator
+from pydantic import BaseModel
 
+from clients.schema_registry import get_json_schema
+from config import settings
+from tools.allure.steps import assertion_step
 from tools.logger import get_logger
 
+try:
+    import fastjsonschema
+except ImportError:  # optional backend
+    fastjsonschema = None
+
 logger = get_logger("SCHEMA_ASSERTIONS")
 
+SchemaValidator = Callable[[Any], None]
+
+_validators: dict[str, SchemaValidator] = {}
+_validators_lock = Lock()
 
-@allure.step("Validate JSON schema")
-def validate_json_schema(instance: Any, schema: dict) -> None:
+
+@assertion_step("Validate JSON schema")
+def validate_json_schema(instance: Any, schema: dict | type[BaseModel]) -> None:
     """
     Validates if a JSON object (instance) conforms to the given JSON schema.
 
     :param instance: The JSON data to validate.
-    :param schema: The expected JSON schema.
+    :param schema: The expected JSON schema or the pydantic model describing it.
     :raises jsonschema.exceptions.ValidationError: If the instance doesn't conform to the schema.
     """
     logger.info("Validating JSON schema")
 
-    validate(
-        schema=schema,
-        instance=instance,
-        format_checker=Draft202012Validator.FORMAT_CHECKER,
-    )
+    if isinstance(schema, type):
+        get_model_validator(schema)(instance)
+    else:
+        get_schema_validator(schema)(instance)
+
+
+@cache
+def get_model_validator(model: type[BaseModel]) -> SchemaValidator:
+    """
+    :param model: Pydantic model describing the JSON data.
+    :return: Compiled validator of the model's JSON schema (see clients.schema_registry),
+    created once per model.
+    """
+    return get_schema_validator(get_json_schema(model))
+
+
+def get_schema_validator(schema: dict) -> SchemaValidator:
+    """
+    Returns a compiled validator of the schema, compiling it on first use.
+
+    Validators are cached by the canonical JSON of the schema, so equal schemas share one
+    validator even if every test builds a new dict (e.g., with model_json_schema()).
+
+    :param schema: JSON schema.
+    :return: Function raising jsonschema.exceptions.ValidationError for invalid data.
+    """
+    key = json.dumps(schema, sort_keys=True)
+    if (validator := _validators.get(key)) is not None:
+        return validator
+
+    validator = compile_schema_validator(schema, settings.schema_validation.backend)
+    with _validators_lock:
+        return _validators.setdefault(key, validator)
+
+
+def compile_schema_validator(schema: dict, backend: str) -> SchemaValidator:
+    """
+    Compiles a validator of the schema.
+
+    The "jsonschema" backend checks the schema against the Draft 2020-12 meta-schema once and
+    keeps a Draft202012Validator with the format checker. The "fastjsonschema" backend
+    generates Python code for the schema, which is much faster on large list responses; it is
+    only used to accept valid data, invalid data is re-validated with jsonschema, so the
+    error is the same with both backends.
+
+    :param schema: JSON schema.
+    :param backend: "jsonschema" or "fastjsonschema" (requires the fastjsonschema package).
+    :return: Function raising jsonschema.exceptions.ValidationError for invalid data.
+    """
+    Draft202012Validator.check_schema(schema)
+    validator = Draft202012Validator(schema, format_checker=Draft202012Validator.FORMAT_CHECKER)
+
+    def validate(instance: Any) -> None:
+        if error := best_match(validator.iter_errors(instance)):
+            raise error
+
+    if backend == "jsonschema":
+        return validate
+
+    if fastjsonschema is None:
+        raise RuntimeError(f'Schema validation backend "{backend}" requires fastjsonschema')
+
+    fast_validate = fastjsonschema.compile(schema)
+
+    def validate_fast(instance: Any) -> None:
+        try:
+            fast_validate(instance)
+        except fastjsonschema.JsonSchemaException:
+            validate(instance)
+
+    return validate_fast
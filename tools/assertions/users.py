@@ -1,18 +1,17 @@
-import allure
-
 from clients.users.users_schema import (
     CreateUserRequestSchema,
     CreateUserResponseSchema,
     GetUserResponseSchema,
     UserSchema,
 )
+from tools.allure.steps import assertion_step
 from tools.assertions.base import assert_equal
 from tools.logger import get_logger
 
 logger = get_logger("USERS_ASSERTIONS")
 
 
-@allure.step("Check create user response")
+@assertion_step("Check create user response")
 def assert_create_user_response(request: CreateUserRequestSchema, response: CreateUserResponseSchema):
     """
     Verifies that the user creation response matches the request.
@@ -29,7 +28,7 @@ def assert_create_user_response(request: CreateUserRequestSchema, response: Crea
     assert_equal(response.user.middle_name, request.middle_name, "middle_name")
 
 
-@allure.step("Check user")
+@assertion_step("Check user")
 def assert_user(actual: UserSchema, expected: UserSchema):
     """
     Assert that two UserSchema objects have the same properties.
@@ -48,7 +47,7 @@ def assert_user(actual: UserSchema, expected: UserSchema):
     assert_equal(actual=actual.middle_name, expected=expected.middle_name, name="middle_name")
 
 
-@allure.step("Check get user response")
+@assertion_step("Check get user response")
 def assert_get_user_response(
     get_user_response: GetUserResponseSchema, create_user_response: CreateUserResponseSchema
 ):
@@ -0,0 +1,180 @@
+"""
+Micro-benchmark of the per-call overhead of the framework loggers.
+
+Usage:
+    python -m tools.benchmark.logs [--calls 100000] [--output logs-benchmark.json]
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from tools.logger import create_json_file_handler, create_queue_handler, create_stream_handler
+
+
+class LogBenchmarkSchema(BaseModel):
+    """
+    Cost of one logging setup, in microseconds per call.
+
+    call is the time spent in the logging thread; total also includes draining the queue,
+    i.e. formatting and writing every record.
+    """
+
+    name: str
+    calls: int
+    call: float
+    total: float
+
+
+class LogBenchmarkReportSchema(BaseModel):
+    results: list[LogBenchmarkSchema]
+
+
+def measure(
+    name: str,
+    calls: int,
+    log: Callable[[logging.Logger, int], None],
+    handlers: list[logging.Handler],
+    level: int = logging.DEBUG,
+    queued: bool = True,
+) -> LogBenchmarkSchema:
+    """
+    Logs the given number of records through a dedicated logger.
+
+    :param name: Name of the setup.
+    :param calls: Number of log calls.
+    :param log: Function making one log call with the logger and the call index.
+    :param handlers: Handlers doing the formatting and I/O.
+    :param level: Level of the logger.
+    :param queued: Pass records to the handlers through the background queue
+    like tools.logger does, or call the handlers synchronously.
+    :return: LogBenchmarkSchema with the cost per call.
+    """
+    logger = logging.getLogger(f"LOGS_BENCHMARK.{name}")
+    logger.setLevel(level)
+    logger.propagate = False
+
+    listener = None
+    if queued:
+        handler, listener = create_queue_handler(*handlers)
+        logger.addHandler(handler)
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
+
+    started_at = time.perf_counter()
+    for index in range(calls):
+        log(logger, index)
+
+    called_at = time.perf_counter()
+    if listener:
+        listener.stop()
+
+    finished_at = time.perf_counter()
+    for handler in handlers:
+        handler.close()
+
+    return LogBenchmarkSchema(
+        name=name,
+        calls=calls,
+        call=(called_at - started_at) / calls * 1_000_000,
+        total=(finished_at - started_at) / calls * 1_000_000,
+    )
+
+
+def run(calls: int) -> LogBenchmarkReportSchema:
+    """
+    :param calls: Number of log calls per setup.
+    :return: Costs of synchronous and queued output, with and without the JSON file,
+    and of disabled levels.
+    """
+
+    def log_lazy(logger: logging.Logger, index: int) -> None:
+        logger.info('Check that "%s" equals to %s', "name", index)
+
+    def log_eager(logger: logging.Logger, index: int) -> None:
+        logger.info(f'Check that "name" equals to {index}')
+
+    with open(os.devnull, "w") as devnull, tempfile.TemporaryDirectory() as directory:
+        return LogBenchmarkReportSchema(
+            results=[
+                measure(
+                    "sync stream",
+                    calls,
+                    log_lazy,
+                    [create_stream_handler(devnull)],
+                    queued=False,
+                ),
+                measure("queued stream", calls, log_lazy, [create_stream_handler(devnull)]),
+                measure(
+                    "sync stream + JSON file",
+                    calls,
+                    log_lazy,
+                    [
+                        create_stream_handler(devnull),
+                        create_json_file_handler(Path(directory, "sync.jsonl")),
+                    ],
+                    queued=False,
+                ),
+                measure(
+                    "queued stream + JSON file",
+                    calls,
+                    log_lazy,
+                    [
+                        create_stream_handler(devnull),
+                        create_json_file_handler(Path(directory, "queued.jsonl")),
+                    ],
+                ),
+                measure(
+                    "disabled level, f-string",
+                    calls,
+                    log_eager,
+                    [create_stream_handler(devnull)],
+                    level=logging.WARNING,
+                ),
+                measure(
+                    "disabled level, lazy",
+                    calls,
+                    log_lazy,
+                    [create_stream_handler(devnull)],
+                    level=logging.WARNING,
+                ),
+            ]
+        )
+
+
+def format_report(report: LogBenchmarkReportSchema) -> str:
+    """
+    :param report: Report of a benchmark run.
+    :return: Human-readable table of the report.
+    """
+    lines = [f"{'Setup':<32}{'Calls':>10}{'us/call':>10}{'us/total':>10}"]
+    lines.extend(
+        f"{r.name:<32}{r.calls:>10}{r.call:>10.2f}{r.total:>10.2f}" for r in report.results
+    )
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--calls", type=int, default=100_000, help="Log calls per setup")
+    parser.add_argument("--output", help="Path of the JSON report")
+    args = parser.parse_args()
+
+    report = run(args.calls)
+    print(format_report(report))
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(report.model_dump_json(indent=2))
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,174 @@
+import fcntl
+import os
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from pathlib import Path
+
+from pydantic import BaseModel, ByteSize
+
+from clients.authentication.token_cache import get_token_cache_run_id
+from clients.files.files_client import FilesClient
+from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema
+from tools.latency.percentile import percentile
+from tools.logger import get_logger
+
+logger = get_logger("UPLOAD_BENCHMARK")
+
+BLOCK_SIZE = 1024 * 1024
+
+
+class UploadBenchmarkSchema(BaseModel):
+    """
+    Result of uploading files of one size at one concurrency level.
+
+    duration is in seconds, throughput in MB/s (10^6 bytes), latencies in milliseconds
+    and memory_peak is the peak of memory allocated by the client process during concurrency
+    simultaneous uploads, in MB.
+    """
+
+    file_size: int
+    concurrency: int
+    uploads: int
+    errors: int
+    duration: float
+    throughput: float
+    p50: float
+    p90: float
+    p99: float
+    max: float
+    memory_peak: float
+
+
+class UploadBenchmarkReportSchema(BaseModel):
+    """
+    Results of one benchmark run, sorted by file size and concurrency.
+    """
+
+    run_id: str
+    results: list[UploadBenchmarkSchema] = []
+
+
+def generate_file(path: Path, size: int) -> Path:
+    """
+    Writes a file of random bytes without holding more than one block in memory.
+
+    Every block is random, so neither the transport nor the file service can compress
+    or deduplicate the uploads.
+
+    :param path: Path of the file to create.
+    :param size: Size of the file in bytes.
+    :return: Path of the created file.
+    """
+    with path.open("wb") as file:
+        for offset in range(0, size, BLOCK_SIZE):
+            file.write(os.urandom(min(BLOCK_SIZE, size - offset)))
+
+    return path
+
+
+def run_upload_benchmark(
+    files_client: FilesClient, path: Path, concurrency: int, uploads: int
+) -> UploadBenchmarkSchema:
+    """
+    Uploads the file the given number of times by a pool of concurrent threads.
+
+    Tracing memory allocations slows the uploads down, so the memory peak is measured by
+    a separate untimed round of concurrency uploads after the timed ones.
+
+    Uploaded files are deleted right after the measurement,
+    so large benchmarks do not fill the storage of the file service.
+
+    :param files_client: Client to upload the files with.
+    :param path: File to upload.
+    :param concurrency: Number of uploads in flight at the same time.
+    :param uploads: Total number of uploads.
+    :return: UploadBenchmarkSchema with throughput, latency and memory of the uploads.
+    """
+    file_size = path.stat().st_size
+    logger.info(
+        "Uploading %s files of %s with concurrency %s",
+        uploads,
+        ByteSize(file_size).human_readable(),
+        concurrency,
+    )
+
+    def upload() -> tuple[float, str | None]:
+        started_at = time.perf_counter()
+        response = files_client.create_file_api(CreateFileRequestSchema(upload_file=path))
+        elapsed = time.perf_counter() - started_at
+
+        if response.status_code != HTTPStatus.OK:
+            return elapsed, None
+
+        return elapsed, response.parse(CreateFileResponseSchema).file.id
+
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(lambda _: upload(), range(uploads)))
+
+    duration = time.perf_counter() - started_at
+
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+
+    baseline, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        traced_results = list(executor.map(lambda _: upload(), range(concurrency)))
+
+    _, peak = tracemalloc.get_traced_memory()
+    if not tracing:
+        tracemalloc.stop()
+
+    for _, file_id in results + traced_results:
+        if file_id:
+            files_client.delete_file_api(file_id)
+
+    latencies = sorted(elapsed * 1000 for elapsed, _ in results)
+    return UploadBenchmarkSchema(
+        file_size=file_size,
+        concurrency=concurrency,
+        uploads=uploads,
+        errors=sum(1 for _, file_id in results if file_id is None),
+        duration=duration,
+        throughput=file_size * uploads / duration / 1_000_000,
+        p50=percentile(latencies, 50),
+        p90=percentile(latencies, 90),
+        p99=percentile(latencies, 99),
+        max=latencies[-1],
+        memory_peak=(peak - baseline) / 1_000_000,
+    )
+
+
+def save_upload_benchmark(path: Path, result: UploadBenchmarkSchema) -> None:
+    """
+    Adds the result to the report file of the current run.
+
+    pytest-xdist workers write to the same file under a lock; a report left by a previous run
+    is replaced, and a result of the same file size and concurrency overwrites the old one.
+
+    :param path: Report file.
+    :param result: Benchmark result to save.
+    """
+    run_id = get_token_cache_run_id()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a+") as file:
+        fcntl.flock(file, fcntl.LOCK_EX)
+
+        file.seek(0)
+        report = UploadBenchmarkReportSchema(run_id=run_id)
+        if content := file.read():
+            saved = UploadBenchmarkReportSchema.model_validate_json(content)
+            if saved.run_id == run_id:
+                report = saved
+
+        results = {(item.file_size, item.concurrency): item for item in report.results}
+        results[(result.file_size, result.concurrency)] = result
+        report.results = [results[key] for key in sorted(results)]
+
+        file.seek(0)
+        file.truncate()
+        file.write(report.model_dump_json(indent=2))
@@ -1,16 +1,150 @@
+import hashlib
+import itertools
+import random
+import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+
 from faker import Faker
 
+from config import settings
+from tools.xdist import get_worker_id
+
+
+def get_email_namespace(run_id: str | None = None) -> str:
+    """
+    Returns the email namespace of the current process.
+
+    The namespace combines the pytest-xdist worker ID with the run identifier, so emails
+    generated by different workers and by different runs never collide, even if they
+    replay the same seed.
+
+    :param run_id: Identifier of the run shared by all workers. A random token by default.
+    :return: Namespace to put into the local part of generated emails.
+    """
+    token = run_id[:12] if run_id else uuid.uuid4().hex[:12]
+    return f"{get_worker_id()}{token}"
+
+
+def derive_seed(*parts: object) -> int:
+    """
+    Derives a stable seed from the given parts, e.g. the session seed and a test node ID.
+
+    :param parts: Values identifying what the seed is for.
+    :return: 64-bit seed, the same for the same parts in every process and run.
+    """
+    digest = hashlib.sha256("\0".join(map(str, parts)).encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+class _Generators:
+    """
+    Generators of the values of a Fake in a seeded context, see Fake.seeded().
+    """
+
+    def __init__(self, seed: int):
+        self.faker = Faker()
+        self.faker.seed_instance(seed)
+        self.random = random.Random(seed)
+        self.email_prefix = f"{seed:x}-"
+        self.email_counter = itertools.count()
+
 
 class Fake:
     """
     Class for generating random test data using the Faker library.
+
+    In pooled mode (pool_size > 0) every kind of value is generated by Faker once, in a batch of
+    pool_size values, and then served by picking a random value of the batch in O(1).
+    This makes building large numbers of request payloads (e.g., in load runs) independent
+    of Faker's speed, at the cost of values repeating. Emails are unique in both modes.
+
+    Code running in background threads (e.g., the provisioner) generates its values in
+    a seeded() context, so it neither consumes nor depends on the values of the running test.
     """
 
-    def __init__(self, faker: Faker):
+    def __init__(
+        self,
+        faker: Faker,
+        seed: int | None = None,
+        pool_size: int = 0,
+        namespace: str | None = None,
+    ):
         """
         :param faker: An instance of the Faker class to be used for data generation.
+        :param seed: Seed making the generated values reproducible. Random by default.
+        :param pool_size: Number of pre-generated values of each kind. 0 disables pooling.
+        :param namespace: Namespace making emails unique, see get_email_namespace().
+        """
+        self.pool_size = pool_size
+        self.namespace = namespace or get_email_namespace()
+
+        self._faker = faker
+        self._lock = Lock()
+        self._base_random = random.Random()
+        self._generators: ContextVar[_Generators | None] = ContextVar(
+            "fake_generators", default=None
+        )
+        self._pools: dict[str, list] = {}
+        self._email_counter = itertools.count()
+
+        if seed is not None:
+            self.seed(seed)
+
+    @property
+    def faker(self) -> Faker:
+        """
+        :return: Faker generating the values in the current context.
         """
-        self.faker = faker
+        generators = self._generators.get()
+        return generators.faker if generators else self._faker
+
+    @property
+    def _random(self) -> random.Random:
+        generators = self._generators.get()
+        return generators.random if generators else self._base_random
+
+    @contextmanager
+    def seeded(self, seed: int) -> Iterator[None]:
+        """
+        Generates the values in the current context from generators of its own,
+        seeded with the given seed, e.g. the entities of a chain built in the background.
+
+        The values depend only on the seed, not on the values generated by other threads
+        in the meantime. Emails stay unique, as long as every context has its own seed.
+
+        :param seed: Seed of the values generated in the context.
+        """
+        token = self._generators.set(_Generators(seed))
+        try:
+            yield
+        finally:
+            self._generators.reset(token)
+
+    def seed(self, seed: int) -> None:
+        """
+        Re-seeds the generator, so the values generated from now on are reproducible.
+
+        Pools that are already generated are kept, only the choice of values is re-seeded.
+        Emails stay unique: their counter is never reset.
+
+        :param seed: New seed.
+        """
+        self.faker.seed_instance(seed)
+        self._random.seed(seed)
+
+    def warm_up(self) -> None:
+        """
+        Generates the pools of all pooled values in advance (e.g., at session start),
+        so the first tests don't pay for it. Does nothing if pooling is disabled.
+        """
+        if not self.pool_size:
+            return
+
+        for name in self._get_pooled_generators():
+            self._get_pool(name)
 
     def text(self) -> str:
         """
@@ -18,7 +152,7 @@ class Fake:
 
         :return: Random text.
         """
-        return self.faker.text()
+        return self._get("text", self.faker.text)
 
     def uuid4(self) -> str:
         """
@@ -26,16 +160,28 @@ class Fake:
 
         :return: A random UUID4.
         """
+        if self.pool_size:
+            return str(uuid.UUID(int=self._random.getrandbits(128), version=4))
+
         return self.faker.uuid4()
 
     def email(self, domain: str | None = None) -> str:
         """
-        Generates a random email address.
+        Generates a random email address, unique across processes and pytest-xdist workers.
 
         :param domain: Optional domain name to use in the email address.
         :return: A random email address.
         """
-        return self.faker.email(domain=domain)
+        user_name = self._get("user_name", self.faker.user_name)
+        domain = domain or self._get("domain_name", self.faker.safe_domain_name)
+
+        generators = self._generators.get()
+        if generators:
+            number = f"{generators.email_prefix}{next(generators.email_counter)}"
+        else:
+            number = next(self._email_counter)
+
+        return f"{user_name}.{self.namespace}.{number}@{domain}"
 
     def sentence(self) -> str:
         """
@@ -43,7 +189,7 @@ class Fake:
 
         :return: A random sentence.
         """
-        return self.faker.sentence()
+        return self._get("sentence", self.faker.sentence)
 
     def password(self) -> str:
         """
@@ -51,7 +197,7 @@ class Fake:
 
         :return: A random password.
         """
-        return self.faker.password()
+        return self._get("password", self.faker.password)
 
     def last_name(self) -> str:
         """
@@ -59,7 +205,7 @@ class Fake:
 
         :return: A random last name.
         """
-        return self.faker.last_name()
+        return self._get("last_name", self.faker.last_name)
 
     def first_name(self) -> str:
         """
@@ -67,7 +213,7 @@ class Fake:
 
         :return: A random first name.
         """
-        return self.faker.first_name()
+        return self._get("first_name", self.faker.first_name)
 
     def middle_name(self) -> str:
         """
@@ -75,7 +221,7 @@ class Fake:
 
         :return: A random middle name.
         """
-        return self.faker.first_name()
+        return self.first_name()
 
     def estimated_time(self) -> str:
         """
@@ -93,6 +239,9 @@ class Fake:
         :param end: The end of the range (inclusive).
         :return: A random integer.
         """
+        if self.pool_size:
+            return self._random.randint(start, end)
+
         return self.faker.random_int(start, end)
 
     def max_score(self) -> int:
@@ -111,6 +260,33 @@ class Fake:
         """
         return self.integer(1, 30)
 
+    def _get_pooled_generators(self) -> dict[str, Callable[[], str]]:
+        # Pools are shared by all contexts, so they are always generated by the session Faker
+        return {
+            "text": self._faker.text,
+            "sentence": self._faker.sentence,
+            "password": self._faker.password,
+            "last_name": self._faker.last_name,
+            "first_name": self._faker.first_name,
+            "user_name": self._faker.user_name,
+            "domain_name": self._faker.safe_domain_name,
+        }
+
+    def _get(self, name: str, generate: Callable[[], str]) -> str:
+        if not self.pool_size:
+            return generate()
+
+        pool = self._pools.get(name) or self._get_pool(name)
+        return pool[self._random.randrange(len(pool))]
+
+    def _get_pool(self, name: str) -> list[str]:
+        with self._lock:
+            if name not in self._pools:
+                generate = self._get_pooled_generators()[name]
+                self._pools[name] = [generate() for _ in range(self.pool_size)]
+
+            return self._pools[name]
+
 
 # Create an instance of the Fake class using Faker
-fake = Fake(faker=Faker())
+fake = Fake(faker=Faker(), seed=settings.faker.seed, pool_size=settings.faker.pool_size)
@@ -0,0 +1,37 @@
+from httpx import Request, RequestNotRead
+
+
+def get_request_body(request: Request) -> bytes | None:
+    """
+    :param request: HTTPX request object.
+    :return: Body of the request if it is held in memory (JSON, form data), None for streamed
+    bodies (e.g., file uploads), which are read from the file only while being sent.
+    """
+    try:
+        return request.content
+    except RequestNotRead:
+        return None
+
+
+def get_request_body_size(request: Request) -> int | None:
+    """
+    :param request: HTTPX request object.
+    :return: Size of the body in bytes, None if it is sent with chunked transfer encoding.
+    """
+    if (content_length := request.headers.get("Content-Length")) is not None:
+        return int(content_length)
+
+    return None
+
+
+def has_request_body(request: Request) -> bool:
+    """
+    Checks whether the request has a body without reading streamed bodies into memory.
+
+    :param request: HTTPX request object.
+    :return: True if the request body is not empty.
+    """
+    if (body := get_request_body(request)) is not None:
+        return bool(body)
+
+    return "Transfer-Encoding" in request.headers or bool(get_request_body_size(request))
@@ -0,0 +1,121 @@
+import threading
+from collections import deque
+
+import allure
+from httpx import Request
+
+from config import settings
+from tools.http.curl import make_curl_from_request
+
+CURL_ATTACHMENT_NAME = "cURL command"
+
+
+def attach_curl(request: Request) -> None:
+    """
+    Renders the cURL command of the request and attaches it to the Allure report, with
+    the headers of CURL.REDACT_HEADERS redacted and the body cut to CURL.MAX_BODY_SIZE.
+
+    :param request: HTTPX request object.
+    """
+    curl_command = make_curl_from_request(
+        request,
+        redact_headers=settings.curl.redact_headers,
+        max_body_size=settings.curl.max_body_size,
+    )
+    allure.attach(curl_command, CURL_ATTACHMENT_NAME, allure.attachment_type.TEXT)
+
+
+class CurlCapture:
+    """
+    cURL capture of the requests sent during one test.
+
+    Rendering cURL commands and writing attachments costs more than most requests to a local
+    server, and nobody reads the commands of passed tests. Unless attach_all is set, the capture
+    keeps references to the last buffer_size requests only and renders them when
+    attach_buffered() is called, i.e. when the test fails.
+
+    Only requests sent from the thread that started the capture (the thread running the test)
+    are recorded. Requests of background threads, e.g. fixtures provisioned ahead of time for
+    other tests or the resource teardown, do not belong to the test.
+    """
+
+    def __init__(self, buffer_size: int, attach_all: bool = False):
+        """
+        :param buffer_size: Number of most recent requests to keep.
+        :param attach_all: Attach every request when it is sent, e.g. in debug mode.
+        """
+        self.attach_all = attach_all
+        self.thread_id = threading.get_ident()
+        self._requests: deque[Request] = deque(maxlen=buffer_size)
+        self._dropped = 0
+
+    def record(self, request: Request) -> None:
+        """
+        :param request: HTTPX request object sent during the test.
+        """
+        if self.attach_all:
+            attach_curl(request)
+            return
+
+        if len(self._requests) == self._requests.maxlen:
+            self._dropped += 1
+
+        self._requests.append(request)
+
+    def attach_buffered(self) -> None:
+        """
+        Attaches the cURL commands of the buffered requests, oldest first, and empties the buffer.
+        """
+        if self._dropped:
+            allure.attach(
+                f"{self._dropped} earlier requests are not captured, see CURL.BUFFER_SIZE",
+                CURL_ATTACHMENT_NAME,
+                allure.attachment_type.TEXT,
+            )
+            self._dropped = 0
+
+        while self._requests:
+            attach_curl(self._requests.popleft())
+
+
+_capture: CurlCapture | None = None
+
+
+def start_curl_capture(buffer_size: int, attach_all: bool = False) -> CurlCapture:
+    """
+    Starts capturing the requests of the current test, see CurlCapture.
+
+    :param buffer_size: Number of most recent requests to keep.
+    :param attach_all: Attach every request when it is sent.
+    :return: The started capture.
+    """
+    global _capture
+    _capture = CurlCapture(buffer_size, attach_all)
+    return _capture
+
+
+def stop_curl_capture() -> None:
+    """
+    Stops capturing and releases the buffered requests.
+    """
+    global _capture
+    _capture = None
+
+
+def get_curl_capture() -> CurlCapture | None:
+    """
+    :return: Capture of the current test, None outside of tests.
+    """
+    return _capture
+
+
+def capture_curl(request: Request) -> None:
+    """
+    Passes the request to the capture of the current test.
+    Requests sent outside of tests (e.g., by the load runner) or from other threads than
+    the one running the test are not captured.
+
+    :param request: HTTPX request object.
+    """
+    if (capture := _capture) and capture.thread_id == threading.get_ident():
+        capture.record(request)
@@ -1,22 +1,213 @@
-from httpx import Request, RequestNotRead
+import codecs
+import hashlib
+import os
+from collections.abc import Collection
 
+from httpx import Request
+from httpx._multipart import DataField, FileField, MultipartStream  # no public API for parts
 
-def make_curl_from_request(request: Request) -> str:
+from tools.http.body import get_request_body, get_request_body_size
+
+REDACTED = "<redacted>"
+
+# Headers whose value starts with an authentication scheme that is safe to keep
+AUTH_SCHEME_HEADERS = ("authorization", "proxy-authorization")
+
+TEXT_CONTENT_TYPES = ("text/", "application/json", "application/x-www-form-urlencoded", "+json")
+
+
+def quote(value: str) -> str:
+    """
+    :param value: Value of a cURL argument.
+    :return: The value in single quotes, safe to paste into a POSIX shell.
+    """
+    return "'" + value.replace("'", "'\\''") + "'"
+
+
+def redact_header(name: str, value: str, redact_headers: Collection[str]) -> str:
+    """
+    :param name: Name of the header.
+    :param value: Value of the header.
+    :param redact_headers: Names of the headers to redact, case-insensitive.
+    :return: The value, or a placeholder keeping only the auth scheme of Authorization headers
+    (e.g., "Bearer <redacted>").
+    """
+    if name.lower() not in {header.lower() for header in redact_headers}:
+        return value
+
+    scheme, _, credentials = value.partition(" ")
+    if name.lower() in AUTH_SCHEME_HEADERS and credentials:
+        return f"{scheme} {REDACTED}"
+
+    return REDACTED
+
+
+def truncate(value: str, max_size: int | None) -> str:
+    """
+    :param value: Text of a body or a form field.
+    :param max_size: Maximum size of the text in UTF-8 bytes, None for no limit.
+    :return: The text, cut to max_size with a marker telling how many bytes were left out.
+    """
+    data = value.encode("utf-8")
+    if max_size is None or len(data) <= max_size:
+        return value
+
+    # A character cut in half is left out and counted as truncated
+    head = data[:max_size].decode("utf-8", errors="ignore")
+    omitted = len(data) - len(head.encode("utf-8"))
+    return f"{head}...<truncated: {omitted} of {len(data)} bytes>"
+
+
+def is_text_content_type(content_type: str | None) -> bool:
+    """
+    :param content_type: Value of the Content-Type header.
+    :return: True if the body is text, also if the content type is unknown.
+    """
+    if not content_type:
+        return True
+
+    media_type = content_type.split(";")[0].strip().lower()
+    return any(media_type.startswith(t) or media_type.endswith(t) for t in TEXT_CONTENT_TYPES)
+
+
+def decode_body(body: bytes, max_size: int | None) -> str | None:
+    """
+    Decodes the body as UTF-8 text without decoding more than max_size bytes.
+
+    :param body: Body of the request.
+    :param max_size: Maximum size of the text in bytes, None for no limit.
+    :return: The text with a truncation marker if it is longer, None if the body is binary.
+    """
+    head = body if max_size is None else body[:max_size]
+    try:
+        # An incremental decoder accepts a character cut in half at the end of the head
+        text = codecs.getincrementaldecoder("utf-8")().decode(head, final=len(head) == len(body))
+    except UnicodeDecodeError:
+        return None
+
+    if len(head) < len(body):
+        omitted = len(body) - len(text.encode("utf-8"))
+        text += f"...<truncated: {omitted} of {len(body)} bytes>"
+
+    return text
+
+
+def summarize_binary(body: bytes, content_type: str | None) -> str:
+    """
+    :param body: Binary body of the request.
+    :param content_type: Value of the Content-Type header.
+    :return: Placeholder with the content type, the size and the SHA-256 of the body.
+    """
+    digest = hashlib.sha256(body).hexdigest()
+    return f"<binary body: {content_type or 'unknown type'}, {len(body)} bytes, sha256 {digest}>"
+
+
+def get_file_size(field: FileField) -> int | None:
+    """
+    :param field: File part of a multipart body.
+    :return: Size of the file without reading it, None if it is unknown. Works after
+    the request is sent and the file is closed.
+    """
+    if isinstance(field.file, str | bytes):
+        return len(field.file)
+
+    if isinstance(name := getattr(field.file, "name", None), str) and os.path.isfile(name):
+        return os.path.getsize(name)
+
+    try:
+        return os.fstat(field.file.fileno()).st_size
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def make_multipart_fields(stream: MultipartStream, max_body_size: int | None) -> list[str]:
+    """
+    Lists the parts of a multipart body as cURL -F options without reading the files.
+
+    File parts refer to the uploaded file by its path, if known, so the command can be replayed.
+
+    :param stream: Multipart body of the request.
+    :param max_body_size: Maximum size of the value of a form field in bytes.
+    :return: One -F option per part.
+    """
+    result: list[str] = []
+    for field in stream.fields:
+        if isinstance(field, DataField):
+            if isinstance(field.value, str):
+                value = truncate(field.value, max_body_size)
+            else:
+                data = field.render_data()
+                value = decode_body(data, max_body_size) or summarize_binary(data, None)
+
+            result.append(f"-F {quote(f'{field.name}={value}')}")
+            continue
+
+        path = getattr(field.file, "name", None)
+        option = f"{field.name}=@{path if isinstance(path, str) else field.filename}"
+        if content_type := field.headers.get("Content-Type"):
+            option += f";type={content_type}"
+
+        result.append(f"-F {quote(option)}")
+
+    return result
+
+
+def describe_multipart_files(stream: MultipartStream) -> list[str]:
+    """
+    :param stream: Multipart body of the request.
+    :return: Shell comment per file part with its file name and size.
+    """
+    return [
+        f"# {field.name}: {field.filename}, {get_file_size(field) or 'unknown'} bytes"
+        for field in stream.fields
+        if isinstance(field, FileField)
+    ]
+
+
+def make_curl_from_request(
+    request: Request,
+    redact_headers: Collection[str] = (),
+    max_body_size: int | None = None,
+) -> str:
     """
     Generates a cURL command from an httpx HTTP request.
 
+    Streamed bodies (e.g., file uploads) are never read: multipart bodies are listed part by part
+    (-F options referring to the uploaded files), other streamed bodies are replaced with
+    a placeholder. Binary bodies are summarized (content type, size, SHA-256) instead of decoded,
+    and text bodies longer than max_body_size are truncated with a marker.
+
     :param request: HTTP request from which the cURL command will be formed.
+    :param redact_headers: Names of the headers whose values are replaced with a placeholder,
+    e.g. "Authorization".
+    :param max_body_size: Maximum size of the body (and of a form field) in bytes, None for
+    no limit.
     :return: String with cURL command containing request method, URL, headers and body (if present).
     """
-    result: list[str] = [f"curl -X '{request.method}'", f"'{request.url}'"]
+    result: list[str] = [f"curl -X '{request.method}'", quote(str(request.url))]
 
+    multipart = request.stream if isinstance(request.stream, MultipartStream) else None
     for header, value in request.headers.items():
-        result.append(f"-H '{header}: {value}'")
+        if multipart and header.lower() in ("content-type", "content-length"):
+            # cURL generates the multipart boundary and length of -F options itself
+            continue
 
-    try:
-        if body := request.content:
-            result.append(f"-d '{body.decode('utf-8')}'")
-    except RequestNotRead:
-        pass
+        result.append(f"-H {quote(f'{header}: {redact_header(header, value, redact_headers)}')}")
+
+    if multipart:
+        result.extend(make_multipart_fields(multipart, max_body_size))
+        return "\n".join([" \\\n  ".join(result), *describe_multipart_files(multipart)])
+
+    body = get_request_body(request)
+    content_type = request.headers.get("Content-Type")
+    if body is None:
+        size = get_request_body_size(request)
+        result.append(f"--data-binary '<streamed body: {size or 'unknown'} bytes>'")
+    elif body:
+        text = decode_body(body, max_body_size) if is_text_content_type(content_type) else None
+        if text is None:
+            result.append(f"--data-binary {quote(summarize_binary(body, content_type))}")
+        else:
+            result.append(f"-d {quote(text)}")
 
     return " \\\n  ".join(result)
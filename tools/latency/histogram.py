@@ -0,0 +1,109 @@
+import math
+
+
+class LatencyHistogram:
+    """
+    HDR-style histogram of latencies with a constant relative precision.
+
+    Values are recorded in microseconds into log-linear buckets: every power of two is split
+    into 2 ** (significant_bits - 1) equal sub-buckets, so the error of a reported percentile
+    is below 1 / 2 ** (significant_bits - 1) (0.8% for the default 8 bits) at any magnitude.
+    Recording is an integer bit operation and a dict increment, and histograms of different
+    processes are merged by adding the bucket counts.
+    """
+
+    def __init__(self, significant_bits: int = 8):
+        """
+        :param significant_bits: Number of significant bits kept from every value.
+        """
+        self.significant_bits = significant_bits
+        self.counts: dict[int, int] = {}
+        self.total = 0
+        self.max = 0
+
+    def record(self, seconds: float) -> None:
+        """
+        :param seconds: Latency in seconds.
+        """
+        # Rounded, float seconds are often slightly below the whole number of microseconds
+        value = round(seconds * 1_000_000)
+        index = self._get_index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.total += 1
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Adds the values recorded by another histogram with the same precision.
+
+        :param other: Histogram to add.
+        """
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, q: float) -> float:
+        """
+        :param q: Percentile from 0 to 100.
+        :return: Latency in seconds below or equal to which q percent of the values are.
+        """
+        if not self.total:
+            return 0.0
+
+        rank = max(math.ceil(q / 100 * self.total), 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self._get_highest_value(index), self.max) / 1_000_000
+
+        return self.max / 1_000_000
+
+    def to_dict(self) -> dict:
+        """
+        :return: JSON-serializable state, e.g. to send it from a pytest-xdist worker.
+        """
+        return {
+            "significant_bits": self.significant_bits,
+            "counts": [[index, count] for index, count in self.counts.items()],
+            "total": self.total,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyHistogram":
+        """
+        :param data: State returned by to_dict().
+        :return: Restored histogram.
+        """
+        histogram = cls(significant_bits=data["significant_bits"])
+        histogram.counts = dict(data["counts"])
+        histogram.total = data["total"]
+        histogram.max = data["max"]
+        return histogram
+
+    def _get_index(self, value: int) -> int:
+        shift = value.bit_length() - self.significant_bits
+        if shift <= 0:
+            return value
+
+        # Values with the same top significant bits share a bucket
+        sub_buckets = 1 << (self.significant_bits - 1)
+        return (
+            (1 << self.significant_bits)
+            + (shift - 1) * sub_buckets
+            + (value >> shift)
+            - sub_buckets
+        )
+
+    def _get_highest_value(self, index: int) -> int:
+        if index < 1 << self.significant_bits:
+            return index
+
+        sub_buckets = 1 << (self.significant_bits - 1)
+        shift, offset = divmod(index - (1 << self.significant_bits), sub_buckets)
+        shift += 1
+        return ((offset + sub_buckets + 1) << shift) - 1
@@ -0,0 +1,17 @@
+import math
+
+
+def percentile(values: list[float], q: float) -> float:
+    """
+    Returns the exact percentile of a list of values, e.g. latencies of a load or benchmark run.
+
+    Use LatencyHistogram instead when the values don't fit in memory or come from many processes.
+
+    :param values: Sorted values.
+    :param q: Percentile from 0 to 100.
+    :return: Nearest-rank percentile of the values, 0 for no values.
+    """
+    if not values:
+        return 0.0
+
+    return values[max(math.ceil(q / 100 * len(values)) - 1, 0)]
@@ -0,0 +1,152 @@
+import threading
+from functools import cache
+
+from pydantic import BaseModel
+
+from clients.request_timings import RequestTimingSchema
+from tools.latency.histogram import LatencyHistogram
+
+
+class EndpointLatencySchema(BaseModel):
+    """
+    Latency percentiles of one endpoint, in milliseconds.
+    """
+
+    endpoint: str
+    requests: int
+    p50: float
+    p90: float
+    p99: float
+    max: float
+
+
+class LatencyRecorder:
+    """
+    Latency histograms of the requests sent by the API clients,
+    one per endpoint template (e.g., "GET /api/v1/courses/{course_id}")
+    and one per client method (e.g., "CoursesClient.get_course_api").
+    """
+
+    def __init__(self, thread_id: int | None = None):
+        """
+        :param thread_id: Record only the requests sent from this thread (e.g., the one running
+        the current test, ignoring fixtures provisioned in the background). All by default.
+        """
+        self.thread_id = thread_id
+
+        self._lock = threading.Lock()
+        self.endpoints: dict[str, LatencyHistogram] = {}
+        self.client_methods: dict[str, LatencyHistogram] = {}
+
+    def record(self, timing: RequestTimingSchema) -> None:
+        """
+        Request timing listener, see clients.request_timings.
+
+        :param timing: Timing of a sent request.
+        """
+        if self.thread_id is not None and threading.get_ident() != self.thread_id:
+            return
+
+        with self._lock:
+            self._get_or_create(self.endpoints, f"{timing.method} {timing.endpoint}").record(
+                timing.elapsed
+            )
+            if timing.client_method:
+                self._get_or_create(self.client_methods, timing.client_method).record(
+                    timing.elapsed
+                )
+
+    def get_endpoint(self, endpoint: str) -> LatencyHistogram:
+        """
+        :param endpoint: HTTP method and endpoint template, e.g. "GET /api/v1/courses/{course_id}".
+        :return: Copy of the endpoint's histogram, empty if it was not requested.
+        """
+        return self._copy(self.endpoints, endpoint)
+
+    def get_client_method(self, client_method: str) -> LatencyHistogram:
+        """
+        :param client_method: Qualified name of the method, e.g. "CoursesClient.get_course_api".
+        :return: Copy of the client method's histogram, empty if it was not called.
+        """
+        return self._copy(self.client_methods, client_method)
+
+    def get_all(self) -> LatencyHistogram:
+        """
+        :return: Histogram of all recorded requests.
+        """
+        histogram = LatencyHistogram()
+        with self._lock:
+            for endpoint in self.endpoints.values():
+                histogram.merge(endpoint)
+
+        return histogram
+
+    def to_dict(self) -> dict[str, dict[str, dict]]:
+        """
+        :return: JSON-serializable histograms by endpoint and by client method.
+        """
+        with self._lock:
+            return {
+                "endpoints": {key: value.to_dict() for key, value in self.endpoints.items()},
+                "client_methods": {
+                    key: value.to_dict() for key, value in self.client_methods.items()
+                },
+            }
+
+    def merge_dict(self, data: dict[str, dict[str, dict]]) -> None:
+        """
+        Adds histograms of another recorder, e.g. of a pytest-xdist worker.
+
+        :param data: Histograms returned by to_dict().
+        """
+        with self._lock:
+            for histograms, histograms_data in (
+                (self.endpoints, data["endpoints"]),
+                (self.client_methods, data["client_methods"]),
+            ):
+                for key, histogram_data in histograms_data.items():
+                    self._get_or_create(histograms, key).merge(
+                        LatencyHistogram.from_dict(histogram_data)
+                    )
+
+    def build_report(self) -> list[EndpointLatencySchema]:
+        """
+        :return: Percentiles of every endpoint, sorted by endpoint.
+        """
+        with self._lock:
+            return [
+                EndpointLatencySchema(
+                    endpoint=endpoint,
+                    requests=histogram.total,
+                    p50=histogram.percentile(50) * 1000,
+                    p90=histogram.percentile(90) * 1000,
+                    p99=histogram.percentile(99) * 1000,
+                    max=histogram.max / 1000,
+                )
+                for endpoint, histogram in sorted(self.endpoints.items())
+            ]
+
+    def _copy(self, histograms: dict[str, LatencyHistogram], key: str) -> LatencyHistogram:
+        copy = LatencyHistogram()
+        with self._lock:
+            if key in histograms:
+                copy.merge(histograms[key])
+
+        return copy
+
+    @staticmethod
+    def _get_or_create(histograms: dict[str, LatencyHistogram], key: str) -> LatencyHistogram:
+        if (histogram := histograms.get(key)) is None:
+            histogram = histograms[key] = LatencyHistogram()
+
+        return histogram
+
+
+@cache
+def get_latency_recorder() -> LatencyRecorder:
+    """
+    Function returns the latency recorder of the current process.
+
+    :return: LatencyRecorder shared by all API clients of the process.
+    """
+    return LatencyRecorder()
@@ -0,0 +1,369 @@
+"""
+Load runner driving the typed API clients with weighted scenarios.
+
+Usage:
+    python -m tools.load.runner --scenario browse_courses:3 --scenario create_course:1 \\
+        --concurrency 20 --ramp-up 10 --duration 60 [--arrival-rate 50] [--output load.json]
+"""
+
+import argparse
+import logging
+import random
+import shutil
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty, Queue
+
+from pydantic import BaseModel
+
+from clients.api_coverage import set_coverage_tracking
+from clients.authentication.token_cache import get_token_cache
+from clients.request_timings import (
+    RequestTimingSchema,
+    add_request_timing_listener,
+    remove_request_timing_listener,
+)
+from clients.users.public_users_client import get_public_users_client
+from config import settings
+from tools.fakers import fake
+from tools.latency.percentile import percentile
+from tools.load.scenarios import SCENARIOS, LoadScenario, VirtualUser
+from tools.logger import get_logger
+from tools.resources.registry import get_resource_journal_dir, read_resources
+from tools.resources.teardown import ResourceTeardown
+
+logger = get_logger("LOAD_RUNNER")
+
+
+class RouteLoadStatsSchema(BaseModel):
+    """
+    Throughput and latency of one route, latencies are in milliseconds.
+    """
+
+    route: str
+    requests: int
+    errors: int
+    throughput: float
+    p50: float
+    p90: float
+    p95: float
+    p99: float
+    max: float
+
+
+class ScenarioLoadStatsSchema(BaseModel):
+    name: str
+    iterations: int
+    failures: int
+
+
+class LoadReportSchema(BaseModel):
+    duration: float
+    concurrency: int
+    arrival_rate: float | None
+    dropped_iterations: int
+    scenarios: list[ScenarioLoadStatsSchema]
+    routes: list[RouteLoadStatsSchema]
+
+
+class LoadStats:
+    """
+    Collects request timings and scenario outcomes of a load run from all threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timings: dict[str, list[float]] = defaultdict(list)
+        self._errors: dict[str, int] = defaultdict(int)
+        self._iterations: dict[str, int] = defaultdict(int)
+        self._failures: dict[str, int] = defaultdict(int)
+        self.dropped_iterations = 0
+
+    def record_request(self, timing: RequestTimingSchema) -> None:
+        """
+        Request timing listener, see clients.request_timings.
+
+        :param timing: Timing of a request sent by a virtual user.
+        """
+        route = f"{timing.method} {timing.endpoint}"
+        with self._lock:
+            self._timings[route].append(timing.elapsed)
+            if timing.status_code >= 400:
+                self._errors[route] += 1
+
+    def record_iteration(self, scenario: str, failed: bool) -> None:
+        with self._lock:
+            self._iterations[scenario] += 1
+            if failed:
+                self._failures[scenario] += 1
+
+    def record_dropped_iteration(self) -> None:
+        with self._lock:
+            self.dropped_iterations += 1
+
+    def build_report(
+        self, duration: float, concurrency: int, arrival_rate: float | None
+    ) -> LoadReportSchema:
+        """
+        :param duration: Actual duration of the run in seconds.
+        :param concurrency: Number of virtual users.
+        :param arrival_rate: Target iterations per second of an open-model run.
+        :return: Report with throughput and latency percentiles per route.
+        """
+        with self._lock:
+            routes = []
+            for route, timings in sorted(self._timings.items()):
+                values = sorted(timing * 1000 for timing in timings)
+                routes.append(
+                    RouteLoadStatsSchema(
+                        route=route,
+                        requests=len(values),
+                        errors=self._errors[route],
+                        throughput=len(values) / duration,
+                        p50=percentile(values, 50),
+                        p90=percentile(values, 90),
+                        p95=percentile(values, 95),
+                        p99=percentile(values, 99),
+                        max=values[-1],
+                    )
+                )
+
+            scenarios = [
+                ScenarioLoadStatsSchema(
+                    name=name, iterations=iterations, failures=self._failures[name]
+                )
+                for name, iterations in sorted(self._iterations.items())
+            ]
+
+            return LoadReportSchema(
+                duration=duration,
+                concurrency=concurrency,
+                arrival_rate=arrival_rate,
+                dropped_iterations=self.dropped_iterations,
+                scenarios=scenarios,
+                routes=routes,
+            )
+
+
+class LoadRunner:
+    """
+    Runs weighted scenarios with a pool of virtual users.
+
+    Without an arrival rate the run is a closed model: every virtual user repeats scenarios
+    back to back, the users start evenly over the ramp-up period. With an arrival rate the run is
+    an open model: iterations start at the given rate (growing linearly during the ramp-up)
+    regardless of how fast the server responds, and an iteration is dropped if all virtual users
+    are busy.
+    """
+
+    def __init__(
+        self,
+        scenarios: dict[LoadScenario, float],
+        concurrency: int,
+        duration: float,
+        ramp_up: float = 0,
+        arrival_rate: float | None = None,
+    ):
+        """
+        :param scenarios: Scenarios with their relative weights.
+        :param concurrency: Number of virtual users.
+        :param duration: Duration of the run in seconds, including the ramp-up.
+        :param ramp_up: Seconds until the full concurrency or arrival rate is reached.
+        :param arrival_rate: Iterations per second for an open-model run.
+        """
+        self.scenarios = list(scenarios)
+        self.weights = list(scenarios.values())
+        self.concurrency = concurrency
+        self.duration = duration
+        self.ramp_up = ramp_up
+        self.arrival_rate = arrival_rate
+
+        self.stats = LoadStats()
+
+    def run(self) -> LoadReportSchema:
+        """
+        Creates the virtual users and runs the scenarios for the configured duration.
+
+        Requests of the virtual user setup are not included in the report.
+        The clients of the virtual users are closed when the run ends.
+
+        :return: Report of the run.
+        """
+        logger.info("Creating %s virtual users", self.concurrency)
+        public_users_client = get_public_users_client()
+        with ThreadPoolExecutor(self.concurrency) as executor:
+            users = list(
+                executor.map(lambda _: VirtualUser(public_users_client), range(self.concurrency))
+            )
+
+        add_request_timing_listener(self.stats.record_request)
+        started_at = time.perf_counter()
+        try:
+            if self.arrival_rate is None:
+                self._run_closed(users, started_at + self.duration)
+            else:
+                self._run_open(users, started_at)
+        finally:
+            remove_request_timing_listener(self.stats.record_request)
+            for user in users:
+                user.close()
+
+        return self.stats.build_report(
+            duration=time.perf_counter() - started_at,
+            concurrency=self.concurrency,
+            arrival_rate=self.arrival_rate,
+        )
+
+    def _run_closed(self, users: list[VirtualUser], deadline: float) -> None:
+        def loop(index: int, user: VirtualUser) -> None:
+            time.sleep(self.ramp_up * index / len(users))
+            while time.perf_counter() < deadline:
+                self._run_iteration(user)
+
+        with ThreadPoolExecutor(len(users), thread_name_prefix="virtual-user") as executor:
+            list(executor.map(loop, range(len(users)), users))
+
+    def _run_open(self, users: list[VirtualUser], started_at: float) -> None:
+        idle: Queue[VirtualUser] = Queue()
+        for user in users:
+            idle.put(user)
+
+        def iteration(user: VirtualUser) -> None:
+            try:
+                self._run_iteration(user)
+            finally:
+                idle.put(user)
+
+        started = 0
+        with ThreadPoolExecutor(len(users), thread_name_prefix="virtual-user") as executor:
+            while (elapsed := time.perf_counter() - started_at) < self.duration:
+                for _ in range(self._get_due_iterations(elapsed) - started):
+                    started += 1
+                    try:
+                        executor.submit(iteration, idle.get_nowait())
+                    except Empty:
+                        self.stats.record_dropped_iteration()
+
+                time.sleep(0.001)
+
+    def _get_due_iterations(self, elapsed: float) -> int:
+        # Integral of the arrival rate, which grows linearly from 0 during the ramp-up
+        if elapsed < self.ramp_up:
+            return int(self.arrival_rate * elapsed**2 / (2 * self.ramp_up))
+
+        return int(self.arrival_rate * (elapsed - self.ramp_up / 2))
+
+    def _run_iteration(self, user: VirtualUser) -> None:
+        scenario = random.choices(self.scenarios, self.weights)[0]
+        try:
+            scenario.run(user)
+        except Exception as error:
+            logger.warning("Scenario %s failed: %r", scenario.name, error)
+            self.stats.record_iteration(scenario.name, failed=True)
+        else:
+            self.stats.record_iteration(scenario.name, failed=False)
+
+
+def format_report(report: LoadReportSchema) -> str:
+    """
+    :param report: Report of a load run.
+    :return: Human-readable table of the report.
+    """
+    lines = [
+        f"Duration: {report.duration:.1f}s, virtual users: {report.concurrency}, "
+        f"dropped iterations: {report.dropped_iterations}",
+        "",
+        f"{'Scenario':<40}{'Iterations':>12}{'Failures':>10}",
+    ]
+    lines.extend(f"{s.name:<40}{s.iterations:>12}{s.failures:>10}" for s in report.scenarios)
+    lines.extend(
+        [
+            "",
+            f"{'Route':<48}{'Requests':>9}{'Errors':>8}{'RPS':>9}"
+            f"{'p50':>9}{'p90':>9}{'p95':>9}{'p99':>9}{'max':>9}",
+        ]
+    )
+    lines.extend(
+        f"{r.route:<48}{r.requests:>9}{r.errors:>8}{r.throughput:>9.1f}"
+        f"{r.p50:>9.1f}{r.p90:>9.1f}{r.p95:>9.1f}{r.p99:>9.1f}{r.max:>9.1f}"
+        for r in report.routes
+    )
+    return "\n".join(lines)
+
+
+def parse_scenario(value: str) -> tuple[LoadScenario, float]:
+    name, _, weight = value.partition(":")
+    if name not in SCENARIOS:
+        raise argparse.ArgumentTypeError(
+            f"Unknown scenario {name!r}, available: {', '.join(SCENARIOS)}"
+        )
+
+    return SCENARIOS[name], float(weight or 1)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--scenario",
+        type=parse_scenario,
+        action="append",
+        required=True,
+        help=f"NAME[:WEIGHT], one of: {', '.join(SCENARIOS)}",
+    )
+    parser.add_argument("--concurrency", type=int, default=10, help="Number of virtual users")
+    parser.add_argument("--duration", type=float, default=60, help="Seconds, including ramp-up")
+    parser.add_argument("--ramp-up", type=float, default=0, help="Seconds to reach full load")
+    parser.add_argument("--arrival-rate", type=float, help="Iterations per second (open model)")
+    parser.add_argument("--output", help="Path of the JSON report")
+    parser.add_argument("--keep-data", action="store_true", help="Do not delete created entities")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    parser.add_argument(
+        "--fake-pool-size",
+        type=int,
+        default=settings.faker.pool_size or 1000,
+        help="Pre-generated fake values of each kind, 0 calls Faker for every payload",
+    )
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logging.getLogger("HTTP_CLIENT").setLevel(logging.WARNING)
+
+    # Load requests say nothing about the coverage of the test suite, and every one writes a file
+    set_coverage_tracking(False)
+
+    fake.pool_size = args.fake_pool_size
+    fake.warm_up()
+
+    runner = LoadRunner(
+        scenarios=dict(args.scenario),
+        concurrency=args.concurrency,
+        duration=args.duration,
+        ramp_up=args.ramp_up,
+        arrival_rate=args.arrival_rate,
+    )
+    try:
+        report = runner.run()
+    finally:
+        if not args.keep_data:
+            directory = get_resource_journal_dir()
+            teardown = ResourceTeardown(
+                workers=settings.resources.teardown_workers,
+                batch_size=settings.resources.teardown_batch_size,
+            )
+            if not teardown.run(read_resources(directory)):
+                shutil.rmtree(directory, ignore_errors=True)
+
+        get_token_cache().clear()
+
+    print(format_report(report))
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(report.model_dump_json(indent=2))
+
+    return 1 if any(s.failures for s in report.scenarios) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
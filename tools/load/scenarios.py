@@ -0,0 +1,142 @@
+import inspect
+from collections.abc import Callable
+
+from pydantic import BaseModel, ConfigDict
+
+from clients.courses.courses_client import CoursesClient
+from clients.courses.courses_schema import (
+    CourseSchema,
+    CreateCourseRequestSchema,
+    GetCoursesQuerySchema,
+    UpdateCourseRequestSchema,
+)
+from clients.exercises.exercises_client import ExercisesClient
+from clients.exercises.exercises_schema import CreateExerciseRequestSchema, GetExercisesQuerySchema
+from clients.files.files_client import FilesClient
+from clients.files.files_schema import CreateFileRequestSchema
+from clients.private_http_builder import AuthenticationUserSchema, build_private_http_client
+from clients.users.private_users_client import PrivateUsersClient
+from clients.users.public_users_client import PublicUsersClient
+from clients.users.users_schema import CreateUserRequestSchema
+from config import settings
+
+
+class VirtualUser:
+    """
+    Simulated user of the load test with its own account and typed API clients.
+
+    The typed clients share one HTTP client that belongs to the virtual user and not to
+    the bounded client registry of the tests, which would close the clients of the first
+    users once the concurrency exceeds its size. The client is closed by close().
+    """
+
+    def __init__(self, public_users_client: PublicUsersClient):
+        """
+        Creates the account of the virtual user and a course chain the scenarios can read.
+
+        :param public_users_client: Client for user creation.
+        """
+        request = CreateUserRequestSchema()
+        self.user = public_users_client.create_user(request).user
+        self.authentication_user = AuthenticationUserSchema(
+            email=request.email, password=request.password
+        )
+
+        self.client = build_private_http_client(self.authentication_user)
+        self.files_client = FilesClient(client=self.client)
+        self.courses_client = CoursesClient(client=self.client)
+        self.exercises_client = ExercisesClient(client=self.client)
+        self.private_users_client = PrivateUsersClient(client=self.client)
+
+        try:
+            self.course = self.create_course()
+        except Exception:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """
+        Closes the HTTP client of the virtual user.
+        """
+        self.client.close()
+
+    def create_course(self) -> CourseSchema:
+        """
+        Creates a file, a course with the file as a preview and an exercise of the course.
+
+        :return: The created course.
+        """
+        file = self.files_client.create_file(
+            CreateFileRequestSchema(upload_file=settings.test_data.image_png_file)
+        )
+        course = self.courses_client.create_course(
+            CreateCourseRequestSchema(preview_file_id=file.file.id, created_by_user_id=self.user.id)
+        ).course
+        self.exercises_client.create_exercise(CreateExerciseRequestSchema(course_id=course.id))
+        return course
+
+
+class LoadScenario(BaseModel):
+    """
+    Description of a load scenario: one iteration of what a virtual user does.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str
+    description: str
+    run: Callable[[VirtualUser], None]
+
+
+SCENARIOS: dict[str, LoadScenario] = {}
+
+
+def scenario(name: str) -> Callable[[Callable[[VirtualUser], None]], Callable[[VirtualUser], None]]:
+    """
+    Registers a function as a load scenario, the docstring becomes its description.
+
+    :param name: Name of the scenario used on the command line.
+    :return: Decorator for the scenario function.
+    """
+
+    def wrapper(func: Callable[[VirtualUser], None]) -> Callable[[VirtualUser], None]:
+        description = (inspect.getdoc(func) or "").split("\n")[0]
+        SCENARIOS[name] = LoadScenario(name=name, description=description, run=func)
+        return func
+
+    return wrapper
+
+
+@scenario("browse_courses")
+def browse_courses(user: VirtualUser) -> None:
+    """
+    Lists the courses of the user, opens one of them and lists its exercises.
+    """
+    user.courses_client.get_courses_api(GetCoursesQuerySchema(user_id=user.user.id))
+    user.courses_client.get_course_api(user.course.id)
+    user.exercises_client.get_exercises(GetExercisesQuerySchema(course_id=user.course.id))
+
+
+@scenario("create_course")
+def create_course(user: VirtualUser) -> None:
+    """
+    Uploads a preview file, creates a course with it and adds an exercise to the course.
+    """
+    user.create_course()
+
+
+@scenario("update_course")
+def update_course(user: VirtualUser) -> None:
+    """
+    Updates the course of the user and reads it back.
+    """
+    user.courses_client.update_course_api(user.course.id, UpdateCourseRequestSchema())
+    user.courses_client.get_course_api(user.course.id)
+
+
+@scenario("get_user_me")
+def get_user_me(user: VirtualUser) -> None:
+    """
+    Reads the profile of the authenticated user.
+    """
+    user.private_users_client.get_user_me_api()
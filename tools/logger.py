@@ -1,16 +1,172 @@
+import atexit
+import json
 import logging
+import queue
+import sys
+import threading
+from datetime import UTC, datetime
+from functools import cache
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import TextIO
+
+from config import settings
+from tools.xdist import get_worker_id
+
+LOG_FORMAT = "%(asctime)s | %(name)s | %(levelname)s | %(message)s"
+
+HANDLER_NAME = "autotests"
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    Queue handler that leaves formatting to the listener thread.
+
+    The standard QueueHandler formats the message in the logging thread to make the record
+    picklable. Records here never leave the process, so the message, its %-style arguments
+    and the timestamp are formatted by the listener. Arguments must not be mutated after logging.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _FlushRecord(logging.LogRecord):
+    def __init__(self):
+        super().__init__("", logging.CRITICAL, "", 0, "", None, None)
+        self.flushed = threading.Event()
+
+
+class FlushingQueueListener(QueueListener):
+    """
+    Queue listener that can be waited for, see flush_logs().
+    """
+
+    def handle(self, record: logging.LogRecord) -> None:
+        if isinstance(record, _FlushRecord):
+            record.flushed.set()
+            return
+
+        super().handle(record)
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Formats records as one JSON object per line, e.g. for log storage in CI.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, UTC).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "worker": get_worker_id(),
+            "thread": record.threadName,
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def create_stream_handler(stream: TextIO | None = None) -> logging.Handler:
+    """
+    :param stream: Stream to write to, sys.stderr by default.
+    :return: Handler writing human-readable lines.
+    """
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    return handler
+
+
+def create_json_file_handler(path: Path) -> logging.Handler:
+    """
+    :param path: File to write to, replaced if it exists.
+    :return: Handler writing one JSON object per record and line.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handler = logging.FileHandler(path, mode="w", encoding="utf-8")
+    handler.setFormatter(JSONFormatter())
+    return handler
+
+
+def create_queue_handler(*handlers: logging.Handler) -> tuple[QueueHandler, FlushingQueueListener]:
+    """
+    Creates a queue handler whose records are passed to the handlers by a background thread.
+
+    :param handlers: Handlers doing the formatting and I/O.
+    :return: The queue handler and its started listener.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = FlushingQueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+
+    return DeferredQueueHandler(log_queue), listener
+
+
+@cache
+def configure_logging() -> tuple[logging.Handler, ...]:
+    """
+    Configures the logging of the process, once; this is the only place handlers are created.
+
+    Records are written to stderr and, if LOGGING.JSON_DIR is set, as JSON lines
+    to <JSON_DIR>/<worker ID>.jsonl (one file per pytest-xdist worker).
+
+    With LOGGING.QUEUED the records are put into a queue and formatted and written by
+    a background thread, which is drained when the process exits. The listener thread holds
+    the GIL while formatting, so this does not make a log call cheaper when the output is fast
+    (a file, a pipe that is read promptly); it only keeps tests from blocking on slow output.
+
+    :return: Handlers shared by all loggers of the process.
+    """
+    handlers = [create_stream_handler()]
+    if settings.logging.json_dir:
+        path = settings.logging.json_dir.joinpath(f"{get_worker_id()}.jsonl")
+        handlers.append(create_json_file_handler(path))
+
+    if settings.logging.queued:
+        handler, listener = create_queue_handler(*handlers)
+        atexit.register(listener.stop)
+        handlers = [handler]
+
+    for handler in handlers:
+        handler.set_name(HANDLER_NAME)
+
+    return tuple(handlers)
+
+
+def flush_logs(timeout: float = 5) -> None:
+    """
+    Waits until the background thread has written all records logged so far,
+    e.g. before pytest prints the result of a test, so the output stays in order.
+    Does nothing unless LOGGING.QUEUED is set.
+
+    :param timeout: Maximum time to wait in seconds.
+    """
+    for handler in configure_logging():
+        if isinstance(handler, QueueHandler):
+            record = _FlushRecord()
+            handler.enqueue(record)
+            record.flushed.wait(timeout)
 
 
 def get_logger(name: str) -> logging.Logger:
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
+    """
+    Returns a logger writing through the shared handlers, see configure_logging().
 
-    handler = logging.StreamHandler()
-    handler.setLevel(logging.DEBUG)
+    Log with lazy %-style arguments (logger.info("Got %s", value)), so messages of disabled
+    levels are never formatted. Calling it any number of times for the same name, also after
+    this module is re-imported, attaches the handlers only once.
 
-    formatter = logging.Formatter("%(asctime)s | %(name)s | %(levelname)s | %(message)s")
-    handler.setFormatter(formatter)
+    :param name: Name of the logger, e.g. "HTTP_CLIENT".
+    :return: Logger with the level from settings.logging.level.
+    """
+    logger = logging.getLogger(name)
+    logger.setLevel(settings.logging.level)
 
-    logger.addHandler(handler)
+    if not any(handler.get_name() == HANDLER_NAME for handler in logger.handlers):
+        for handler in configure_logging():
+            logger.addHandler(handler)
 
     return logger
@@ -0,0 +1,203 @@
+import itertools
+import random
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from threading import Lock
+from typing import Any
+
+from tools.allure.steps import detached_allure_context
+from tools.fakers import derive_seed, fake
+from tools.logger import get_logger
+
+logger = get_logger("PROVISIONING")
+
+
+class ProvisioningNode:
+    """
+    Node of a provisioning graph: a named entity and the factory that creates it.
+    """
+
+    def __init__(self, name: str, factory: Callable[..., Any], depends_on: tuple[str, ...]):
+        """
+        :param name: Name of the entity (e.g., "course").
+        :param factory: Function creating the entity. Receives created dependencies as keyword
+        arguments named after them.
+        :param depends_on: Names of the entities this one depends on.
+        """
+        self.name = name
+        self.factory = factory
+        self.depends_on = depends_on
+
+
+class ProvisioningGraph:
+    """
+    Dependency graph (DAG) of entities that are created together, e.g. user → file → course.
+
+    Every node is started as soon as all of its dependencies are created,
+    so independent nodes are created concurrently. Given a seed, every node generates its
+    fake data from a seed of its own, so the data doesn't depend on the order the nodes run in.
+    """
+
+    def __init__(self):
+        self.nodes: dict[str, ProvisioningNode] = {}
+
+    def add(
+        self, name: str, factory: Callable[..., Any], depends_on: tuple[str, ...] = ()
+    ) -> "ProvisioningGraph":
+        """
+        Adds a node to the graph.
+
+        :param name: Name of the entity.
+        :param factory: Function creating the entity from its dependencies.
+        :param depends_on: Names of the entities this one depends on.
+        :return: The graph itself, so calls can be chained.
+        """
+        self.nodes[name] = ProvisioningNode(name=name, factory=factory, depends_on=depends_on)
+        return self
+
+    def build(
+        self,
+        executor: ThreadPoolExecutor,
+        resolved: dict[str, Any] | None = None,
+        seed: int | None = None,
+    ) -> dict[str, Any]:
+        """
+        Creates all entities of the graph.
+
+        :param executor: Executor running the node factories.
+        :param resolved: Entities that already exist and must not be created (e.g., a fresh user).
+        :param seed: Seed of the fake data of the graph. The data of the running test by default.
+        :return: Created entities by node name.
+        :raises ValueError: If the graph has a cycle or a dependency that is not in the graph.
+        """
+        results = dict(resolved or {})
+        pending = {name: node for name, node in self.nodes.items() if name not in results}
+        running: dict[Future, str] = {}
+
+        while pending or running:
+            for name, node in list(pending.items()):
+                if all(dependency in results for dependency in node.depends_on):
+                    kwargs = {dependency: results[dependency] for dependency in node.depends_on}
+                    running[executor.submit(self._run, node, kwargs, seed)] = name
+                    del pending[name]
+
+            if not running:
+                raise ValueError(f"Unable to resolve dependencies of nodes: {', '.join(pending)}")
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[running.pop(future)] = future.result()
+
+        return results
+
+    @staticmethod
+    def _run(node: ProvisioningNode, kwargs: dict[str, Any], seed: int | None) -> Any:
+        with detached_allure_context():
+            if seed is None:
+                return node.factory(**kwargs)
+
+            with fake.seeded(derive_seed(seed, node.name)):
+                return node.factory(**kwargs)
+
+
+class Provisioner:
+    """
+    Builds complete graphs ahead of demand.
+
+    Keeps up to `prebuild` graphs being built in the background while earlier tests run,
+    so a test usually takes a ready graph instead of waiting for every request of the chain.
+
+    Graphs are numbered in the order they are scheduled, and the fake data of the i-th graph
+    is seeded with derive_seed(seed, i). So the same seed gives the same chains, no matter
+    which tests run meanwhile or how the background threads interleave.
+    """
+
+    def __init__(
+        self, graph: ProvisioningGraph, prebuild: int, workers: int, seed: int | None = None
+    ):
+        """
+        :param graph: Graph to build.
+        :param prebuild: Number of graphs built ahead of demand. 0 disables prebuilding.
+        :param workers: Number of threads creating entities.
+        :param seed: Session seed of the fake data. Random by default.
+        """
+        self.graph = graph
+        self.prebuild = prebuild
+        self.seed = random.getrandbits(64) if seed is None else seed
+
+        self._lock = Lock()
+        self._indexes = itertools.count()
+        self._ready: deque[Future] = deque()
+        self._nodes_executor = ThreadPoolExecutor(workers, thread_name_prefix="provisioning-node")
+        self._graphs_executor = ThreadPoolExecutor(
+            max(prebuild, 1), thread_name_prefix="provisioning-graph"
+        )
+
+    def start(self) -> None:
+        """
+        Starts building the first `prebuild` graphs in the background.
+        """
+        for _ in range(self.prebuild):
+            self._schedule()
+
+    def take(self) -> dict[str, Any]:
+        """
+        Returns a built graph and schedules a new one in its place.
+
+        :return: Created entities by node name.
+        """
+        with self._lock:
+            future = self._ready.popleft() if self._ready else None
+
+        if future is None:
+            return self.build()
+
+        self._schedule()
+        return future.result()
+
+    def build(self, resolved: dict[str, Any] | None = None) -> dict[str, Any]:
+        """
+        Builds a graph right away, bypassing the prebuilt ones.
+
+        :param resolved: Entities that already exist and must not be created.
+        :return: Created entities by node name.
+        """
+        return self._build(resolved, next(self._indexes))
+
+    def shutdown(self) -> list[dict[str, Any]]:
+        """
+        Stops prebuilding and releases the executors.
+
+        :return: Graphs that were built but never taken (e.g., to clean them up).
+        """
+        with self._lock:
+            futures = list(self._ready)
+            self._ready.clear()
+
+        for future in futures:
+            future.cancel()
+
+        self._graphs_executor.shutdown(wait=True)
+        self._nodes_executor.shutdown(wait=True)
+
+        unused = []
+        for future in futures:
+            if future.cancelled():
+                continue
+
+            if future.exception() is None:
+                unused.append(future.result())
+            else:
+                logger.error("Prebuilt graph failed: %s", future.exception())
+
+        return unused
+
+    def _build(self, resolved: dict[str, Any] | None, index: int) -> dict[str, Any]:
+        return self.graph.build(self._nodes_executor, resolved, derive_seed(self.seed, index))
+
+    def _schedule(self) -> None:
+        # The index is taken here and not in the thread, so it follows the order of scheduling
+        with self._lock:
+            future = self._graphs_executor.submit(self._build, None, next(self._indexes))
+            self._ready.append(future)
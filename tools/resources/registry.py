@@ -0,0 +1,171 @@
+import json
+import os
+from enum import Enum
+from functools import cache
+from pathlib import Path
+from threading import Lock
+
+from httpx import Request, Response
+from pydantic import BaseModel
+
+from clients.authentication.token_cache import get_token_cache_run_id
+from config import settings
+from tools.routes import APIRoutes
+
+
+class ResourceKind(str, Enum):
+    USER = "user"
+    FILE = "file"
+    COURSE = "course"
+    EXERCISE = "exercise"
+
+    def __str__(self):
+        return self.value
+
+
+# Exercises belong to courses, courses reference files, everything is owned by users
+TEARDOWN_ORDER = (ResourceKind.EXERCISE, ResourceKind.COURSE, ResourceKind.FILE, ResourceKind.USER)
+
+RESOURCE_ROUTES = {
+    str(APIRoutes.USERS): ResourceKind.USER,
+    str(APIRoutes.FILES): ResourceKind.FILE,
+    str(APIRoutes.COURSES): ResourceKind.COURSE,
+    str(APIRoutes.EXERCISES): ResourceKind.EXERCISE,
+}
+
+
+class TrackedResourceSchema(BaseModel):
+    """
+    Description of a created entity that has to be deleted after the run.
+    """
+
+    kind: ResourceKind
+    id: str
+    owner: str
+
+
+class ResourceJournal:
+    """
+    Append-only journal of the entities created by one process.
+
+    Every created entity is written to disk right away, so the entities of a crashed run
+    can still be found and deleted later by the sweeper.
+    """
+
+    def __init__(self, path: Path):
+        """
+        :param path: Journal file, one JSON line per entity.
+        """
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = Lock()
+
+    def record(self, resource: TrackedResourceSchema) -> None:
+        """
+        Appends the entity to the journal.
+
+        :param resource: The created entity.
+        """
+        with self._lock, self.path.open("a") as file:
+            file.write(resource.model_dump_json() + "\n")
+
+
+def get_resource_journal_dir(run_id: str | None = None) -> Path:
+    """
+    :param run_id: Identifier of the run, the current run by default.
+    :return: Directory with the journals of all processes of the run.
+    """
+    return settings.resources.journal_dir.joinpath(run_id or get_token_cache_run_id())
+
+
+# Passwords of the created users never leave the memory of the process that created them,
+# the journals only tell which entities exist and who owns them
+_passwords: dict[str, str] = {}
+_passwords_lock = Lock()
+
+
+def remember_password(email: str, password: str) -> None:
+    """
+    :param email: Email of a user created by the current process.
+    :param password: Password of the user.
+    """
+    with _passwords_lock:
+        _passwords[email] = password
+
+
+def get_password(email: str) -> str | None:
+    """
+    :param email: Email of a user.
+    :return: Password of the user if it was created by the current process, otherwise None.
+    """
+    with _passwords_lock:
+        return _passwords.get(email)
+
+
+def get_remembered_emails() -> list[str]:
+    """
+    :return: Emails of the users created by the current process.
+    """
+    with _passwords_lock:
+        return list(_passwords)
+
+
+@cache
+def get_resource_journal() -> ResourceJournal:
+    """
+    Function returns the journal of the current process.
+
+    :return: ResourceJournal located in the journal directory of the current run.
+    """
+    return ResourceJournal(get_resource_journal_dir().joinpath(f"{os.getpid()}.jsonl"))
+
+
+def read_resources(directory: Path) -> list[TrackedResourceSchema]:
+    """
+    Reads the journals of all processes of a run.
+
+    :param directory: Journal directory of the run.
+    :return: Entities in the order they were recorded by each process.
+    """
+    resources = []
+    for path in sorted(directory.glob("*.jsonl")):
+        for line in path.read_text().splitlines():
+            if line:
+                resources.append(TrackedResourceSchema.model_validate_json(line))
+
+    return resources
+
+
+def get_created_resource_kind(request: Request) -> ResourceKind | None:
+    """
+    :param request: Sent HTTP request.
+    :return: Kind of the entity the request creates or None if it does not create one.
+    """
+    if request.method != "POST":
+        return None
+
+    return RESOURCE_ROUTES.get(request.url.path)
+
+
+def track_created_resource(response: Response, owner: str | None) -> None:
+    """
+    Records the entity created by the request in the journal of the current process.
+    Passwords of created users are kept in memory only, see remember_password().
+
+    :param response: Read response of the request.
+    :param owner: Email of the user the request was sent as, None for public requests.
+    """
+    kind = get_created_resource_kind(response.request)
+    if not settings.resources.track or kind is None or response.status_code != 200:
+        return
+
+    entity = response.json()[kind.value]
+    if kind is ResourceKind.USER:
+        owner = entity["email"]
+        remember_password(owner, json.loads(response.request.content)["password"])
+
+    if owner is None:
+        return
+
+    get_resource_journal().record(TrackedResourceSchema(kind=kind, id=entity["id"], owner=owner))
@@ -0,0 +1,93 @@
+"""
+Deletes entities left on the server by runs that crashed or were interrupted.
+
+Every run journals the entities it creates into its own directory in
+settings.resources.journal_dir and removes the directory after a successful teardown,
+so any directory that has not been modified for a while belongs to a run that never cleaned up.
+The owners of the entities are authenticated with the tokens left in the token cache of that run.
+
+Usage:
+    python -m tools.resources.sweeper [--older-than MINUTES] [--dry-run]
+"""
+
+import argparse
+import shutil
+import time
+from pathlib import Path
+
+from clients.authentication.token_cache import TokenCache, get_token_cache
+from config import settings
+from tools.logger import get_logger
+from tools.resources.registry import read_resources
+from tools.resources.teardown import ResourceTeardown
+
+logger = get_logger("RESOURCES_SWEEPER")
+
+
+def get_orphaned_journal_dirs(older_than: float) -> list[Path]:
+    """
+    :param older_than: Minimum number of seconds since the last entity was recorded.
+    :return: Journal directories of the runs that did not clean up.
+    """
+    if not settings.resources.journal_dir.exists():
+        return []
+
+    deadline = time.time() - older_than
+    return [
+        directory
+        for directory in settings.resources.journal_dir.iterdir()
+        if directory.is_dir()
+        and max((path.stat().st_mtime for path in directory.iterdir()), default=0) < deadline
+    ]
+
+
+def sweep(older_than: float, dry_run: bool = False) -> int:
+    """
+    Deletes the entities of all orphaned runs.
+
+    :param older_than: Minimum number of seconds since the last entity was recorded.
+    :param dry_run: Only report the entities without deleting them.
+    :return: Number of entities that could not be deleted.
+    """
+    failed = 0
+    for directory in get_orphaned_journal_dirs(older_than):
+        resources = read_resources(directory)
+        logger.info("Run %s left %s entities", directory.name, len(resources))
+        if dry_run:
+            continue
+
+        token_cache = TokenCache(settings.authentication.token_cache_dir.joinpath(directory.name))
+        teardown = ResourceTeardown(
+            workers=settings.resources.teardown_workers,
+            batch_size=settings.resources.teardown_batch_size,
+            token_cache=token_cache,
+        )
+        if left := teardown.run(resources):
+            failed += len(left)
+            continue
+
+        shutil.rmtree(directory, ignore_errors=True)
+        token_cache.clear()
+
+    return failed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--older-than",
+        type=float,
+        default=60,
+        help="Minutes since the last entity was recorded, protects runs still in progress",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Only report orphaned entities")
+    args = parser.parse_args()
+
+    try:
+        return 1 if sweep(older_than=args.older_than * 60, dry_run=args.dry_run) else 0
+    finally:
+        get_token_cache().clear()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
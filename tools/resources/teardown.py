@@ -0,0 +1,206 @@
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from threading import Lock
+
+from httpx import Client, HTTPTransport, Response
+
+from clients.authentication.authentication_schema import TokenSchema
+from clients.authentication.bearer_auth import BearerAuth
+from clients.authentication.token_cache import TokenCache, get_token_cache
+from clients.courses.courses_client import CoursesClient
+from clients.event_hooks import log_request_event_hook, log_response_event_hook
+from clients.exercises.exercises_client import ExercisesClient
+from clients.files.files_client import FilesClient
+from clients.http_transport import SharedHTTPTransport
+from clients.private_http_builder import AuthenticationUserSchema, login_user
+from clients.users.private_users_client import PrivateUsersClient
+from config import settings
+from tools.allure.steps import detached_allure_context
+from tools.logger import get_logger
+from tools.resources.registry import (
+    TEARDOWN_ORDER,
+    ResourceKind,
+    TrackedResourceSchema,
+    get_password,
+    get_remembered_emails,
+)
+
+logger = get_logger("RESOURCES_TEARDOWN")
+
+
+class ResourceTeardown:
+    """
+    Deletes tracked entities in reverse dependency order.
+
+    Entities of one kind are deleted concurrently: they are grouped by owner and split into
+    batches, every batch is deleted by one thread with the owner's client over one pooled
+    connection. Entities that are already gone (e.g., deleted by the test) count as deleted.
+
+    Owners log in with their password if it is known to the current process, otherwise
+    with their last cached token, see cache_owner_tokens().
+    """
+
+    def __init__(self, workers: int, batch_size: int, token_cache: TokenCache | None = None):
+        """
+        :param workers: Number of threads deleting batches.
+        :param batch_size: Maximum number of entities in one batch.
+        :param token_cache: Token cache of the run that created the entities, the current
+        run by default.
+        """
+        self.workers = workers
+        self.batch_size = batch_size
+        self.token_cache = token_cache or get_token_cache()
+
+        self._lock = Lock()
+        self._clients: dict[str, Client] = {}
+        # Teardown clients skip the cURL hook, there is no test to attach the commands to
+        self._transport = SharedHTTPTransport(HTTPTransport(limits=settings.http_client.limits))
+
+    def run(self, resources: list[TrackedResourceSchema]) -> list[TrackedResourceSchema]:
+        """
+        Deletes the entities.
+
+        :param resources: Tracked entities, in any order.
+        :return: Entities that could not be deleted.
+        """
+        failed = []
+        try:
+            with ThreadPoolExecutor(self.workers, thread_name_prefix="teardown") as executor:
+                for kind in TEARDOWN_ORDER:
+                    batches = self._split(r for r in resources if r.kind is kind)
+                    futures = [executor.submit(self._delete_batch, batch) for batch in batches]
+                    for future in futures:
+                        failed.extend(future.result())
+        finally:
+            self.close()
+
+        logger.info(
+            "Deleted %s of %s tracked entities", len(resources) - len(failed), len(resources)
+        )
+        return failed
+
+    def close(self) -> None:
+        """
+        Closes the clients of the owners and their connection pool.
+        """
+        for client in self._clients.values():
+            client.close()
+
+        self._clients.clear()
+        self._transport.transport.close()
+
+    def _split(
+        self, resources: Iterator[TrackedResourceSchema]
+    ) -> list[list[TrackedResourceSchema]]:
+        by_owner: dict[str, list[TrackedResourceSchema]] = defaultdict(list)
+        for resource in resources:
+            by_owner[resource.owner].append(resource)
+
+        return [
+            owned[index : index + self.batch_size]
+            for owned in by_owner.values()
+            for index in range(0, len(owned), self.batch_size)
+        ]
+
+    def _delete_batch(self, batch: list[TrackedResourceSchema]) -> list[TrackedResourceSchema]:
+        owner = batch[0].owner
+        failed = []
+        with detached_allure_context():
+            try:
+                delete = self._get_delete(batch[0].kind, self._get_client(owner))
+            except Exception as error:
+                logger.error("Unable to authenticate as %s: %s", owner, error)
+                return batch
+
+            for resource in batch:
+                try:
+                    response = delete(resource.id)
+                except Exception as error:
+                    logger.error("Unable to delete %s %s: %s", resource.kind, resource.id, error)
+                    failed.append(resource)
+                    continue
+
+                if response.status_code not in (200, 204, 404):
+                    logger.error(
+                        "Unable to delete %s %s: %s",
+                        resource.kind,
+                        resource.id,
+                        response.status_code,
+                    )
+                    failed.append(resource)
+
+        return failed
+
+    def _get_client(self, owner: str) -> Client:
+        with self._lock:
+            if client := self._clients.get(owner):
+                return client
+
+        if password := get_password(owner):
+            user = AuthenticationUserSchema(email=owner, password=password)
+            login = partial(login_user, user)
+            cached_token = self.token_cache.get_or_login(owner, login)
+        else:
+            login = partial(_login_without_password, owner)
+            if (cached_token := self.token_cache.get_latest(owner)) is None:
+                raise LookupError(f"Neither the password nor a cached token of {owner} is known")
+
+        client = Client(
+            auth=BearerAuth(owner, cached_token, login),
+            timeout=settings.http_client.timeout,
+            base_url=settings.http_client.client_url,
+            transport=self._transport,
+            event_hooks={
+                "request": [log_request_event_hook],
+                "response": [log_response_event_hook],
+            },
+        )
+
+        with self._lock:
+            existing = self._clients.setdefault(owner, client)
+
+        if existing is not client:
+            client.close()
+
+        return existing
+
+    @staticmethod
+    def _get_delete(kind: ResourceKind, client: Client) -> Callable[[str], Response]:
+        match kind:
+            case ResourceKind.USER:
+                return PrivateUsersClient(client=client).delete_user_api
+            case ResourceKind.FILE:
+                return FilesClient(client=client).delete_file_api
+            case ResourceKind.COURSE:
+                return CoursesClient(client=client).delete_course_api
+            case ResourceKind.EXERCISE:
+                return ExercisesClient(client=client).delete_exercise_api
+
+
+def _login_without_password(owner: str) -> TokenSchema:
+    raise LookupError(f"The refresh token of {owner} is rejected and the password is not known")
+
+
+def cache_owner_tokens() -> list[str]:
+    """
+    Makes sure every user created by the current process has a token in the token cache,
+    logging in the users that never did.
+
+    Passwords are not journaled, so this lets another process (the pytest-xdist controller)
+    delete the entities of the users with their cached tokens.
+
+    :return: Emails of the users that could not log in.
+    """
+    failed = []
+    with detached_allure_context():
+        for email in get_remembered_emails():
+            user = AuthenticationUserSchema(email=email, password=get_password(email))
+            try:
+                get_token_cache().get_or_login(email, partial(login_user, user))
+            except Exception as error:
+                logger.error("Unable to log in as %s: %s", email, error)
+                failed.append(email)
+
+    return failed
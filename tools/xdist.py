@@ -0,0 +1,8 @@
+import os
+
+
+def get_worker_id() -> str:
+    """
+    :return: pytest-xdist worker ID of the current process (e.g., "gw0"), "main" without xdist.
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER", "main")